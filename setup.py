@@ -12,7 +12,14 @@ setup(
     include_package_data=True,
     packages=find_packages("src"),
     package_dir={"": "src"},
-    entry_points={ "console_scripts": ["plethora = arcade.plethoraAPI:main"], },
+    entry_points={ "console_scripts": [
+        "plethora = arcade.plethoraAPI:main",
+        "plethora-bench = arcade.plethoraBench:main",
+        "plethora-host = arcade.plethoraHost:main",
+        "plethora-perfdiff = arcade.plethoraPerfdiff:main",
+        "plethora-importtime = arcade.plethoraImporttime:main",
+        "plethora-suite = arcade.plethoraSuite:main",
+    ], },
     install_requires=[ "pygame", ],
 )
 
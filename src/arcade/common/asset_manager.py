@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import collections
+import threading
+from typing import Optional, Tuple
+
+import pygame
+
+# default memory budget for cached surfaces: 64 MiB
+DEFAULT_BUDGET = 64 * 2 ** 20
+
+
+class AssetManager():
+    """Process-wide cache of loaded, scaled and display-converted images.
+
+    Images are keyed by ``(path, size, alpha)`` and shared between everyone who asks for them, so
+    the returned surfaces must be treated as immutable: blit them, but ``copy()`` one before
+    drawing on it or changing its alpha/colorkey. When the cached surfaces exceed the memory
+    budget, the least recently used ones are dropped.
+
+    """
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        """Create an asset manager.
+
+        :param int budget: Memory budget in bytes for the cached surfaces.
+        :return The newly instantiated asset manager.
+        :rtype: AssetManager
+        """
+        self.budget = budget
+        self.cache = collections.OrderedDict()
+        self.converted = set()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def load_image(self, path, size: Optional[Tuple[int, int]] = None, alpha: bool = True) -> pygame.Surface:
+        """Get an image, loading (and scaling and converting) it on first use.
+
+        Surfaces are converted to the display's pixel format (``convert_alpha()``, or ``convert()``
+        if ``alpha`` is False) as soon as a display mode is set, which makes blitting them much
+        faster.
+
+        :param path: Path to the image file.
+        :param size: Size to scale the image to, or None to keep its size.
+        :type size: (int, int)
+        :param bool alpha: Keep per-pixel alpha when converting.
+        :return The shared surface; do not modify it.
+        :rtype: pygame.Surface
+        """
+        key = (str(path), tuple(size) if size else None, alpha)
+        with self.lock:
+            surf = self.cache.get(key)
+            if surf is not None:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                if key not in self.converted and pygame.display.get_surface() is not None:
+                    # loaded before the display existed; convert now
+                    self._store(key, self._convert(surf, alpha))
+                    return self.cache[key]
+                return surf
+            self.misses += 1
+            surf = pygame.image.load(key[0])
+            if size:
+                surf = pygame.transform.scale(surf, key[1])
+            if pygame.display.get_surface() is not None:
+                surf = self._convert(surf, alpha)
+            self._store(key, surf)
+            return surf
+
+    def _convert(self, surf: pygame.Surface, alpha: bool) -> pygame.Surface:
+        return surf.convert_alpha() if alpha else surf.convert()
+
+    def _store(self, key: tuple, surf: pygame.Surface) -> None:
+        old = self.cache.pop(key, None)
+        if old is not None:
+            self.bytes -= surface_bytes(old)
+        self.cache[key] = surf
+        self.bytes += surface_bytes(surf)
+        if pygame.display.get_surface() is not None:
+            self.converted.add(key)
+        # evict least recently used surfaces, but never the one just stored
+        while self.bytes > self.budget and len(self.cache) > 1:
+            old_key, old = self.cache.popitem(last=False)
+            self.converted.discard(old_key)
+            self.bytes -= surface_bytes(old)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached surfaces (eg after the display format changed).
+
+        :rtype: None
+        """
+        with self.lock:
+            self.cache.clear()
+            self.converted.clear()
+            self.bytes = 0
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    """Get the memory used by a surface's pixels.
+
+    :param pygame.Surface surf: The surface.
+    :rtype: int
+    """
+    return surf.get_pitch() * surf.get_height()
+
+
+# the process-wide asset manager used by :func:`load_image`
+ASSETS = AssetManager()
+
+
+def load_image(path, size: Optional[Tuple[int, int]] = None, alpha: bool = True) -> pygame.Surface:
+    """Get an image from the process-wide asset manager (see :func:`AssetManager.load_image`).
+
+    :param path: Path to the image file.
+    :param size: Size to scale the image to, or None to keep its size.
+    :type size: (int, int)
+    :param bool alpha: Keep per-pixel alpha when converting.
+    :return The shared surface; do not modify it.
+    :rtype: pygame.Surface
+    """
+    return ASSETS.load_image(path, size, alpha)
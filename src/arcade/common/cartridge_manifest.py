@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import hashlib
+import importlib
+import json
+import os
+import pathlib
+from typing import Dict, Optional, Tuple
+
+# bump when the layout of a manifest entry changes so stale caches are rebuilt
+MANIFEST_VERSION = 1
+
+
+def get_cache_path() -> pathlib.Path:
+    """Get the path of the cached manifest.
+
+    The cache lives in ``$PLETHORA_CACHE`` if set, else in ``~/.cache/plethora``.
+
+    :return Path to the manifest JSON file.
+    :rtype: pathlib.Path
+    """
+    cache_dir = os.environ.get("PLETHORA_CACHE")
+    if cache_dir:
+        return pathlib.Path(cache_dir)/"manifest.json"
+    return pathlib.Path.home()/".cache"/"plethora"/"manifest.json"
+
+
+def fingerprint(path: pathlib.Path) -> str:
+    """Fingerprint a cartridge package from the path, size and mtime of each of its files.
+
+    Only the files are stat'ed, so this is cheap compared to importing the cartridge.
+
+    :param pathlib.Path path: Directory of the cartridge package.
+    :return Hex digest that changes whenever a file in the package (code or asset) changes.
+    :rtype: str
+    """
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(str(path)):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            stat = os.stat(os.path.join(root, name))
+            rel = os.path.relpath(os.path.join(root, name), str(path))
+            digest.update("{}:{}:{};".format(rel, stat.st_size, stat.st_mtime_ns).encode())
+    return digest.hexdigest()
+
+
+def read_manifest(cache_path: pathlib.Path) -> Dict[str, dict]:
+    """Read a cached manifest, ignoring a missing, corrupt or outdated cache.
+
+    :param pathlib.Path cache_path: Path to the manifest JSON file.
+    :return Manifest entries keyed by cartridge name (empty if there is no usable cache).
+    :rtype: dict
+    """
+    try:
+        with open(str(cache_path)) as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("cartridges", {})
+
+
+def write_manifest(cache_path: pathlib.Path, cartridges: Dict[str, dict]) -> None:
+    """Write the manifest cache; failing to write it is not fatal.
+
+    :param pathlib.Path cache_path: Path to the manifest JSON file.
+    :param dict cartridges: Manifest entries keyed by cartridge name.
+    :rtype: None
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(str(tmp_path), "w") as cache_file:
+            json.dump({"version": MANIFEST_VERSION, "cartridges": cartridges}, cache_file, indent=2, sort_keys=True)
+        os.replace(str(tmp_path), str(cache_path))
+    except OSError as error:
+        print("Warning: could not write cartridge manifest \"{}\": {}".format(cache_path, error))
+
+
+def build_entry(package: str, name: str, digest: str) -> dict:
+    """Build the manifest entry of a single cartridge.
+
+    Only the cartridge package (its ``__init__.py``) is imported to call ``get_name()``; the game
+    module itself is imported lazily by ``insert_cartridge()``.
+
+    :param str package: Package containing the cartridges (eg "arcade.games").
+    :param str name: Cartridge package name (eg "chess").
+    :param str digest: Fingerprint of the cartridge (see :func:`fingerprint`).
+    :return The manifest entry.
+    :rtype: dict
+    """
+    module = "{}.{}".format(package, name)
+    return {
+        "name": name,
+        "module": module,
+        "display_name": importlib.import_module(module).get_name(),
+        "fingerprint": digest,
+    }
+
+
+def load_manifest(games_dir: pathlib.Path, package: str,
+        cache_path: Optional[pathlib.Path] = None) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
+    """Load the cartridge manifest, rebuilding only the entries whose fingerprint changed.
+
+    :param pathlib.Path games_dir: Directory containing the cartridge packages.
+    :param str package: Package containing the cartridges (eg "arcade.games").
+    :param pathlib.Path cache_path: Path to the manifest JSON file (default: :func:`get_cache_path`).
+    :return ``(cartridges, errors)``: manifest entries and the errors of cartridges that failed
+        to load, both keyed by cartridge name.
+    :rtype: (dict, dict)
+    """
+    if cache_path is None:
+        cache_path = get_cache_path()
+    cached = read_manifest(cache_path)
+    cartridges = {}
+    errors = {}
+    for path in sorted(games_dir.iterdir()):
+        if not (path/"__init__.py").is_file():
+            continue
+        name = path.name
+        digest = fingerprint(path)
+        entry = cached.get(name)
+        if entry is None or entry.get("fingerprint") != digest:
+            try:
+                entry = build_entry(package, name, digest)
+            except Exception as error:
+                errors[name] = error
+                continue
+        cartridges[name] = entry
+    if cartridges != cached:
+        write_manifest(cache_path, cartridges)
+    return cartridges, errors
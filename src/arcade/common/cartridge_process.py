@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+# pygame is only imported inside the functions: in the child, the SDL drivers have to be chosen
+# before pygame is first imported
+
+# pixel format of the shared framebuffer (see :func:`pygame.image.frombuffer`)
+FRAME_FORMAT = "RGBX"
+
+# seconds to wait for a cartridge to start, and for it to exit before it is killed
+START_TIMEOUT = 20.0
+EXIT_TIMEOUT = 1.0
+
+
+def run_cartridge(package: str, name: str, conn, seed: Optional[int] = None) -> None:
+    """Run a cartridge in this (child) process; the target of :class:`CartridgeProcess`.
+
+    The game renders straight into a :class:`multiprocessing.shared_memory.SharedMemory`
+    framebuffer. Messages sent to the parent over ``conn``:
+
+    - ``("ready", shm_name, size, fps, scale, smooth)`` once the game is created
+    - ``("frame", rects)`` after each render (``rects`` in game coordinates, or None if the whole
+      frame changed); the game does not render again until the parent sends ``("ack",)``, so the
+      parent never reads a half-drawn frame
+    - ``("exit",)`` when the game exits, ``("error", text)`` if it raised
+
+    Messages received: ``("events", [serialized events])``, ``("ack",)`` and ``("exit",)``.
+
+    :param str package: Package containing the cartridges (eg "arcade.games").
+    :param str name: Cartridge name (eg "multiSnake").
+    :param conn: This end of a :func:`multiprocessing.Pipe`.
+    :param int seed: Seed for :mod:`random`, or None.
+    :rtype: None
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import importlib
+    import random
+    import pygame
+    from arcade import plethoraAPI
+    from arcade.common.input_recorder import event_from_dict
+    from arcade.common.compute_pool import COMPUTE
+
+    shm = None
+    frame = None
+    shared = False      # whether the launcher got the framebuffer's name (it then unlinks it)
+    try:
+        # games may convert() surfaces, which needs a display mode
+        pygame.display.set_mode((1, 1))
+        if seed is not None:
+            random.seed(seed)
+        game = importlib.import_module("{}.{}".format(package, name)).insert_cartridge()
+        size = game.rect.size
+        shm = shared_memory.SharedMemory(create=True, size=max(size[0] * size[1] * 4, 1))
+        frame = pygame.image.frombuffer(shm.buf, size, FRAME_FORMAT)
+        frame.fill((0, 0, 0))
+        exited = []
+        clock = pygame.time.Clock()
+        game.register(frame, clock, lambda: exited.append(True))
+        conn.send(("ready", shm.name, size, game.fps, game.scale, game.smooth))
+        shared = True
+
+        dirty = True
+        can_render = True
+        tick_last = time.perf_counter()
+        tick_accum = 0.0
+        while not exited:
+            while conn.poll():
+                message = conn.recv()
+                if message[0] == "events":
+                    dirty |= bool(game.onevents([event_from_dict(data) for data in message[1]]))
+                elif message[0] == "ack":
+                    can_render = True
+                elif message[0] == "exit":
+                    game.onexit(False)
+                    exited.append(True)
+                    break
+            if exited:
+                break
+            if game.tickrate:
+                now = time.perf_counter()
+                tick_accum += now - tick_last
+                tick_last = now
+                step = 1 / game.tickrate
+                ticks = 0
+                while tick_accum >= step and not exited:
+                    if ticks == plethoraAPI.MAX_CATCHUP_TICKS:
+                        tick_accum %= step
+                        break
+                    dirty |= bool(game.onupdate(step))
+                    tick_accum -= step
+                    ticks += 1
+            if game.render_at is not None and time.perf_counter() >= game.render_at:
+                game.render_at = None
+                dirty = True
+            if game.compute:
+                game.compute = set(future for future in game.compute if not future.done())
+                dirty = True
+            if dirty and can_render and not exited:
+                dirty, rects = plethoraAPI.split_render_result(game.onrender())
+                if rects is not None:
+                    rects = [tuple(pygame.Rect(rect)) for rect in rects]
+                conn.send(("frame", rects))
+                can_render = False
+            clock.tick(game.fps)
+        conn.send(("exit",))
+    except (EOFError, BrokenPipeError):
+        # the launcher went away
+        pass
+    except Exception:
+        try:
+            conn.send(("error", traceback.format_exc()))
+        except (EOFError, BrokenPipeError):
+            pass
+    finally:
+        COMPUTE.shutdown()
+        if shm is not None:
+            frame = None
+            try:
+                shm.close()
+            except BufferError:
+                # the game still holds surfaces of the framebuffer; the process is exiting anyway
+                pass
+            if not shared:
+                shm.unlink()
+
+
+class CartridgeProcess():
+    """The launcher's end of a cartridge running in a child process (see :func:`run_cartridge`).
+
+    """
+    def __init__(self, package: str, name: str, seed: Optional[int] = None):
+        """Spawn the child process and wait until its game is created.
+
+        :param str package: Package containing the cartridges (eg "arcade.games").
+        :param str name: Cartridge name (eg "multiSnake").
+        :param int seed: Seed for :mod:`random` in the child, or None.
+        :return The newly instantiated cartridge process.
+        :rtype: CartridgeProcess
+        :raises RuntimeError: if the game could not be started.
+        """
+        import pygame
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=run_cartridge, args=(package, name, child_conn, seed),
+                name="plethora-{}".format(name), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.shm = None
+        self.frame = None
+        try:
+            message = self.conn.recv() if self.conn.poll(START_TIMEOUT) else ("error", "timed out")
+        except EOFError:
+            message = ("error", "the process exited with code {}".format(self.process.exitcode))
+        if message[0] != "ready":
+            self.kill()
+            raise RuntimeError("\"{}\" failed to start in a child process: {}".format(name, message[-1]))
+        _, shm_name, self.size, self.fps, self.scale, self.smooth = message
+        self.shm = shared_memory.SharedMemory(name=shm_name)
+        # a surface backed by the shared memory itself, so frames are never copied between processes
+        self.frame = pygame.image.frombuffer(self.shm.buf, self.size, FRAME_FORMAT)
+
+    def send_events(self, events: List["pygame.event.Event"]) -> None:
+        """Forward events (mouse positions in game coordinates) to the game.
+
+        :param list events: The events.
+        :rtype: None
+        """
+        from arcade.common.input_recorder import event_to_dict
+        self.send(("events", [event_to_dict(event, 0) for event in events]))
+
+    def send(self, message: tuple) -> None:
+        try:
+            self.conn.send(message)
+        except (OSError, EOFError):
+            pass
+
+    def poll(self) -> Tuple[bool, Optional[list], Optional[str]]:
+        """Handle the messages the child sent since the last call.
+
+        :return ``(framed, rects, exit)``: whether a new frame is in :attr:`frame` (acknowledge it
+            with :func:`ack` once it has been blitted), the rects that changed (None if the whole
+            frame did) and, if the game is gone, why ("exit", a traceback, or "died").
+        :rtype: (bool, list, str)
+        """
+        framed = False
+        rects = []
+        try:
+            while self.conn.poll():
+                message = self.conn.recv()
+                if message[0] == "frame":
+                    framed = True
+                    if message[1] is None or rects is None:
+                        rects = None
+                    else:
+                        rects.extend(message[1])
+                elif message[0] == "exit":
+                    return framed, rects, "exit"
+                elif message[0] == "error":
+                    return framed, rects, message[1]
+        except (OSError, EOFError):
+            return framed, rects, "died"
+        if not self.process.is_alive():
+            return framed, rects, "died"
+        return framed, rects, None
+
+    def ack(self) -> None:
+        """Let the game render its next frame.
+
+        :rtype: None
+        """
+        self.send(("ack",))
+
+    def kill(self) -> None:
+        """Ask the game to exit; kill the child if it does not within :data:`EXIT_TIMEOUT`.
+
+        :rtype: None
+        """
+        if self.process.is_alive():
+            self.send(("exit",))
+            self.process.join(EXIT_TIMEOUT)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.frame = None
+        if self.shm is not None:
+            # the child only closes the framebuffer, so that it is unlinked (and unregistered from
+            # the resource tracker) exactly once, even if the child was killed
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+        self.conn.close()
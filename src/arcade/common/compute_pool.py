@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Optional
+
+
+def default_workers() -> int:
+    """Get the default number of worker processes: one per core, minus the core the launcher's
+    main loop runs on.
+
+    :rtype: int
+    """
+    return max((os.cpu_count() or 1) - 1, 1)
+
+
+def _noop() -> None:
+    pass
+
+
+class ComputePool():
+    """Process pool for CPU-bound pure-Python work (move search, solvers, odds) that would hold the
+    GIL and stall frames if it ran on a thread of the launcher.
+
+    The :class:`concurrent.futures.ProcessPoolExecutor` is created on first use (or by
+    :func:`warm`) and shared by every game. Workers are started with the "spawn" method, so they
+    do not inherit SDL's state: submitted functions must be defined at module level and their
+    arguments and results must be picklable.
+
+    """
+    def __init__(self, workers: Optional[int] = None):
+        """Create a compute pool; no process starts until it is used.
+
+        :param int workers: Number of worker processes, or None for :func:`default_workers`.
+        :return The newly instantiated compute pool.
+        :rtype: ComputePool
+        """
+        self.workers = workers or default_workers()
+        self.executor = None
+        self.pending = set()
+        self.submitted = 0
+        self.lock = threading.Lock()
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        """Get the executor, creating it on first use.
+
+        :rtype: ProcessPoolExecutor
+        """
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.workers, multiprocessing.get_context("spawn"))
+            return self.executor
+
+    def warm(self) -> None:
+        """Start every worker process now rather than on the first submits; returns without
+        waiting for them to come up.
+
+        :rtype: None
+        """
+        executor = self.get_executor()
+        for _ in range(self.workers):
+            executor.submit(_noop)
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Run ``fn(*args)`` in a worker process.
+
+        :param Callable fn: A module-level function.
+        :param args: Picklable arguments.
+        :return The future of the result.
+        :rtype: Future
+        """
+        future = self.get_executor().submit(fn, *args)
+        with self.lock:
+            self.pending.add(future)
+            self.submitted += 1
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future) -> None:
+        with self.lock:
+            self.pending.discard(future)
+
+    def queue_depth(self) -> int:
+        """Get the number of submitted calls that have not finished (queued or running).
+
+        :rtype: int
+        """
+        return len(self.pending)
+
+    def shutdown(self) -> None:
+        """Cancel the calls that have not started and stop the worker processes; the pool starts
+        again on the next submit.
+
+        :rtype: None
+        """
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# the process-wide compute pool used by :func:`arcade.plethoraAPI.Game.submit`
+COMPUTE = ComputePool()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import json
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import List, Optional, Tuple
+
+import pygame
+
+CAPTURE_VERSION = 1
+
+# frames that can wait for the encoder; when all of them are taken, new frames are dropped
+DEFAULT_BUFFERS = 8
+
+# zlib level of the PNGs; low levels keep the encoder ahead of the game on one core
+PNG_LEVEL = 1
+
+FORMATS = ("png", "raw")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    """Build a PNG chunk.
+
+    :param bytes kind: Chunk type (eg b"IDAT").
+    :param bytes data: Chunk data.
+    :rtype: bytes
+    """
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)))
+
+
+def encode_png(pixels: bytes, size: Tuple[int, int], level: int = PNG_LEVEL) -> bytes:
+    """Encode RGB pixels as a PNG.
+
+    Unlike :func:`pygame.image.save`, the compression runs in :func:`zlib.compress`, which releases
+    the GIL, so encoding on a thread does not hold up the main loop.
+
+    :param bytes pixels: Rows of RGB pixels, top to bottom (see :func:`pygame.image.tobytes`).
+    :param tuple size: Width and height in pixels.
+    :param int level: zlib compression level.
+    :rtype: bytes
+    """
+    width, height = size
+    stride = width * 3
+    view = memoryview(pixels)
+    # every scanline starts with its filter type; 0 is none
+    scanlines = b"".join(b"\x00" + view[row:row + stride] for row in range(0, stride * height, stride))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return PNG_SIGNATURE + png_chunk(b"IHDR", header) + png_chunk(b"IDAT", zlib.compress(scanlines, level)) + png_chunk(b"IEND", b"")
+
+
+class FrameCapture():
+    """Captures the frames the launcher presents and encodes them on a worker thread.
+
+    The display is copied into a ring of preallocated surfaces on the main thread, which costs a
+    blit; converting and compressing them happens on the worker. If the worker falls behind and
+    every surface of the ring is waiting to be encoded, frames are dropped (and counted) rather
+    than stalling the game.
+
+    A session is written to ``{game}-{time}`` in the capture directory: as a directory of numbered
+    PNGs in the "png" format, or as a ``.rgb`` file of raw RGB24 frames in the "raw" format. Both
+    come with a ``.json`` index of the frame size and the time each frame was presented, since
+    the launcher only presents frames that changed.
+
+    """
+    def __init__(self, capture_dir: str, fmt: str = "png", buffers: int = DEFAULT_BUFFERS):
+        """Create a frame capture; nothing is captured until :func:`begin`.
+
+        :param str capture_dir: Directory to write the captures to.
+        :param str fmt: "png" or "raw".
+        :param int buffers: Frames that can wait for the encoder.
+        :return The newly instantiated frame capture.
+        :rtype: FrameCapture
+        :raises ValueError: if ``fmt`` is not a supported format.
+        """
+        if fmt not in FORMATS:
+            raise ValueError("unknown capture format \"{}\" (expected one of {})".format(fmt, ", ".join(FORMATS)))
+        self.capture_dir = capture_dir
+        self.format = fmt
+        self.buffers = max(buffers, 1)
+        self.game = None
+        self.path = None
+        self.size = None
+        self.ring: List[pygame.Surface] = []
+        self.free = queue.Queue()
+        self.ready = queue.Queue()
+        self.worker = None
+        self.error = None
+        self.started = None
+        self.times: List[float] = []
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+
+    def begin(self, game: str, size: Tuple[int, int]) -> None:
+        """Start capturing a session; ends the previous one.
+
+        :param str game: Cartridge name (eg "tetris").
+        :param tuple size: Size of the display, which every captured frame must have.
+        :rtype: None
+        """
+        self.end()
+        self.game = game
+        self.started = time.time()
+        self.path = os.path.join(self.capture_dir, "{}-{}".format(game, time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))))
+        if self.size != tuple(size):
+            self.size = tuple(size)
+            self.ring = [pygame.Surface(self.size) for _ in range(self.buffers)]
+        self.free = queue.Queue()
+        for slot in range(len(self.ring)):
+            self.free.put(slot)
+        self.ready = queue.Queue()
+        self.error = None
+        self.times = []
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+        self.worker = threading.Thread(target=self.encode, name="frame-capture", daemon=True)
+        self.worker.start()
+
+    def capture(self, display: pygame.Surface) -> bool:
+        """Queue a copy of the display for encoding; call right after it was presented.
+
+        :param pygame.Surface display: The display surface.
+        :return False if the frame was dropped.
+        :rtype: bool
+        """
+        if self.worker is None:
+            return False
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        if display.get_size() != self.size or self.error is not None:
+            self.free.put(slot)
+            self.dropped += 1
+            return False
+        self.ring[slot].blit(display, (0, 0))
+        self.ready.put((slot, self.captured, time.perf_counter()))
+        self.captured += 1
+        return True
+
+    def encode(self) -> None:
+        """Encode queued frames until :func:`end` queues None (runs on the worker thread).
+
+        :rtype: None
+        """
+        raw = None
+        try:
+            os.makedirs(self.path if self.format == "png" else self.capture_dir, exist_ok=True)
+            if self.format == "raw":
+                raw = open(self.path + ".rgb", "wb")
+            while True:
+                item = self.ready.get()
+                if item is None:
+                    break
+                slot, index, presented = item
+                try:
+                    pixels = pygame.image.tobytes(self.ring[slot], "RGB")
+                finally:
+                    self.free.put(slot)
+                if raw is not None:
+                    raw.write(pixels)
+                else:
+                    with open(os.path.join(self.path, "{:06d}.png".format(index)), "wb") as png:
+                        png.write(encode_png(pixels, self.size))
+                self.times.append(presented)
+                self.written += 1
+        except OSError as error:
+            self.error = error
+            # keep releasing slots so that the main thread only drops frames
+            while self.ready.get() is not None:
+                pass
+        finally:
+            if raw is not None:
+                raw.close()
+
+    def end(self) -> Optional[str]:
+        """Finish the session: wait for the queued frames to be encoded and write the index.
+
+        :return The path of the index, or None if nothing was captured.
+        :rtype: Optional[str]
+        :raises OSError: if the frames or the index could not be written.
+        """
+        if self.worker is None:
+            return None
+        worker, self.worker = self.worker, None
+        self.ready.put(None)
+        worker.join()
+        if self.error is not None:
+            raise self.error
+        if not self.written:
+            return None
+        start = self.times[0]
+        index = {
+            "version": CAPTURE_VERSION,
+            "game": self.game,
+            "created": self.started,
+            "format": self.format,
+            "size": list(self.size),
+            "pixel_format": "rgb24",
+            "frames": self.written,
+            "dropped": self.dropped,
+            "times": [round(t - start, 6) for t in self.times],
+        }
+        path = self.path + ".json"
+        with open(path, "w") as index_file:
+            json.dump(index, index_file)
+        return path
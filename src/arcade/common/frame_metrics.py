@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import bisect
+import collections
+import csv
+import json
+import sys
+import time
+from typing import Dict, List
+
+METRICS_VERSION = 2
+
+# metrics renamed since earlier versions, so that older exports still load
+RENAMED_METRICS = {"alloc_blocks": "net_blocks"}
+
+# upper bounds (ms) of the frame time and latency histogram buckets; the last bucket is open
+HISTOGRAM_EDGES_MS = (1, 2, 4, 8, 12, 16.7, 20, 25, 33.3, 50, 100, 250)
+
+# samples kept per distribution for percentiles
+MAX_SAMPLES = 100000
+
+# metrics in a summary besides "frames", and their fields, in CSV column order
+METRICS = ("frame_ms", "latency_ms", "net_blocks")
+SUMMARY_FIELDS = ("count", "mean", "p50", "p95", "p99", "max")
+
+
+class Distribution():
+    """Collects samples of one measurement: a histogram of all of them and the most recent
+    :data:`MAX_SAMPLES` for percentiles.
+
+    """
+    def __init__(self, edges=HISTOGRAM_EDGES_MS):
+        """Create an empty distribution.
+
+        :param tuple edges: Upper bounds of the histogram buckets.
+        :return The newly instantiated distribution.
+        :rtype: Distribution
+        """
+        self.edges = tuple(edges)
+        self.counts = [0] * (len(self.edges) + 1)
+        self.samples = collections.deque(maxlen=MAX_SAMPLES)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a sample.
+
+        :param float value: The sample.
+        :rtype: None
+        """
+        self.counts[bisect.bisect_left(self.edges, value)] += 1
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "Distribution") -> None:
+        """Add the samples of another distribution with the same edges (eg from a worker process).
+
+        :param Distribution other: The distribution to add.
+        :rtype: None
+        """
+        if other.edges != self.edges:
+            raise ValueError("cannot merge distributions with different histogram edges")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.samples.extend(other.samples)
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def summary(self, histogram: bool = True) -> dict:
+        """Summarize the distribution.
+
+        :param bool histogram: Include the histogram.
+        :return ``{"count", "mean", "p50", "p95", "p99", "max"[, "histogram"]}``
+        :rtype: dict
+        """
+        samples = sorted(self.samples)
+        summary = {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": percentile(samples, 50),
+            "p95": percentile(samples, 95),
+            "p99": percentile(samples, 99),
+            "max": self.max,
+        }
+        if histogram:
+            summary["histogram"] = {"edges": list(self.edges), "counts": list(self.counts)}
+        return summary
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Get the nearest-rank percentile of sorted samples.
+
+    :param list samples: Sorted samples.
+    :param float pct: Percentile in [0, 100].
+    :rtype: float
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(samples))))
+    return samples[min(rank, len(samples)) - 1]
+
+
+class FrameMetrics():
+    """Frame metrics of one cartridge: frame time, event-to-render latency and the net change of
+    Python memory blocks per frame.
+
+    Frame time is the work done in a frame, without waiting for events or sleeping to cap the
+    frame rate. Latency runs from the frame that delivered input to the game to the end of the
+    first frame after it in which the game rendered. Net blocks are the change of
+    :func:`sys.getallocatedblocks` over a frame: a positive mean shows memory growing from frame
+    to frame (eg caches or lists that are never trimmed). Objects allocated and freed within the
+    same frame cancel out, so it does not show churn; see ``PLETHORA_MEMPROFILE`` for that.
+
+    """
+    def __init__(self):
+        """Create empty frame metrics.
+
+        :return The newly instantiated frame metrics.
+        :rtype: FrameMetrics
+        """
+        self.frame_ms = Distribution()
+        self.latency_ms = Distribution()
+        self.net_blocks = Distribution(edges=(-1000, -100, -10, -1, 0, 10, 100, 1000, 10000))
+        self.frame_start = None
+        self.frame_blocks = 0
+        self.input_at = None
+
+    def begin_frame(self) -> None:
+        """Start a frame; call once the launcher stops waiting for events.
+
+        :rtype: None
+        """
+        self.frame_start = time.perf_counter()
+        self.frame_blocks = sys.getallocatedblocks()
+
+    def input(self) -> None:
+        """Mark that this frame delivered input to the game.
+
+        :rtype: None
+        """
+        if self.input_at is None:
+            self.input_at = self.frame_start
+
+    def end_frame(self, rendered: bool) -> None:
+        """End the frame started by :func:`begin_frame`.
+
+        :param bool rendered: Whether the game rendered this frame.
+        :rtype: None
+        """
+        if self.frame_start is None:
+            return
+        now = time.perf_counter()
+        self.frame_ms.add((now - self.frame_start) * 1000)
+        self.net_blocks.add(sys.getallocatedblocks() - self.frame_blocks)
+        if rendered and self.input_at is not None:
+            self.latency_ms.add((now - self.input_at) * 1000)
+            self.input_at = None
+        self.frame_start = None
+
+    def merge(self, other: "FrameMetrics") -> None:
+        """Add the frames of another cartridge's metrics.
+
+        :param FrameMetrics other: The metrics to add.
+        :rtype: None
+        """
+        self.frame_ms.merge(other.frame_ms)
+        self.latency_ms.merge(other.latency_ms)
+        self.net_blocks.merge(other.net_blocks)
+
+    def summary(self) -> dict:
+        """Summarize the metrics.
+
+        :return ``{"frames", "frame_ms", "latency_ms", "net_blocks"}``
+        :rtype: dict
+        """
+        return {
+            "frames": self.frame_ms.count,
+            "frame_ms": self.frame_ms.summary(),
+            "latency_ms": self.latency_ms.summary(),
+            "net_blocks": self.net_blocks.summary(),
+        }
+
+
+class MetricsLog():
+    """Frame metrics of several cartridges, exported with :func:`write`.
+
+    """
+    def __init__(self):
+        """Create an empty metrics log.
+
+        :return The newly instantiated metrics log.
+        :rtype: MetricsLog
+        """
+        self.cartridges: Dict[str, FrameMetrics] = {}
+
+    def get(self, game: str) -> FrameMetrics:
+        """Get the metrics of a cartridge, creating them on first use.
+
+        :param str game: Cartridge name (eg "chess").
+        :rtype: FrameMetrics
+        """
+        metrics = self.cartridges.get(game)
+        if metrics is None:
+            metrics = self.cartridges[game] = FrameMetrics()
+        return metrics
+
+    def merge(self, other: "MetricsLog") -> None:
+        """Add the metrics of another log (eg from a worker process).
+
+        :param MetricsLog other: The log to add.
+        :rtype: None
+        """
+        for game, metrics in other.cartridges.items():
+            self.get(game).merge(metrics)
+
+    def summary(self) -> Dict[str, dict]:
+        """Summarize the metrics of every cartridge that ran at least one frame.
+
+        :rtype: Dict[str, dict]
+        """
+        return dict((game, metrics.summary()) for game, metrics in sorted(self.cartridges.items()) if metrics.frame_ms.count)
+
+    def write(self, path: str) -> None:
+        """Write the summaries (see :func:`write_metrics`).
+
+        :param str path: File to write; CSV if it ends in ".csv", else JSON.
+        :rtype: None
+        """
+        write_metrics(path, self.summary())
+
+
+def write_metrics(path: str, cartridges: Dict[str, dict]) -> None:
+    """Write cartridge metric summaries as JSON, or as CSV (one row per cartridge, without the
+    histograms) if ``path`` ends in ".csv".
+
+    :param str path: File to write.
+    :param dict cartridges: Summaries (see :func:`FrameMetrics.summary`) keyed by cartridge name.
+    :rtype: None
+    """
+    if str(path).endswith(".csv"):
+        with open(path, "w", newline="") as metrics_file:
+            writer = csv.writer(metrics_file)
+            writer.writerow(["game", "frames"] + ["{}_{}".format(metric, field) for metric in METRICS for field in SUMMARY_FIELDS])
+            for game, summary in cartridges.items():
+                writer.writerow([game, summary["frames"]] + [summary[metric][field] for metric in METRICS for field in SUMMARY_FIELDS])
+        return
+    with open(path, "w") as metrics_file:
+        json.dump({"version": METRICS_VERSION, "created": time.time(), "cartridges": cartridges}, metrics_file, indent=2)
+
+
+def load_metrics(path: str) -> Dict[str, dict]:
+    """Load cartridge metric summaries written by :func:`write_metrics`.
+
+    :param str path: JSON or CSV file.
+    :return Summaries keyed by cartridge name.
+    :rtype: Dict[str, dict]
+    :raises ValueError: if the file is not a metrics file of a supported version.
+    """
+    if str(path).endswith(".csv"):
+        cartridges = {}
+        with open(path, newline="") as metrics_file:
+            for row in csv.DictReader(metrics_file):
+                summary = {"frames": int(row["frames"])}
+                for metric in METRICS:
+                    columns = [old for old, new in RENAMED_METRICS.items() if new == metric and "{}_count".format(old) in row]
+                    name = columns[0] if columns else metric
+                    summary[metric] = dict((field, float(row["{}_{}".format(name, field)])) for field in SUMMARY_FIELDS)
+                cartridges[row["game"]] = summary
+        return cartridges
+    with open(path) as metrics_file:
+        data = json.load(metrics_file)
+    if not isinstance(data, dict) or data.get("version") not in range(1, METRICS_VERSION + 1):
+        raise ValueError("\"{}\" is not a version {} metrics file".format(path, METRICS_VERSION))
+    cartridges = data["cartridges"]
+    for summary in cartridges.values():
+        for old, new in RENAMED_METRICS.items():
+            if old in summary:
+                summary[new] = summary.pop(old)
+    return cartridges
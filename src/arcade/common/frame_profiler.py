@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import collections
+import time
+from typing import Deque, Dict, List, Optional
+
+import pygame
+
+
+class FrameProfiler():
+    """Records how long each phase of a frame takes over a rolling window of frames.
+
+    Phases are timed lap-style: :func:`mark` attributes the time since the previous mark (or since
+    :func:`begin_frame`) to a phase, so instrumenting a loop costs one clock read per phase.
+    Values that are not durations (eg a queue depth) are recorded per frame with :func:`gauge`.
+
+    """
+    def __init__(self, window: int = 120):
+        """Create a profiler.
+
+        :param int window: Number of most recent frames to keep.
+        :return The newly instantiated profiler.
+        :rtype: FrameProfiler
+        """
+        self.window = window
+        self.frames: Deque[Dict[str, float]] = collections.deque(maxlen=window)
+        self.current: Dict[str, float] = {}
+        self.gauge_frames: Deque[Dict[str, float]] = collections.deque(maxlen=window)
+        self.current_gauges: Dict[str, float] = {}
+        self.last_mark = time.perf_counter()
+        self.frame_start = self.last_mark
+        self.overlay = None
+        self.overlay_age = 0
+
+    def begin_frame(self) -> None:
+        """Start timing a new frame.
+
+        :rtype: None
+        """
+        self.current = {}
+        self.current_gauges = {}
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Attribute the time since the previous mark to ``phase`` (accumulated within a frame).
+
+        :param str phase: Name of the phase that just finished.
+        :rtype: None
+        """
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + now - self.last_mark
+        self.last_mark = now
+
+    def gauge(self, name: str, value: float) -> None:
+        """Record the value of ``name`` for this frame.
+
+        :param str name: Name of the gauge (eg "compute_queue").
+        :param float value: Its value.
+        :rtype: None
+        """
+        self.current_gauges[name] = value
+
+    def end_frame(self) -> None:
+        """Finish the frame and push its phase durations (and ``"total"``) and gauges onto the window.
+
+        :rtype: None
+        """
+        self.current["total"] = time.perf_counter() - self.frame_start
+        self.frames.append(self.current)
+        self.gauge_frames.append(self.current_gauges)
+        self.current = {}
+        self.current_gauges = {}
+
+    def phases(self) -> List[str]:
+        """Get the names of all phases seen in the window, in the order they were first seen.
+
+        :rtype: list
+        """
+        names: Dict[str, None] = {}
+        for frame in self.frames:
+            names.update(dict.fromkeys(frame))
+        return list(names)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Summarize the window.
+
+        :return ``{phase: {"mean_ms", "max_ms", "last_ms"}}``; a phase missing from a frame counts
+            as 0 ms for that frame.
+        :rtype: dict
+        """
+        summary = {}
+        count = len(self.frames)
+        for phase in self.phases():
+            samples = [frame.get(phase, 0.0) for frame in self.frames]
+            summary[phase] = {
+                "mean_ms": sum(samples) / count * 1000,
+                "max_ms": max(samples) * 1000,
+                "last_ms": samples[-1] * 1000,
+            }
+        return summary
+
+    def gauges(self) -> Dict[str, Dict[str, float]]:
+        """Summarize the gauges over the window.
+
+        :return ``{gauge: {"mean", "max", "last"}}``; a gauge missing from a frame counts as 0 for
+            that frame.
+        :rtype: dict
+        """
+        names: Dict[str, None] = {}
+        for frame in self.gauge_frames:
+            names.update(dict.fromkeys(frame))
+        summary = {}
+        count = len(self.gauge_frames)
+        for name in names:
+            samples = [frame.get(name, 0.0) for frame in self.gauge_frames]
+            summary[name] = {"mean": sum(samples) / count, "max": max(samples), "last": samples[-1]}
+        return summary
+
+    def render_overlay(self, font: pygame.font.Font, every: int = 10,
+            color: tuple = (255, 255, 255), background: tuple = (0, 0, 0)) -> Optional[pygame.Surface]:
+        """Render the mean and max of each phase (and gauge) as a small table.
+
+        The text is only re-rendered every ``every`` calls; in between the cached surface is returned.
+
+        :param pygame.font.Font font: Font to render with.
+        :param int every: Re-render every this many calls.
+        :param tuple color: Text color.
+        :param tuple background: Background color.
+        :return The overlay surface, or None if no frame has been recorded yet.
+        :rtype: pygame.Surface
+        """
+        if not self.frames:
+            return None
+        self.overlay_age -= 1
+        if self.overlay is not None and self.overlay_age > 0:
+            return self.overlay
+        self.overlay_age = every
+        lines = [font.render("{:<12}{:>7.2f}{:>7.2f}".format(phase, s["mean_ms"], s["max_ms"]), True, color, background)
+                for phase, s in self.stats().items()]
+        lines += [font.render("{:<12}{:>7.1f}{:>7g}".format(name, s["mean"], s["max"]), True, color, background)
+                for name, s in self.gauges().items()]
+        width = max(line.get_width() for line in lines)
+        height = sum(line.get_height() for line in lines)
+        self.overlay = pygame.Surface((width + 4, height + 4))
+        self.overlay.fill(background)
+        y = 2
+        for line in lines:
+            self.overlay.blit(line, (2, y))
+            y += line.get_height()
+        return self.overlay
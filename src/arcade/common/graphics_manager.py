@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import pygame
+from typing import Optional, Tuple
 
 class Graphic():
     """General class for a static PyGame graphic.
@@ -159,6 +160,30 @@ class Animation():
         else:
             return False
 
+    def get_position(self) -> Tuple[int, int, int, bool]:
+        """Get how far the Animation has progressed (see :func:`set_position`).
+
+        :return Index of the next frame, index of the frame shown, frames left to show it and whether
+            the final frame was reached.
+        :rtype: (int, int, int, bool)
+        """
+        shown = self.animation.index(self.__current_frame__) if self.__current_frame__ else 0
+        return self.__current_index__, shown, self.__current_duration__, self.__final_frame__
+
+    def set_position(self, position:Tuple[int, int, int, bool]) -> None:
+        """Return the Animation to a position returned by :func:`get_position`.
+
+        :param position: Position of the Animation.
+        :type position: (int, int, int, bool)
+        :rtype: None
+        """
+        index, shown, duration, final = position
+        self.__current_index__ = index
+        if self.animation:
+            self.__current_frame__ = self.animation[shown]
+        self.__current_duration__ = duration
+        self.__final_frame__ = final
+
     def copy(self) -> object:
         """Deep copy the Animation.
 
@@ -235,6 +260,40 @@ class AnimatedEntity(pygame.sprite.Sprite, Graphic):
         else:
             self.current_animation = list()
 
+    def get_progress(self) -> Tuple[str, bool, Optional[str], Optional[Tuple[int, int, int, bool]]]:
+        """Get the state of the Animated Entity and how far its current animation has progressed (see
+        :func:`set_progress`).
+
+        :return State, whether it is animating, name of the current animation (or None) and its
+            position (see :func:`Animation.get_position`).
+        :rtype: (str, bool, str, (int, int, int, bool))
+        """
+        animation = getattr(self, 'current_animation', None)
+        for name, candidate in self.animations.items():
+            if candidate is animation:
+                return self.state, self.animating, name, animation.get_position()
+        return self.state, self.animating, None, None
+
+    def set_progress(self, state:str, animating:bool, animation:Optional[str], position:Optional[Tuple[int, int, int, bool]]) -> None:
+        """Return the Animated Entity to a state returned by :func:`get_progress`.
+
+        Expects an entity that has not animated yet (eg newly created), which still shows its neutral image.
+
+        :param str state: State name.
+        :param bool animating: Whether it is animating.
+        :param str animation: Name of the current animation, or None.
+        :param position: Position of the current animation.
+        :type position: (int, int, int, bool)
+        :rtype: None
+        """
+        if animation is not None:
+            self.set_state(animation)
+            self.current_animation.set_position(position)
+            if state != 'neutral':
+                self.image = self.current_animation.get_current_frame()
+        self.state = state
+        self.animating = animating
+
     def death(self) -> None:
         """Kill or destroy the Animated Entity.
 
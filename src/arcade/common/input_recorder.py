@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import json
+import time
+from typing import Dict, List
+
+import pygame
+
+RECORDING_VERSION = 1
+
+# event types stored by name so recordings stay readable (and hand-writable, see plethoraBench)
+EVENT_NAMES = dict((getattr(pygame, name), name) for name in (
+    "QUIT", "ACTIVEEVENT", "KEYDOWN", "KEYUP", "TEXTINPUT", "TEXTEDITING",
+    "MOUSEMOTION", "MOUSEBUTTONDOWN", "MOUSEBUTTONUP", "MOUSEWHEEL",
+    "JOYAXISMOTION", "JOYBALLMOTION", "JOYHATMOTION", "JOYBUTTONDOWN", "JOYBUTTONUP",
+    "VIDEORESIZE", "VIDEOEXPOSE", "USEREVENT",
+) if hasattr(pygame, name))
+
+# event attributes (besides the type) whose value may be written as the name of a pygame constant
+CONSTANT_ATTRS = ("key", "mod", "button")
+
+
+def event_to_dict(event: pygame.event.Event, frame: int) -> dict:
+    """Serialize an event; attributes that JSON cannot represent are dropped.
+
+    :param pygame.event.Event event: The event.
+    :param int frame: Frame the event was delivered on.
+    :return ``{"frame": ..., "type": ..., **attributes}``
+    :rtype: dict
+    """
+    data = {"frame": frame, "type": EVENT_NAMES.get(event.type, event.type)}
+    for key, value in event.dict.items():
+        if isinstance(value, (tuple, list)):
+            value = list(value)
+            if not all(isinstance(v, (int, float)) for v in value):
+                continue
+        elif value is not None and not isinstance(value, (int, float, str, bool)):
+            continue
+        data[key] = value
+    return data
+
+
+def event_value(value, constant: bool = False):
+    """Deserialize an event attribute: lists become tuples and, for attributes that hold a pygame
+    constant (see :data:`CONSTANT_ATTRS`), strings naming one (eg "K_SPACE") become its value.
+    Other strings (eg the text of a TEXTINPUT) are kept as they are.
+
+    :param value: The serialized value.
+    :param bool constant: Whether the attribute holds a pygame constant.
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    if constant and isinstance(value, str) and isinstance(getattr(pygame, value, None), int):
+        return getattr(pygame, value)
+    return value
+
+
+def event_from_dict(data: dict) -> pygame.event.Event:
+    """Deserialize an event (the inverse of :func:`event_to_dict`, ignoring ``"frame"``).
+
+    :param dict data: The serialized event.
+    :rtype: pygame.event.Event
+    """
+    attrs = dict((key, event_value(value, key in CONSTANT_ATTRS)) for key, value in data.items() if key not in ("frame", "type"))
+    return pygame.event.Event(event_value(data["type"], True), attrs)
+
+
+def events_by_frame(raw_events: List[dict]) -> Dict[int, List[pygame.event.Event]]:
+    """Deserialize a list of events, grouping them by frame.
+
+    :param list raw_events: Serialized events, each with a ``"frame"``.
+    :return Events keyed by frame.
+    :rtype: dict
+    """
+    events = {}
+    for data in raw_events:
+        events.setdefault(data["frame"], []).append(event_from_dict(data))
+    return events
+
+
+class InputRecorder():
+    """Records everything needed to replay a game session: the seed of :mod:`random`, the events
+    delivered to the game on each frame and the number of fixed ticks run on each frame.
+
+    """
+    def __init__(self, game: str, seed: int):
+        """Start a recording.
+
+        :param str game: Cartridge name (eg "tetris").
+        :param int seed: Seed :mod:`random` was seeded with before the game was created.
+        :return The newly instantiated recorder.
+        :rtype: InputRecorder
+        """
+        self.game = game
+        self.seed = seed
+        self.started = time.time()
+        self.events: List[dict] = []
+        self.ticks: List[int] = []
+
+    def record_events(self, frame: int, events: List[pygame.event.Event]) -> None:
+        """Record the events delivered to the game on ``frame``.
+
+        :param int frame: Frame number (0 is the first frame after launch).
+        :param list events: The events, in window coordinates.
+        :rtype: None
+        """
+        self.events.extend(event_to_dict(event, frame) for event in events)
+
+    def record_ticks(self, frame: int, ticks: int) -> None:
+        """Record how many fixed ticks ran on ``frame``.
+
+        :param int frame: Frame number.
+        :param int ticks: Number of :func:`Game.onupdate` calls.
+        :rtype: None
+        """
+        if len(self.ticks) <= frame:
+            self.ticks.extend([0] * (frame + 1 - len(self.ticks)))
+        self.ticks[frame] += ticks
+
+    def save(self, path: str, frames: int) -> None:
+        """Write the recording as JSON.
+
+        :param str path: File to write.
+        :param int frames: Number of frames the session ran.
+        :rtype: None
+        """
+        ticks = self.ticks + [0] * (frames - len(self.ticks))
+        with open(path, "w") as rec_file:
+            json.dump({
+                "version": RECORDING_VERSION,
+                "game": self.game,
+                "seed": self.seed,
+                "started": self.started,
+                "frames": frames,
+                "ticks": ticks,
+                "events": self.events,
+            }, rec_file)
+
+
+class Recording():
+    """A loaded recording (see :class:`InputRecorder`).
+
+    """
+    def __init__(self, game: str, seed: int, frames: int, ticks: List[int],
+            events: Dict[int, List[pygame.event.Event]]):
+        """Create a recording.
+
+        :param str game: Cartridge name.
+        :param int seed: Seed for :mod:`random`.
+        :param int frames: Number of frames the session ran.
+        :param list ticks: Number of fixed ticks run on each frame.
+        :param dict events: Events keyed by frame, in window coordinates.
+        :return The newly instantiated recording.
+        :rtype: Recording
+        """
+        self.game = game
+        self.seed = seed
+        self.frames = frames
+        self.ticks = ticks
+        self.events = events
+
+    def ticks_at(self, frame: int) -> int:
+        """Get the number of fixed ticks that ran on ``frame``.
+
+        :param int frame: Frame number.
+        :rtype: int
+        """
+        return self.ticks[frame] if frame < len(self.ticks) else 0
+
+
+def load_recording(path: str) -> Recording:
+    """Load a recording written by :func:`InputRecorder.save`.
+
+    :param str path: File to read.
+    :rtype: Recording
+    :raises ValueError: if the file is not a recording of a supported version.
+    """
+    with open(path) as rec_file:
+        data = json.load(rec_file)
+    if not isinstance(data, dict) or data.get("version") != RECORDING_VERSION:
+        raise ValueError("\"{}\" is not a version {} recording".format(path, RECORDING_VERSION))
+    return Recording(data["game"], data["seed"], data["frames"], data["ticks"], events_by_frame(data["events"]))
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import fnmatch
+import gc
+import os
+import time
+import tracemalloc
+from typing import List, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# seconds between snapshots while a game runs
+DEFAULT_INTERVAL = 30.0
+
+# allocation sites listed per section of a report
+DEFAULT_TOP = 15
+
+# allocations by these files are the profiler's own bookkeeping, not the game's
+IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+
+
+class MemoryProfiler():
+    """Profiles the Python memory of each game session with :mod:`tracemalloc`.
+
+    A snapshot is taken before the game is created, every ``interval`` seconds while it runs, as
+    it exits and once it is gone (after a garbage collection). When the session ends, a text report is
+    written with the top allocation sites during play, the growth during play and what is still
+    allocated after exit compared to before launch, which points at games that leak or churn
+    memory.
+
+    Note that :mod:`tracemalloc` only sees allocations made by Python: the
+    :class:`pygame.Surface` objects themselves are counted, but not the pixel buffers SDL
+    allocates for them. The process's peak resident size is reported as well to catch those.
+
+    """
+    def __init__(self, report_dir: str, interval: float = DEFAULT_INTERVAL, top: int = DEFAULT_TOP):
+        """Create a memory profiler.
+
+        :param str report_dir: Directory to write the reports to.
+        :param float interval: Seconds between snapshots while a game runs.
+        :param int top: Allocation sites listed per section of a report.
+        :return The newly instantiated memory profiler.
+        :rtype: MemoryProfiler
+        """
+        # the filters of :func:`take_snapshot` match file names with :func:`fnmatch.fnmatch`,
+        # which compiles (and caches) their patterns the first time a trace is filtered; compile
+        # them before tracing starts so that the caches do not show up in the reports
+        for name in IGNORED_FILES:
+            fnmatch.fnmatch(__file__, name)
+        self.report_dir = report_dir
+        self.interval = interval
+        self.top = top
+        self.game = None
+        self.started = None
+        self.launch = None
+        self.largest = None
+        self.last = None
+        self.snapshots = 0
+        self.next_sample = 0.0
+
+    def take_snapshot(self) -> tracemalloc.Snapshot:
+        """Take a snapshot of the traced allocations, minus the profiler's own.
+
+        :rtype: tracemalloc.Snapshot
+        """
+        self.snapshots += 1
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, name) for name in IGNORED_FILES])
+
+    def begin(self, game: str) -> None:
+        """Start profiling a session; call before the game is created.
+
+        :param str game: Cartridge name (eg "tictactoe").
+        :rtype: None
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        gc.collect()
+        tracemalloc.reset_peak()
+        self.game = game
+        self.started = time.time()
+        self.snapshots = 0
+        self.launch = self.largest = self.last = self.take_snapshot()
+        self.next_sample = time.perf_counter() + self.interval
+
+    def update(self, running: bool) -> None:
+        """Call once per frame: snapshots the running game every :attr:`interval` seconds and ends
+        the session once the game is gone.
+
+        The exit snapshot is taken on the frame after the game exited rather than in the exit
+        handler, which still has the game on its stack; the exit handler should call
+        :func:`sample` instead, so that short sessions still have a snapshot of the game.
+
+        :param bool running: Whether the game is still running.
+        :rtype: None
+        """
+        if self.game is None:
+            return
+        if not running:
+            self.end()
+        elif time.perf_counter() >= self.next_sample:
+            self.sample()
+
+    def sample(self) -> None:
+        """Take a snapshot of the running game.
+
+        :rtype: None
+        """
+        if self.game is None:
+            return
+        self.last = self.take_snapshot()
+        if sum_size(self.last) > sum_size(self.largest):
+            self.largest = self.last
+        self.next_sample = time.perf_counter() + self.interval
+
+    def end(self) -> Optional[str]:
+        """End the session: snapshot what is left after exit and write the report.
+
+        :return The path of the report, or None if it could not be written.
+        :rtype: str
+        """
+        if self.game is None:
+            return None
+        gc.collect()
+        exit_snapshot = self.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        lines = self.report(exit_snapshot, peak)
+        path = os.path.join(self.report_dir, "{}-{}-memory.txt".format(
+            self.game, time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))))
+        self.game = self.launch = self.largest = self.last = None
+        try:
+            os.makedirs(self.report_dir, exist_ok=True)
+            with open(path, "w") as report_file:
+                report_file.write("\n".join(lines) + "\n")
+        except OSError as error:
+            print("Error: could not save memory report \"{}\": {}".format(path, error))
+            return None
+        return path
+
+    def report(self, exit_snapshot: tracemalloc.Snapshot, peak: int) -> List[str]:
+        """Format the report of the current session.
+
+        :param tracemalloc.Snapshot exit_snapshot: Snapshot taken after the game exited.
+        :param int peak: Peak traced memory (bytes) during the session.
+        :return The lines of the report.
+        :rtype: List[str]
+        """
+        lines = [
+            "memory profile: {}".format(self.game),
+            "started {}, ran {:.1f} s, {} snapshots".format(
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)), time.time() - self.started, self.snapshots),
+            "traced memory: {} at launch, {} peak, {} after exit".format(
+                format_size(sum_size(self.launch)), format_size(peak), format_size(sum_size(exit_snapshot))),
+        ]
+        if resource is not None:
+            # ru_maxrss is in KiB on Linux
+            lines.append("peak resident size: {}".format(format_size(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)))
+        lines.append("")
+        lines.append("top allocation sites during play (largest snapshot):")
+        lines.extend(format_stat(stat) for stat in self.largest.statistics("lineno")[:self.top])
+        lines.append("")
+        lines.append("growth during play (last snapshot vs launch):")
+        lines.extend(format_diff(stat) for stat in growth(self.last.compare_to(self.launch, "lineno"))[:self.top])
+        lines.append("")
+        lines.append("retained after exit (vs before launch):")
+        lines.extend(format_diff(stat) for stat in growth(exit_snapshot.compare_to(self.launch, "lineno"))[:self.top])
+        return lines
+
+
+def sum_size(snapshot: tracemalloc.Snapshot) -> int:
+    """Get the total size of the allocations in a snapshot.
+
+    :param tracemalloc.Snapshot snapshot: The snapshot.
+    :rtype: int
+    """
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def growth(diffs: List[tracemalloc.StatisticDiff]) -> List[tracemalloc.StatisticDiff]:
+    """Keep the allocation sites that grew, largest growth first.
+
+    :param list diffs: Result of :func:`tracemalloc.Snapshot.compare_to`.
+    :rtype: List[tracemalloc.StatisticDiff]
+    """
+    return sorted((diff for diff in diffs if diff.size_diff > 0), key=lambda diff: diff.size_diff, reverse=True)
+
+
+def format_size(size: int) -> str:
+    """Format a size in bytes as KiB/MiB.
+
+    :param int size: Size in bytes.
+    :rtype: str
+    """
+    if abs(size) >= 2 ** 20:
+        return "{:.1f} MiB".format(size / 2 ** 20)
+    return "{:.1f} KiB".format(size / 2 ** 10)
+
+
+def format_stat(stat: tracemalloc.Statistic) -> str:
+    frame = stat.traceback[0]
+    return "  {:>12} {:>8} blocks  {}:{}".format(format_size(stat.size), stat.count, frame.filename, frame.lineno)
+
+
+def format_diff(diff: tracemalloc.StatisticDiff) -> str:
+    frame = diff.traceback[0]
+    return "  {:>12} {:>+8} blocks  {}:{}".format("+" + format_size(diff.size_diff), diff.count_diff, frame.filename, frame.lineno)
@@ -5,6 +5,8 @@ import pygame
 import os.path
 from typing import List, Dict
 
+from arcade.common.asset_manager import load_image
+
 class SpriteResourceReference():
     """Specifications for an external sprite resource.
 
@@ -40,7 +42,7 @@ class SpriteSheet():
         :return: Newly instantiated Sprite Sheet
         :rtype: SpriteSheet
         """
-        self.sprite_sheet = pygame.image.load(file_name).convert()
+        self.sprite_sheet = load_image(file_name, alpha=False)
  
     def get_sprite(self, sprite: SpriteResourceReference) -> pygame.image:
         """Retrieve a single sprite from the Sprite Sheet.
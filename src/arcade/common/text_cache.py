@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import collections
+import threading
+from typing import Optional
+
+import pygame
+
+from arcade.common.asset_manager import surface_bytes
+
+# default memory budget for cached text surfaces: 8 MiB
+DEFAULT_BUDGET = 8 * 2 ** 20
+
+
+class TextCache():
+    """Process-wide cache of rendered text.
+
+    Rendered strings are keyed by ``(font, text, antialias, color, background)``, so HUDs and
+    labels that draw the same string every frame only rasterize it once. As with
+    :class:`arcade.common.asset_manager.AssetManager`, the returned surfaces are shared and must
+    not be modified. When the cached surfaces exceed the memory budget, the least recently used
+    ones are dropped.
+
+    Fonts are part of the key by identity, so create a font once (or get it from
+    :func:`get_font`) rather than on every render.
+
+    """
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        """Create a text cache.
+
+        :param int budget: Memory budget in bytes for the cached surfaces.
+        :return The newly instantiated text cache.
+        :rtype: TextCache
+        """
+        self.budget = budget
+        self.cache = collections.OrderedDict()
+        self.fonts = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color,
+            background=None) -> pygame.Surface:
+        """Get ``font.render(text, antialias, color, background)``, rendering it on first use.
+
+        :param pygame.font.Font font: The font.
+        :param str text: The text.
+        :param bool antialias: Antialias the text.
+        :param color: Text color.
+        :param background: Background color, or None for a transparent background.
+        :return The shared surface; do not modify it.
+        :rtype: pygame.Surface
+        """
+        key = (font, text, bool(antialias), tuple(color), tuple(background) if background is not None else None)
+        with self.lock:
+            surf = self.cache.get(key)
+            if surf is not None:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return surf
+            self.misses += 1
+            surf = font.render(text, antialias, color, background)
+            self.cache[key] = surf
+            self.bytes += surface_bytes(surf)
+            # evict least recently used surfaces, but never the one just stored
+            while self.bytes > self.budget and len(self.cache) > 1:
+                _, old = self.cache.popitem(last=False)
+                self.bytes -= surface_bytes(old)
+                self.evictions += 1
+            return surf
+
+    def get_font(self, name: Optional[str], size: int) -> pygame.font.Font:
+        """Get a :class:`pygame.font.Font`, loading it (and initializing :mod:`pygame.font`) on
+        first use.
+
+        :param str name: Font file (or None for pygame's default font).
+        :param int size: Font size.
+        :rtype: pygame.font.Font
+        """
+        key = (str(name) if name is not None else None, size)
+        with self.lock:
+            font = self.fonts.get(key)
+            if font is None:
+                if not pygame.font.get_init():
+                    pygame.font.init()
+                font = self.fonts[key] = pygame.font.Font(key[0], size)
+            return font
+
+    def clear(self) -> None:
+        """Drop all cached surfaces and fonts.
+
+        :rtype: None
+        """
+        with self.lock:
+            self.cache.clear()
+            self.fonts.clear()
+            self.bytes = 0
+
+
+# the process-wide text cache used by :func:`render_text` and :func:`get_font`
+TEXT = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color,
+        background=None) -> pygame.Surface:
+    """Render text through the process-wide text cache (see :func:`TextCache.render`).
+
+    :param pygame.font.Font font: The font.
+    :param str text: The text.
+    :param bool antialias: Antialias the text.
+    :param color: Text color.
+    :param background: Background color, or None for a transparent background.
+    :return The shared surface; do not modify it.
+    :rtype: pygame.Surface
+    """
+    return TEXT.render(font, text, antialias, color, background)
+
+
+def get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """Get a font from the process-wide text cache (see :func:`TextCache.get_font`).
+
+    :param str name: Font file (or None for pygame's default font).
+    :param int size: Font size.
+    :rtype: pygame.font.Font
+    """
+    return TEXT.get_font(name, size)
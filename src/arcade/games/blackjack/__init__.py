@@ -1,7 +1,6 @@
-from arcade.games.blackjack import blackjack
-
 def get_name():
     return "Blackjack"
 
 def insert_cartridge():
+    from arcade.games.blackjack import blackjack
     return blackjack.Game()
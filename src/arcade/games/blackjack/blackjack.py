@@ -1,6 +1,8 @@
 import pygame
 import os
 from arcade import plethoraAPI
+from arcade.common.asset_manager import load_image
+from arcade.common.text_cache import render_text
 from enum import IntFlag, auto, unique
 
 from pygame.locals import (
@@ -44,8 +46,7 @@ class Game(plethoraAPI.Game):
         self.doubleDown = False
         self.minWager = 50
         self.totalWager = self.minWager
-        self.cardBack = pygame.image.load(str(IMAGES/'cards/back.png'))
-        self.cardBack = pygame.transform.scale(self.cardBack, (160, 233))
+        self.cardBack = load_image(IMAGES/'cards/back.png', (160, 233))
         self.smallFont = pygame.font.SysFont('Arial', 25)
         self.biggerFont = pygame.font.SysFont('Arial', 30)
         self.select = [True, False, False, False]
@@ -342,26 +343,26 @@ class Game(plethoraAPI.Game):
         
 
         pygame.draw.rect(self.display, (193, 193, 199),(self.rect.width-190,80,180,50))
-        self.display.blit(self.biggerFont.render(('$'+str(self.player.money)), True, (0,0,0)), (self.rect.width-140, 90))
+        self.display.blit(render_text(self.biggerFont, ('$'+str(self.player.money)), True, (0,0,0)), (self.rect.width-140, 90))
         pygame.draw.rect(self.display, (193, 193, 199),(self.rect.width-183,200,145,45))
-        self.display.blit(self.smallFont.render(('$'+str(self.totalWager)), True, (255,0,0)), (self.rect.width-132, 210))
+        self.display.blit(render_text(self.smallFont, ('$'+str(self.totalWager)), True, (255,0,0)), (self.rect.width-132, 210))
         pygame.draw.rect(self.display, (112, 61, 34),self.plusButton)
-        self.display.blit(self.smallFont.render(('+'), True, (245, 245, 66)), (self.rect.width-28, 197))
+        self.display.blit(render_text(self.smallFont, ('+'), True, (245, 245, 66)), (self.rect.width-28, 197))
         pygame.draw.rect(self.display, (112, 61, 34),(self.minusButton))
-        self.display.blit(self.smallFont.render(('-'), True, (245, 245, 66)), (self.rect.width-25, 218))
+        self.display.blit(render_text(self.smallFont, ('-'), True, (245, 245, 66)), (self.rect.width-25, 218))
 
         pygame.draw.rect(self.display, (205, 205, 210) if self.select[0] else (143, 143, 149), self.stayButton)
-        self.display.blit(self.smallFont.render('Stay', True, (0,0,0)), (self.rect.width-126, 285))
+        self.display.blit(render_text(self.smallFont, 'Stay', True, (0,0,0)), (self.rect.width-126, 285))
         pygame.draw.rect(self.display, (205, 205, 210) if self.select[1] else (143, 143, 149), self.hitButton)
-        self.display.blit(self.smallFont.render('Hit', True, (0,0,0)), (self.rect.width-115, 345))
+        self.display.blit(render_text(self.smallFont, 'Hit', True, (0,0,0)), (self.rect.width-115, 345))
         if (self.canDoubleDown):
             pygame.draw.rect(self.display, (205, 205, 210) if self.select[2] else (143, 143, 149),self.doubleDownButton)
-            self.display.blit(self.smallFont.render('Double Down', True, (0,0,0)), (self.rect.width-176, 405))
+            self.display.blit(render_text(self.smallFont, 'Double Down', True, (0,0,0)), (self.rect.width-176, 405))
         if (self.canSplit):
             pygame.draw.rect(self.display, (205, 205, 210) if self.select[3] else (143, 143, 149),self.splitButton)
-            self.display.blit(self.smallFont.render('Split', True, (0,0,0)), (self.rect.width-127, 464))
+            self.display.blit(render_text(self.smallFont, 'Split', True, (0,0,0)), (self.rect.width-127, 464))
         pygame.draw.rect(self.display, (205, 205, 210) if self.select[2] else (143, 143, 149),self.getMenuBottonLocation())
-        self.display.blit(self.smallFont.render('Back to Menu', True, (0,0,0)), (self.rect.width-177, self.getMenuBottonLocation()[1]+5))
+        self.display.blit(render_text(self.smallFont, 'Back to Menu', True, (0,0,0)), (self.rect.width-177, self.getMenuBottonLocation()[1]+5))
         
         rerender = False
         rerender = bool(arrows)  # return True if an arrow key is down; otherwise False
@@ -377,16 +378,16 @@ class Game(plethoraAPI.Game):
         if (self.gameEnd):
             displayName = "Dealer" if self.playerBust else "Player"
             pygame.draw.rect(self.display, (0, 0, 0),(self.rect.width/2 - 200,280,200,45))
-            self.display.blit(self.smallFont.render((displayName+' Won'), True, (255,0,0)), (self.rect.width/2 - 169, 287))
+            self.display.blit(render_text(self.smallFont, (displayName+' Won'), True, (255,0,0)), (self.rect.width/2 - 169, 287))
         
         if(self.exitWarningScreen):
             pygame.draw.rect(self.display, (0,0,0),self.exitWarningScreenBox)
-            self.display.blit(self.smallFont.render('Are you sure', True, (237,28,36)), (self.exitWarningScreenBoxText))
-            self.display.blit(self.smallFont.render('you want to quit?', True, (237,28,36)), (self.exitWarningScreenBoxText[0]-20, self.exitWarningScreenBoxText[1]+30))
+            self.display.blit(render_text(self.smallFont, 'Are you sure', True, (237,28,36)), (self.exitWarningScreenBoxText))
+            self.display.blit(render_text(self.smallFont, 'you want to quit?', True, (237,28,36)), (self.exitWarningScreenBoxText[0]-20, self.exitWarningScreenBoxText[1]+30))
             pygame.draw.rect(self.display, (34,177,76),self.confirmExitButton)
-            self.display.blit(self.smallFont.render('Yes', True, (255,255,255)), (self.confirmExitButton[0]+20, self.confirmExitButton[1]+5))
+            self.display.blit(render_text(self.smallFont, 'Yes', True, (255,255,255)), (self.confirmExitButton[0]+20, self.confirmExitButton[1]+5))
             pygame.draw.rect(self.display, (237,28,36),self.rejectExitButton)
-            self.display.blit(self.smallFont.render('No', True, (255,255,255)), (self.rejectExitButton[0]+25, self.rejectExitButton[1]+5))
+            self.display.blit(render_text(self.smallFont, 'No', True, (255,255,255)), (self.rejectExitButton[0]+25, self.rejectExitButton[1]+5))
 
         return rerender
 
@@ -418,8 +419,7 @@ class Game(plethoraAPI.Game):
                     self.name = cardName
                     self.suit = suit
                 # print(os.getcwd())
-                self.image = pygame.image.load(str(IMAGES/f'cards/{self.name}_of_{self.suit}.png'))
-                self.image = pygame.transform.scale(self.image, (160, 233))
+                self.image = load_image(IMAGES/f'cards/{self.name}_of_{self.suit}.png', (160, 233))
         
     
             def randomCard(self, deck={}):
@@ -1,7 +1,10 @@
-from arcade.games.bomberman import bomberman
-
 def get_name():
     return "Bomberman"
 
 def insert_cartridge():
+    from arcade.games.bomberman import bomberman
     return bomberman.Bomberman()
+
+def preload_cartridge():
+    from arcade.games.bomberman import bomberman
+    bomberman.preload()
@@ -9,8 +9,74 @@ from arcade.common.resource_library import ResourceLibrary
 from arcade.games.bomberman.bomberman_map import StaticTile, DynamicTile, Map
 from arcade.games.bomberman.bomberman_animations import BombermanAnimationLibrary
 from arcade.games.bomberman.bomberman_config import GameConfig
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 import pathlib
+import struct
+import threading
+
+# save state (see :func:`Bomberman.snapshot`): the header (version, game_active, menu_select, map width
+# and height, number of bombs and of explosions), a byte per map tile (1 for a destructable tile,
+# column by column), the PROGRESS of each destructable tile, then an ENTITY and its PROGRESS for each
+# player, bomb and explosion
+SNAPSHOT_VERSION = 1
+SNAPSHOT = struct.Struct("<B?BBBBH")
+# center, the movement of a player or the animation of an explosion (index into MOVEMENTS or
+# EXPLOSIONS), and for an explosion 1 + the index of an earlier explosion whose animation it shares
+# (explosions of one cluster share their shaft animations, which then advance once per explosion)
+ENTITY = struct.Struct("<hhBH")
+# see :func:`AnimatedEntity.get_progress`: state, animating, has a current animation, and its position
+PROGRESS = struct.Struct("<B??BBH?")
+STATES = ('neutral', 'death', 'dead')
+MOVEMENTS = ('none', 'left', 'right', 'up', 'down')
+MENU_SELECTS = ('left', 'right')
+EXPLOSIONS = ('explosion_center', 'explosion_top_tip', 'explosion_bottom_tip', 'explosion_right_tip', 'explosion_left_tip',
+    'explosion_horizontal_shaft', 'explosion_vertical_shaft')
+
+def pack_progress(entity:AnimatedEntity) -> bytes:
+    """Pack the state and animation progress of an entity (see :data:`PROGRESS`).
+
+    :param AnimatedEntity entity: The entity.
+    :rtype: bytes
+    """
+    state, animating, animation, position = entity.get_progress()
+    index, shown, duration, final = position or (0, 0, 0, False)
+    return PROGRESS.pack(STATES.index(state), animating, animation is not None, index, shown, duration, final)
+
+def unpack_progress(data:bytes, offset:int) -> tuple:
+    """Unpack the progress packed by :func:`pack_progress`.
+
+    :param bytes data: The save state.
+    :param int offset: Offset of the progress in data.
+    :return: Arguments for :func:`AnimatedEntity.set_progress`.
+    :rtype: tuple
+    """
+    state, animating, has_animation, index, shown, duration, final = PROGRESS.unpack_from(data, offset)
+    if has_animation:
+        return STATES[state], animating, 'death', (index, shown, duration, final)
+    return STATES[state], animating, None, None
+
+# sprites and animations sliced from the sprite sheets, shared by every game (see :func:`preload`)
+RESOURCES = None
+RESOURCES_LOCK = threading.Lock()
+
+def preload() -> Tuple[Dict[str, pygame.Surface], Dict[str, Animation]]:
+    """Slice every sprite from the sprite sheets and build the animation tables, once per process.
+
+    The launcher calls this on a worker thread (through ``preload_cartridge()``) when Bomberman is
+    hovered in the menu, so that constructing the game is fast. The results are only read through
+    :class:`ResourceLibrary`, which hands out copies, so they can be shared.
+
+    :return: The static images and the animations, keyed by name.
+    :rtype: (Dict[str, pygame.Surface], Dict[str, Animation])
+    """
+    global RESOURCES
+    with RESOURCES_LOCK:
+        if RESOURCES is None:
+            config = GameConfig()
+            sprites = SpriteBook(config.sprites, config.assetPath).get_all_sprites()
+            animations = BombermanAnimationLibrary(ResourceLibrary(sprites), config).get_dict()
+            RESOURCES = (sprites, animations)
+        return RESOURCES
 
 class Bomberman(plethoraAPI.Game):
     """The Bomberman Game!
@@ -25,12 +91,10 @@ class Bomberman(plethoraAPI.Game):
         self.config = GameConfig()
         super().__init__(size=(self.config.gameWidth, self.config.gameHeight), fps=20)
 
-        # --- Sprite Load-In --- #
-        self.static_image_library = ResourceLibrary(SpriteBook(self.config.sprites, self.config.assetPath).get_all_sprites())
-
-        # --- Animations Setup --- #
-        animations = BombermanAnimationLibrary(self.static_image_library, self.config)
-        self.animations_library = ResourceLibrary(animations.get_dict())
+        # --- Sprite Load-In & Animations Setup --- #
+        sprites, animations = preload()
+        self.static_image_library = ResourceLibrary(sprites)
+        self.animations_library = ResourceLibrary(animations)
 
         self.reset()
 
@@ -257,6 +321,123 @@ class Bomberman(plethoraAPI.Game):
         """
         self.onexit()
 
+    def snapshot(self) -> bytes:
+        """Pack the map and every player, bomb and explosion into a save state (see :data:`SNAPSHOT`).
+
+        :return: The save state.
+        :rtype: bytes
+        """
+        data = [SNAPSHOT.pack(SNAPSHOT_VERSION, self.game_active, MENU_SELECTS.index(self.menu_select),
+            self.map.width, self.map.height, len(self.bomb_sprites), len(self.deadly_sprites))]
+        tiles = [tile for col in self.map.map for tile in col]
+        data.append(bytes(isinstance(tile, DynamicTile) for tile in tiles))
+        data.extend(pack_progress(tile) for tile in tiles if isinstance(tile, DynamicTile))
+        for bomber in (self.p1, self.p2):
+            data.append(ENTITY.pack(*bomber.rect.center, MOVEMENTS.index(bomber.movement), 0) + pack_progress(bomber))
+        for bomb in self.bomb_sprites:
+            data.append(ENTITY.pack(*bomb.rect.center, 0, 0) + pack_progress(bomb))
+        shared = dict()
+        for index, explosion in enumerate(self.deadly_sprites):
+            animation = explosion.animations.get('death')
+            owner = shared.setdefault(id(animation), index)
+            data.append(ENTITY.pack(*explosion.rect.center, EXPLOSIONS.index(explosion.kind), owner + 1 if owner != index else 0) + pack_progress(explosion))
+        return b"".join(data)
+
+    def restore(self, data:bytes) -> None:
+        """Restore a save state packed by :func:`snapshot`.
+
+        Tiles whose state did not change are kept; players, bombs and explosions are created anew.
+
+        :param bytes data: The save state.
+        :raises ValueError: If data is not a save state of this version for this map.
+        :rtype: None
+        """
+        try:
+            version, game_active, menu_select, width, height, bombs, explosions = SNAPSHOT.unpack_from(data)
+            if version != SNAPSHOT_VERSION or (width, height) != (self.map.width, self.map.height):
+                raise ValueError()
+            offset = SNAPSHOT.size
+            dynamic = data[offset:offset + width * height]
+            offset += width * height
+            tiles = list()
+            for is_dynamic in dynamic:
+                if is_dynamic:
+                    tiles.append(unpack_progress(data, offset))
+                    offset += PROGRESS.size
+                else:
+                    tiles.append(None)
+            entities = list()
+            for _ in range(2 + bombs + explosions):
+                entities.append((ENTITY.unpack_from(data, offset), unpack_progress(data, offset + ENTITY.size)))
+                offset += ENTITY.size + PROGRESS.size
+            if offset != len(data) or any(entity[0][3] > index for index, entity in enumerate(entities[2 + bombs:])):
+                raise ValueError()
+        except (struct.error, ValueError, IndexError):
+            raise ValueError("not a version {} bomberman save state for this map".format(SNAPSHOT_VERSION))
+
+        self.game_active = game_active
+        self.menu_select = MENU_SELECTS[menu_select]
+
+        # --- Map --- #
+        for colNum, col in enumerate(self.map.map):
+            for rowNum, tile in enumerate(col):
+                progress = tiles[colNum * height + rowNum]
+                if progress is not None:
+                    if isinstance(tile, DynamicTile) and tile.get_progress() == progress:
+                        continue
+                    tile = self.map.destructable_tile()
+                    tile.set_progress(*progress)
+                elif isinstance(tile, DynamicTile):
+                    tile = self.map.terrain_tile()
+                else:
+                    continue
+                tile.place_at(topleft=(self.map.scaleWidth * colNum, self.map.scaleHeight * rowNum))
+                col[rowNum] = tile
+
+        # --- Players --- #
+        self.bomber_sprites.empty()
+        bombers = list()
+        for (neutral, death), ((x, y, movement, _), progress) in zip((("bomber_w_neutral", "bomber_w_death"), ("bomber_b_neutral", "bomber_b_death")), entities[:2]):
+            bomber = Bomber(self.static_image_library.get(neutral), death_animation=self.animations_library.get(death), movement_plane=self.map.map, barrier_sprites=self.bomb_sprites)
+            bomber.set_scale((int(self.config.tileWidth*.75),int(self.config.tileHeight*.75)))
+            bomber.place_at(center=(x, y))
+            bomber.movement = MOVEMENTS[movement]
+            bomber.set_progress(*progress)
+            bombers.append(bomber)
+        self.p1, self.p2 = bombers
+        self.bomber_sprites.add(bombers)
+
+        # --- Bombs & Explosions --- #
+        self.bomb_sprites.empty()
+        for (x, y, _, _), progress in entities[2:2 + bombs]:
+            bomb = Bomb(self.static_image_library.get("bomb_l_inactive"), death_animation=self.animations_library.get("bomb_ticking"))
+            bomb.set_scale((self.config.tileWidth,self.config.tileHeight))
+            bomb.place_at(center=(x, y))
+            bomb.set_progress(*progress)
+            self.bomb_sprites.add(bomb)
+        self.deadly_sprites.empty()
+        explosions = list()
+        for (x, y, kind, shared), progress in entities[2 + bombs:]:
+            kind = EXPLOSIONS[kind]
+            animation = explosions[shared - 1].animations['death'] if shared else self.animations_library.get(kind)
+            explosion = Explosion(self.static_image_library.get("bomb_l_inactive" if kind == 'explosion_center' else "aftermath"),
+                death_animation=animation, kind=kind)
+            explosion.set_scale((self.config.tileWidth,self.config.tileHeight))
+            explosion.place_at(center=(x, y))
+            explosion.set_progress(*progress)
+            explosions.append(explosion)
+            self.deadly_sprites.add(explosion)
+
+        if not self.game_active:
+            # the game over prompt is drawn over the last frame of play
+            for col in self.map.map:
+                for tile in col:
+                    self.display.blit(tile.image, tile.rect.topleft)
+            self.deadly_sprites.draw(self.display)
+            self.bomb_sprites.draw(self.display)
+            self.bomber_sprites.draw(self.display)
+        self.schedule_render(0)
+
 class Bomber(AnimatedEntity):
     """Bomber class (player). Main characters of the game.
     """
@@ -336,24 +517,24 @@ class ExplosionCluster():
         for tile in exploding_tiles:
             if tile[1] == 'up':
                 if tile[2]: 
-                    self.explosions.append(Explosion(neutral_image, death_animation=top_tip_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=top_tip_animation, kind='explosion_top_tip', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
                 else:
-                    self.explosions.append(Explosion(neutral_image, death_animation=vertical_shaft_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=vertical_shaft_animation, kind='explosion_vertical_shaft', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
             elif tile[1] == 'down':
                 if tile[2]: 
-                    self.explosions.append(Explosion(neutral_image, death_animation=bottom_tip_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=bottom_tip_animation, kind='explosion_bottom_tip', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
                 else:
-                    self.explosions.append(Explosion(neutral_image, death_animation=vertical_shaft_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=vertical_shaft_animation, kind='explosion_vertical_shaft', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
             elif tile[1] == 'left':
                 if tile[2]: 
-                    self.explosions.append(Explosion(neutral_image, death_animation=left_tip_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=left_tip_animation, kind='explosion_left_tip', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
                 else:
-                    self.explosions.append(Explosion(neutral_image, death_animation=horizontal_shaft_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=horizontal_shaft_animation, kind='explosion_horizontal_shaft', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
             elif tile[1] == 'right':
                 if tile[2]: 
-                    self.explosions.append(Explosion(neutral_image, death_animation=right_tip_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=right_tip_animation, kind='explosion_right_tip', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
                 else:
-                    self.explosions.append(Explosion(neutral_image, death_animation=horizontal_shaft_animation, explosion_coordinates=tile[0].rect.center, scale=tile_scale))
+                    self.explosions.append(Explosion(neutral_image, death_animation=horizontal_shaft_animation, kind='explosion_horizontal_shaft', explosion_coordinates=tile[0].rect.center, scale=tile_scale))
         for destructable in destructable_tiles:
             destructable.death()
 
@@ -366,17 +547,19 @@ class ExplosionCluster():
         return self.explosions
 
 class Explosion(AnimatedEntity):
-    def __init__(self, neutral_image:pygame.image, *, death_animation:Animation, explosion_coordinates:Tuple[int,int]=False, scale:Tuple[int,int]=False):
+    def __init__(self, neutral_image:pygame.image, *, death_animation:Animation, kind:str='explosion_center', explosion_coordinates:Tuple[int,int]=False, scale:Tuple[int,int]=False):
         """Desc
 
         :param pygame.image neutral_image: Neutral image to be used when the explosion is not animating.
         :param Animation death_animation: Tick-down animation
+        :param str kind: Name of the death animation (one of :data:`EXPLOSIONS`), for save states.
         :param Tuple[int,int] explosion_coordinates: Coordinates of the explosion's center.
         :param Tuple[int,int] scale: Scale of the explosion.
         :return: Newly instantiated Explosion.
         :rtype: Type
         """
         AnimatedEntity.__init__(self, neutral_image, death_animation)
+        self.kind = kind
         if explosion_coordinates:
             self.explode_at(explosion_coordinates)
             if scale:
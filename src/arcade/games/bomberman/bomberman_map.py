@@ -167,13 +167,13 @@ class Map():
                             self.map[col].append(StaticTile('solid', self.graphicsLibrary.get('solid'), (self.scaleWidth,self.scaleHeight), barrier=True))
                         elif (col,cell) in self.spawn_buffers:
                             # Preserve Potential Spawn Points
-                            self.map[col].append(StaticTile('terrain', self.graphicsLibrary.get('terrain'), (self.scaleWidth,self.scaleHeight), barrier=False))
+                            self.map[col].append(self.terrain_tile())
                         elif random.randint(0, 2) == 0:
                             # Soft-Barrier Generation
-                            self.map[col].append(DynamicTile('destructable_new', self.graphicsLibrary.get('destructable_new'), (self.scaleWidth,self.scaleHeight), destructable="True", barrier=True, death_animation=self.animations_library.get('destructable_death')))
+                            self.map[col].append(self.destructable_tile())
                         else:
                             # Fill Remaining Terrain
-                            self.map[col].append(StaticTile('terrain', self.graphicsLibrary.get('terrain'), (self.scaleWidth,self.scaleHeight), barrier=False))
+                            self.map[col].append(self.terrain_tile())
                 else:
                     # World Barrier - Side Sections
                     if col == 0 or col == self.width - 1:
@@ -208,6 +208,20 @@ class Map():
                             self.map[col].append(StaticTile('wall_7', self.graphicsLibrary.get('wall_7'), (self.scaleWidth,self.scaleHeight), flip_x=right_most_columns, barrier=True))
                 self.map[col][cell].place_at(topleft=(self.scaleWidth * col, self.scaleHeight * cell))
 
+    def terrain_tile(self) -> StaticTile:
+        """Create a walkable terrain tile (not placed on the map yet).
+
+        :rtype: StaticTile
+        """
+        return StaticTile('terrain', self.graphicsLibrary.get('terrain'), (self.scaleWidth,self.scaleHeight), barrier=False)
+
+    def destructable_tile(self) -> DynamicTile:
+        """Create a destructable soft-barrier tile (not placed on the map yet).
+
+        :rtype: DynamicTile
+        """
+        return DynamicTile('destructable_new', self.graphicsLibrary.get('destructable_new'), (self.scaleWidth,self.scaleHeight), destructable="True", barrier=True, death_animation=self.animations_library.get('destructable_death'))
+
     def update(self, display:pygame.display) -> None:
         """Update all tiles in the map.
 
@@ -220,7 +234,7 @@ class Map():
                     tile.update()
                     display.blit(tile.image, tile.rect.topleft)
                     if tile.state == 'dead':
-                        self.map[colNum][rowNum] = StaticTile('terrain', self.graphicsLibrary.get('terrain'), (self.scaleWidth,self.scaleHeight), barrier=False)
+                        self.map[colNum][rowNum] = self.terrain_tile()
                         self.map[colNum][rowNum].place_at(topleft=(self.scaleWidth * colNum, self.scaleHeight * rowNum))
 
     def coordinates_to_tile(self, coordinates:Tuple[int,int]) -> Union[StaticTile, DynamicTile]:
@@ -1,6 +1,14 @@
 import pygame as pg
+import struct
 from arcade import plethoraAPI
 
+# save state (see Checkers.snapshot): version, selected, turn, moves, countR, countB and win;
+# followed by a byte per space (an index into SPACES)
+SNAPSHOT_VERSION = 1
+SNAPSHOT = struct.Struct("<Bb1sHBBB")
+SPACES = ("-", "B", "R", "KB", "KR")
+WINS = ("tie", "Red", "Black", "Tie")
+
 
 class Checkers(plethoraAPI.Game):
     def __init__(self):
@@ -213,3 +221,17 @@ class Checkers(plethoraAPI.Game):
             self.win="Black"
         else:
             self.win="Tie"
+
+    def snapshot(self): # pack the board and turn into a save state (40 bytes)
+        header = SNAPSHOT.pack(SNAPSHOT_VERSION, self.selected, self.turn.encode(), self.moves,
+                self.countR, self.countB, WINS.index(self.win))
+        return header + bytes(SPACES.index(x) for x in self.spaces)
+
+    def restore(self, data): # restore a save state packed by snapshot()
+        if len(data) != SNAPSHOT.size + len(self.rects) or data[0] != SNAPSHOT_VERSION:
+            raise ValueError("not a version {} checkers save state".format(SNAPSHOT_VERSION))
+        _, self.selected, turn, self.moves, self.countR, self.countB, win = SNAPSHOT.unpack_from(data)
+        self.turn = turn.decode()
+        self.win = WINS[win]
+        self.spaces = [SPACES[x] for x in data[SNAPSHOT.size:]]
+        self.schedule_render(0)
@@ -1,8 +1,6 @@
-
-from arcade.games.checkers.Checkers import Checkers
-
 def get_name():
     return "Checkers"
 
 def insert_cartridge():
+    from arcade.games.checkers.Checkers import Checkers
     return Checkers()
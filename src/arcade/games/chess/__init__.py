@@ -1,7 +1,6 @@
-from arcade.games.chess import game as chessGame
-
 def get_name():
     return "Chess"
 
 def insert_cartridge():
+    from arcade.games.chess import game as chessGame
     return chessGame.Game()
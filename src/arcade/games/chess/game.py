@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import enum
+import functools
 import pathlib
 import pygame
 import time
 
 from arcade import plethoraAPI
+from arcade.common.asset_manager import load_image
 from arcade.games.chess.chess import Square, Color, PieceType, Piece, Board
 from typing import Tuple
 
@@ -20,22 +22,29 @@ SQUARE_SIZE = (60, 60)
 # alpha for piece
 GHOST_ALPHA = 102
 
-# Piece -> light or dark piece image
-PIECE_IMAGES = {}
-# Ghost Piece -> semi-transparent light or dark piece drawn
-GHOST_IMAGES = {}
-for pt in PieceType:
-    for c in Color:
-        piece = Piece(c, pt)
-        path = IMAGE_DIR/"{}_{}.png".format(pt.name.lower(), c.name.lower())
-        img = pygame.image.load(str(path))
-        PIECE_IMAGES[piece] = img
+# images and surfaces below are built on first use (by the first Game), so importing this module
+# does not load or compose anything
+
+@functools.lru_cache(maxsize=None)
+def piece_images():
+    """ Piece -> light or dark piece image
+    """
+    return dict((Piece(c, pt), load_image(IMAGE_DIR/"{}_{}.png".format(pt.name.lower(), c.name.lower())))
+        for pt in PieceType for c in Color)
+
+@functools.lru_cache(maxsize=None)
+def ghost_images():
+    """ Ghost Piece -> semi-transparent light or dark piece drawn
+    """
+    ghosts = {}
+    for piece, img in piece_images().items():
         tmp = pygame.Surface(SQUARE_SIZE)
         tmp.fill((0, 255, 0))
         tmp.set_colorkey((0, 255, 0))
         tmp.blit(img, (0, 0))
         tmp.set_alpha(GHOST_ALPHA)
-        GHOST_IMAGES[piece] = tmp
+        ghosts[piece] = tmp
+    return ghosts
 
 BORDER_ALPHA = 100
 
@@ -57,7 +66,8 @@ SQUARE_COLORS[Color.LIGHT] = (240, 217, 181)
 # dark square color: dark brown
 SQUARE_COLORS[Color.DARK] = (181, 136, 99)
 
-def _get_sq_surfs() -> Tuple[pygame.Surface, pygame.Surface]:
+@functools.lru_cache(maxsize=None)
+def get_sq_surfs() -> Tuple[pygame.Surface, pygame.Surface]:
     sq_surfs = (
         pygame.Surface(SQUARE_SIZE),
         pygame.Surface(SQUARE_SIZE)
@@ -66,15 +76,14 @@ def _get_sq_surfs() -> Tuple[pygame.Surface, pygame.Surface]:
     sq_surfs[Color.DARK].fill(SQUARE_COLORS[Color.DARK])
     return sq_surfs
 
-SQ_SURFS = _get_sq_surfs()
-
 # width of lines inside a square to denote cursor location
 CURSOR_PADDING = 5
 
 # color of cursor: dark green
 CURSOR_COLOR = (20, 112, 70)
 
-def _get_cursor_surf():
+@functools.lru_cache(maxsize=None)
+def get_cursor_surf():
     # left/right vertical rectangle
     vsurf = pygame.Surface((CURSOR_PADDING, SQUARE_SIZE[1]))
     vsurf.fill(CURSOR_COLOR)
@@ -89,20 +98,17 @@ def _get_cursor_surf():
     cursor_surf.blit(hsurf, (CURSOR_PADDING, SQUARE_SIZE[1] - CURSOR_PADDING))
     return cursor_surf
 
-CURSOR_SURF = _get_cursor_surf()
-
 SELECTED_COLOR = (20, 85, 30)
 
 SELECTED_ALPHA = 128
 
-def _get_selected_surf():
+@functools.lru_cache(maxsize=None)
+def get_selected_surf():
     selected_surf = pygame.Surface(SQUARE_SIZE)
     selected_surf.fill(SELECTED_COLOR)
     selected_surf.set_alpha(SELECTED_ALPHA)
     return selected_surf
 
-SELECTED_SURF = _get_selected_surf()
-
 # pygame key tuples
 UP_KEYS = (pygame.K_UP, pygame.K_k)
 RIGHT_KEYS = (pygame.K_RIGHT, pygame.K_l)
@@ -157,6 +163,9 @@ class Game(plethoraAPI.Game):
         self.piecemoved = False       # indicates if piece moved at all between mouse DOWN and UP
         self.ignore_mouseup = False   # should ignore next mouseup event
         self.draw_cursor = True       # do blit cursor (turn off if only mouse events used)
+        self.full_redraw = True       # redraw the whole board on next render
+        self.dirty_sqs = set()        # indices of squares to redraw on next render
+        self.drag_rect = None         # rect where drag piece was last drawn
 
     def onevent(self, event):
         if event.type == pygame.QUIT:
@@ -175,13 +184,36 @@ class Game(plethoraAPI.Game):
             dirty |= self.mouseup(event)
         return dirty
 
+    def onevents(self, events):
+        # a drag floods MOUSEMOTION; only the last position of each run of motion is rendered
+        dirty = False
+        motion = None
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                if self.dragpos and not self.piecemoved:
+                    # skipped motion may still have left the square the drag started from
+                    index = pos_to_index(*event.pos)
+                    if index is not None and index != self.cursor.index:
+                        self.piecemoved = True
+                motion = event
+                continue
+            if motion is not None:
+                dirty |= self.mousemove(motion)
+                motion = None
+            dirty |= self.onevent(event)
+        if motion is not None:
+            dirty |= self.mousemove(motion)
+        return dirty
+
     def keydown(self, event):
-        self.draw_cursor = True
+        if not self.draw_cursor:
+            self.draw_cursor = True
+            self.dirty_sqs.add(self.cursor.index)
         key = event.key
-        dirty = False
+        dirty = bool(self.dirty_sqs)
         if key == pygame.K_SPACE:
-            # TODO: dirtyRects
             dirty = True
+            self.full_redraw = True
             if self.selected_sq:
                 if self.selected_sq != self.cursor:
                     self.board.move(self.selected_sq, self.cursor)
@@ -234,6 +266,7 @@ class Game(plethoraAPI.Game):
                 self.board.move(self.selected_sq, self.cursor)
             self.ignore_mouseup = True
             self.selected_sq = None
+            self.full_redraw = True
             return True
         else:
             self.selected_sq = self.cursor
@@ -243,6 +276,7 @@ class Game(plethoraAPI.Game):
                 x, y = event.pos
                 self.dragpos = (x - SQUARE_SIZE[0] // 2, y - SQUARE_SIZE[1] // 2)
                 self.piecemoved = False
+                self.full_redraw = True
                 return True
         return False
 
@@ -260,6 +294,7 @@ class Game(plethoraAPI.Game):
         return False
 
     def mouseup(self, event):
+        self.full_redraw = True
         if self.ignore_mouseup:
             self.ignore_mouseup = False
         else:
@@ -282,8 +317,6 @@ class Game(plethoraAPI.Game):
         return True
 
     def onrender(self):
-        # TODO: populate when plethoraAPI supports
-        # self.dirtyRects = []
         if self.dirmask:
             move = False
             t = time.time()
@@ -310,30 +343,53 @@ class Game(plethoraAPI.Game):
                     if self.cursor.index % 8 > 0:
                         inc += -1
                 if inc:
-                    # TODO: dirtyRects (much lighter rendering)
+                    # only the old and new cursor squares change
+                    self.dirty_sqs.add(self.cursor.index)
                     self.cursor = Square.from_index(self.cursor.index + inc)
-        # TODO: bust out into `onstart` when plethoraAPI supports
-        self.display.fill(BG_COLOR)
-        # draw board
-        for i, (sq, p) in enumerate(zip(Square, self.board)):
-            sr = SQ_RECTS[i]
-            self.display.blit(SQ_SURFS[get_color(i)], sr)
-            sel_sr = SQ_RECTS[self.selected_sq.index] if sq == self.selected_sq else None
-            if p is not None:
-                if sel_sr:
-                    # draw transparent ghost piece
-                    self.display.blit(GHOST_IMAGES[p], sr)
-                    # draw select background
-                    self.display.blit(SELECTED_SURF, sr)
-                else:
-                    # draw normal piece
-                    self.display.blit(PIECE_IMAGES[p], sr)
-        # draw cursor
-        if self.draw_cursor:
-            ind = self.cursor.index
-            x, y = ind // 8, ind % 8
-            self.display.blit(CURSOR_SURF, SQ_RECTS[self.cursor.index])
-        # draw drag piece
+                    self.dirty_sqs.add(self.cursor.index)
+        if self.full_redraw:
+            # TODO: bust out into `onstart` when plethoraAPI supports
+            self.display.fill(BG_COLOR)
+            for i in range(len(SQ_RECTS)):
+                self._draw_square(i)
+            self.drag_rect = None
+            if self.dragpos:
+                self.drag_rect = self.display.blit(piece_images()[self.dragpiece], self.dragpos)
+            self.full_redraw = False
+            self.dirty_sqs.clear()
+            return bool(self.dirmask)
+        rects = []
         if self.dragpos:
-            self.display.blit(PIECE_IMAGES[self.dragpiece], self.dragpos)
-        return bool(self.dirmask)
+            # erase the drag piece where it was and redraw everything under where it will be
+            drag_rect = pygame.Rect(self.dragpos, SQUARE_SIZE)
+            if self.drag_rect:
+                self.display.fill(BG_COLOR, self.drag_rect)
+                rects.append(self.drag_rect)
+                self.dirty_sqs.update(self.drag_rect.collidelistall(SQ_RECTS))
+            self.dirty_sqs.update(drag_rect.collidelistall(SQ_RECTS))
+        for i in self.dirty_sqs:
+            rects.append(self._draw_square(i))
+        self.dirty_sqs.clear()
+        if self.dragpos:
+            self.drag_rect = self.display.blit(piece_images()[self.dragpiece], self.dragpos)
+            rects.append(self.drag_rect)
+        return (bool(self.dirmask), rects)
+
+    def _draw_square(self, i):
+        """ draw square ``i`` with its piece, selection and cursor; return its rect """
+        sr = SQ_RECTS[i]
+        self.display.blit(get_sq_surfs()[get_color(i)], sr)
+        p = self.board[Square.from_index(i)]
+        if p is not None:
+            if self.selected_sq is not None and self.selected_sq.index == i:
+                # draw transparent ghost piece
+                self.display.blit(ghost_images()[p], sr)
+                # draw select background
+                self.display.blit(get_selected_surf(), sr)
+            else:
+                # draw normal piece
+                self.display.blit(piece_images()[p], sr)
+        # draw cursor
+        if self.draw_cursor and self.cursor.index == i:
+            self.display.blit(get_cursor_surf(), sr)
+        return sr
@@ -1,7 +1,6 @@
-from arcade.games.connect4 import connect4
-
 def get_name():
     return "Connect 4"
 
 def insert_cartridge():
+    from arcade.games.connect4 import connect4
     return connect4.Connect4()
@@ -1,6 +1,8 @@
 import pygame
+import struct
 
 from arcade import plethoraAPI
+from arcade.common.text_cache import get_font, render_text
 
 # Predefined Colors for the UI
 WHITE = (255,255,255)
@@ -15,13 +17,21 @@ NUM_CELLS_HORIZONTAL = 7
 WIN_SERIES_LENGTH = 4
 
 # UI Anchor Points & Dimensions
-CELL_RADIUS = 10
-MARGIN = 5
+# The game is drawn at SIZE_MULTIPLIER times the base layout (its logical resolution) and the
+# launcher scales that by WINDOW_SCALE into the window.
+SIZE_MULTIPLIER = 2
+WINDOW_SCALE = 2
+CELL_RADIUS = 10 * SIZE_MULTIPLIER
+MARGIN = 5 * SIZE_MULTIPLIER
 GAME_HEIGHT = (CELL_RADIUS * 2 + MARGIN) * NUM_CELLS_VERTICAL + MARGIN
 GAME_WIDTH = (CELL_RADIUS * 2 + MARGIN) * NUM_CELLS_HORIZONTAL + MARGIN
 SCOREBOARD_HEIGHT = (MARGIN * 3)
 WINDOW_HEIGHT = GAME_HEIGHT + SCOREBOARD_HEIGHT
-SIZE_MULTIPLIER = 4
+
+# Save State (see Connect4.snapshot): version, scores, current player, activeGame, captive,
+# captiveKeyResponse, victor and targeted column; followed by a byte per grid cell, column by column
+SNAPSHOT_VERSION = 1
+SNAPSHOT = struct.Struct("<BHHB???bb")
 
 class Grid:
     """Class Grid used for Connect 4 matrix and associated logic.
@@ -261,8 +271,7 @@ class Connect4(plethoraAPI.Game):
         :param (:obj:`(int,int,int)`, optional) p2_color: The color used to represent a cell owned by player 2 in the game (RBG).
         :rtype: None
         """
-        self.expandWindow(SIZE_MULTIPLIER)
-        super().__init__(size=(GAME_WIDTH, WINDOW_HEIGHT), fps=60)
+        super().__init__(size=(GAME_WIDTH, WINDOW_HEIGHT), fps=60, scale=WINDOW_SCALE, smooth=True)
         self.score = [0,0]
         self.currentPlayer = 1
         self.activeGame = True
@@ -283,48 +292,6 @@ class Connect4(plethoraAPI.Game):
             columns.append(pygame.Rect((MARGIN+CELL_RADIUS*2) * i + (MARGIN/2), 0, CELL_RADIUS*2 + int(MARGIN), GAME_HEIGHT))
         return columns
 
-    @staticmethod
-    def expandWindow(multiplier=2):
-        """Expand the game window.
-
-        :param (:obj:`int`, optional) multiplier: The factor by which to expand or multiply the size of the game.
-        :rtype: None
-        """
-        global CELL_RADIUS
-        global MARGIN
-        global GAME_HEIGHT
-        global GAME_WIDTH
-        global WINDOW_HEIGHT
-        global SCOREBOARD_HEIGHT
-
-        CELL_RADIUS *= multiplier
-        MARGIN *= multiplier
-        GAME_HEIGHT *= multiplier
-        WINDOW_HEIGHT *= multiplier
-        GAME_WIDTH *= multiplier
-        SCOREBOARD_HEIGHT *= multiplier
-
-    @staticmethod
-    def resetWindow(n=2):
-        """Reduce the game window.
-
-        :param (:obj:`int`, optional) n: The factor by which to reduce or shrink the size of the game.
-        :rtype: None
-        """
-        global CELL_RADIUS
-        global MARGIN
-        global GAME_HEIGHT
-        global GAME_WIDTH
-        global WINDOW_HEIGHT
-        global SCOREBOARD_HEIGHT
-
-        CELL_RADIUS = int(CELL_RADIUS/n)
-        MARGIN = int(MARGIN/n)
-        GAME_HEIGHT = int(GAME_HEIGHT/n)
-        WINDOW_HEIGHT = int(WINDOW_HEIGHT/n)
-        GAME_WIDTH = int(GAME_WIDTH/n)
-        SCOREBOARD_HEIGHT = int(SCOREBOARD_HEIGHT/n)
-
     @staticmethod
     def brightenRGB(color):
         """Brighten an RGB color code.
@@ -400,36 +367,36 @@ class Connect4(plethoraAPI.Game):
         pygame.draw.circle(self.window, BLACK, (int(SCOREBOARD_HEIGHT/2), background.center[1]), int(SCOREBOARD_HEIGHT/2)-int(MARGIN/4), int(MARGIN/4))
 
         # Player Name
-        font_player = pygame.font.Font('freesansbold.ttf', 8*SIZE_MULTIPLIER)
-        surface_player = font_player.render('Player ' + str(self.currentPlayer), False, BLACK)
+        font_player = get_font('freesansbold.ttf', 8*SIZE_MULTIPLIER)
+        surface_player = render_text(font_player, 'Player ' + str(self.currentPlayer), False, BLACK)
         rect_player = surface_player.get_rect()
         rect_player.midleft = (status_circle.right + int(MARGIN/2), status_circle.center[1]+int(MARGIN/2))
         self.window.blit(surface_player, rect_player)
 
         # Current Player Header
-        font_cp = pygame.font.Font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
-        surface_cp = font_cp.render('Current Player:', True, BLACK)
+        font_cp = get_font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
+        surface_cp = render_text(font_cp, 'Current Player:', True, BLACK)
         rect_cp = surface_cp.get_rect()
         rect_cp.bottomleft = rect_player.topleft
         self.window.blit(surface_cp, rect_cp)
 
         # Score Header
-        font_score_header = pygame.font.Font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
-        surface_score_header = font_score_header.render('Score:', True, BLACK)
+        font_score_header = get_font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
+        surface_score_header = render_text(font_score_header, 'Score:', True, BLACK)
         rect_score_header = surface_score_header.get_rect()
         rect_score_header.topright = (GAME_WIDTH-(MARGIN*2), GAME_HEIGHT+int(MARGIN/3))
         self.window.blit(surface_score_header, rect_score_header)
 
         # Score P1
-        font_score_p1 = pygame.font.Font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
-        surface_score_p1 = font_score_p1.render('Player 1: ' + str(self.getScore(1)), True, BLACK)
+        font_score_p1 = get_font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
+        surface_score_p1 = render_text(font_score_p1, 'Player 1: ' + str(self.getScore(1)), True, BLACK)
         rect_score_p1 = surface_score_p1.get_rect()
         rect_score_p1.center = (rect_score_header.center[0], rect_score_header.center[1]+ int(SCOREBOARD_HEIGHT/4))
         self.window.blit(surface_score_p1, rect_score_p1)
 
         # Score P2
-        font_score_p2 = pygame.font.Font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
-        surface_score_p2 = font_score_p2.render('Player 2: ' + str(self.getScore(2)), True, BLACK)
+        font_score_p2 = get_font('freesansbold.ttf', 3*SIZE_MULTIPLIER)
+        surface_score_p2 = render_text(font_score_p2, 'Player 2: ' + str(self.getScore(2)), True, BLACK)
         rect_score_p2 = surface_score_p2.get_rect()
         rect_score_p2.center = (rect_score_header.center[0], rect_score_header.center[1]+ int((SCOREBOARD_HEIGHT/4)*2))
         self.window.blit(surface_score_p2, rect_score_p2)
@@ -576,15 +543,15 @@ class Connect4(plethoraAPI.Game):
         pygame.draw.rect(self.window, GREY, (MARGIN, MARGIN, GAME_WIDTH-(MARGIN*2), GAME_HEIGHT-(MARGIN*2)))
 
         # Header Message
-        font_header = pygame.font.Font('freesansbold.ttf', 16*SIZE_MULTIPLIER)
-        surface_header = font_header.render(header, True, RED)
+        font_header = get_font('freesansbold.ttf', 16*SIZE_MULTIPLIER)
+        surface_header = render_text(font_header, header, True, RED)
         rect_header = surface_header.get_rect()
         rect_header.center = (GAME_WIDTH/2, GAME_HEIGHT/4)
         self.window.blit(surface_header, rect_header)
 
         # Body Message
-        font_body = pygame.font.Font('freesansbold.ttf', 8*SIZE_MULTIPLIER)
-        surface_body = font_body.render(body, True, BLACK)
+        font_body = get_font('freesansbold.ttf', 8*SIZE_MULTIPLIER)
+        surface_body = render_text(font_body, body, True, BLACK)
         rect_body = surface_body.get_rect()
         rect_body.center = (GAME_WIDTH/2, (GAME_HEIGHT/3) + MARGIN)
         self.window.blit(surface_body, rect_body)
@@ -609,16 +576,16 @@ class Connect4(plethoraAPI.Game):
         else:
             declineColor = self.brightenRGB(declineColor)
         self.confirm_button = pygame.draw.rect(self.window, confirmColor, ((GAME_WIDTH/2)-button_width-MARGIN, (GAME_HEIGHT/4)*3, button_width, button_height))
-        font_confirm = pygame.font.Font('freesansbold.ttf', 4*SIZE_MULTIPLIER) 
-        surface_confirm = font_confirm.render(confirm, True, WHITE)
+        font_confirm = get_font('freesansbold.ttf', 4*SIZE_MULTIPLIER) 
+        surface_confirm = render_text(font_confirm, confirm, True, WHITE)
         rect_confirm = surface_confirm.get_rect()
         rect_confirm.center = self.confirm_button.center
         self.window.blit(surface_confirm, rect_confirm)
 
         # Decline Button
         self.decline_button = pygame.draw.rect(self.window, declineColor, ((GAME_WIDTH/2)+MARGIN, (GAME_HEIGHT/4)*3, button_width, button_height))
-        font_decline = pygame.font.Font('freesansbold.ttf', 4*SIZE_MULTIPLIER) 
-        surface_decline = font_decline.render(decline, True, WHITE)
+        font_decline = get_font('freesansbold.ttf', 4*SIZE_MULTIPLIER) 
+        surface_decline = render_text(font_decline, decline, True, WHITE)
         rect_decline = surface_decline.get_rect()
         rect_decline.center = self.decline_button.center
         self.window.blit(surface_decline, rect_decline)
@@ -659,10 +626,18 @@ class Connect4(plethoraAPI.Game):
         self.targetedCol = -1
         self.window.fill(BLACK)
         self.drawScoreBoard()
+        if self.grid.victor != -1:
+            self.addWinToScore(self.grid.victor)
+        self.displayGameOver()
+
+    def displayGameOver(self):
+        """Display the game over prompt for the victor of the grid.
+
+        :rtype: None
+        """
         if self.grid.victor == -1:
             self.displayCaptiveMessage('Game Over!', 'No One Wins...', "Play Again", "Exit")
         else:
-            self.addWinToScore(self.grid.victor)
             self.displayCaptiveMessage('Game Over!', 'Player ' + str(self.grid.victor) + ' Wins!', "Play Again", "Exit")
 
     def reset(self):
@@ -672,14 +647,39 @@ class Connect4(plethoraAPI.Game):
         """
         self.activeGame = True
         self.grid.reset()
-    
-    def onexit(self, *args):
-        """Exit the game, return to Plethora.
 
+    def snapshot(self):
+        """Pack the game state into a save state (see SNAPSHOT); 53 bytes.
+
+        :return: The save state.
+        :rtype: bytes
+        """
+        header = SNAPSHOT.pack(SNAPSHOT_VERSION, self.score[0], self.score[1], self.currentPlayer, self.activeGame,
+                self.captive, self.captiveKeyResponse, self.grid.victor, self.targetedCol)
+        return header + bytes(cell for col in self.grid.grid for cell in col)
+
+    def restore(self, data):
+        """Restore a save state packed by snapshot().
+
+        :param bytes data: The save state.
+        :raises ValueError: If data is not a save state of this version.
         :rtype: None
         """
-        self.resetWindow(SIZE_MULTIPLIER)
-        super().onexit()
+        if len(data) != SNAPSHOT.size + self.grid.width * self.grid.height or data[0] != SNAPSHOT_VERSION:
+            raise ValueError("not a version {} connect 4 save state".format(SNAPSHOT_VERSION))
+        (_, score1, score2, self.currentPlayer, self.activeGame, self.captive, self.captiveKeyResponse,
+                self.grid.victor, self.targetedCol) = SNAPSHOT.unpack_from(data)
+        self.score = [score1, score2]
+        cells = data[SNAPSHOT.size:]
+        height = self.grid.height
+        self.grid.grid = [list(cells[col * height:(col + 1) * height]) for col in range(self.grid.width)]
+        if self.captive:
+            # the prompt is only drawn when the game ends
+            self.window = self.display
+            self.window.fill(BLACK)
+            self.drawScoreBoard()
+            self.displayGameOver()
+        self.schedule_render(0)
 
 
 if __name__ == '__main__':
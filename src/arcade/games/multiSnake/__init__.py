@@ -1,7 +1,6 @@
-from arcade.games.multiSnake import multiSnake
-
 def get_name():
     return "Multi Snake"
 
 def insert_cartridge():
+    from arcade.games.multiSnake import multiSnake
     return multiSnake.Game()
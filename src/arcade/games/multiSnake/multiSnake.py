@@ -1,9 +1,12 @@
 import pygame
 
 from arcade import plethoraAPI
+from arcade.common.asset_manager import load_image
+from arcade.common.text_cache import render_text
 from enum import IntFlag, auto, unique
 import time
 import pathlib
+import struct
 
 from pygame.locals import (
     QUIT,
@@ -19,6 +22,14 @@ from typing import Tuple
 
 here = pathlib.Path(__file__).parent
 
+# save state (see Game.snapshot): version, startMenu, gameEndScreen, reset, select, exitGame,
+# selected, roundCount, playersLeft, playerCount and the number of snakes; then for each snake
+# SNAPSHOT_SNAKE (alive, wins, x_change, y_change, length) followed by its grid coordinates as
+# pairs of int16
+SNAPSHOT_VERSION = 1
+SNAPSHOT = struct.Struct("<B?????bBbBB")
+SNAPSHOT_SNAKE = struct.Struct("<?BbbH")
+
 
 @unique
 class ArrowMask(IntFlag):
@@ -34,7 +45,7 @@ class Game(plethoraAPI.Game):
         def __init__(self, x, y, blockSize, color="green", name=""):
             self.coords=[(x,y)]
             self.gridCoords = [(x/10, y/10)]
-            self.snakeBlock = pygame.image.load(str(here/f'images/{color}Snake.png'))
+            self.snakeBlock = load_image(here/f'images/{color}Snake.png')
             if (color=="green"):
                 self.color = (34,177,76)
             elif (color=="red"):
@@ -79,7 +90,7 @@ class Game(plethoraAPI.Game):
         self.blockSize = 10
         self.playersLeft = 5
         self.render = False
-        self.logo = self.snakeBlock = pygame.image.load(str(here/'images/multiSnakeLogo.png'))
+        self.logo = self.snakeBlock = load_image(here/'images/multiSnakeLogo.png')
         self.startMenu = True
         self.gameEndScreen = False
         self.roundCount = 0
@@ -208,9 +219,9 @@ class Game(plethoraAPI.Game):
             for i in range(len(self.playerSelectBox)):
                 pygame.draw.rect(self.display, (205, 205, 210) if self.selected == i else (50, 50, 50), self.playerSelectBox[i])
                 if (i==3):
-                    self.display.blit(self.biggerFont.render(('Back to Menu'), True, (50,205,50)), (self.playerSelectBox[i][0]+75, self.playerSelectBox[i][1]+19))
+                    self.display.blit(render_text(self.biggerFont, ('Back to Menu'), True, (50,205,50)), (self.playerSelectBox[i][0]+75, self.playerSelectBox[i][1]+19))
                 else:
-                    self.display.blit(self.biggerFont.render((str(i+2)+' Players'), True, (50,205,50)), (self.playerSelectBox[i][0]+39, self.playerSelectBox[i][1]+19))
+                    self.display.blit(render_text(self.biggerFont, (str(i+2)+' Players'), True, (50,205,50)), (self.playerSelectBox[i][0]+39, self.playerSelectBox[i][1]+19))
             if (self.select and self.selected != 3):
                 self.initializePlayers(self.selected+2)
                 self.startMenu = False
@@ -269,7 +280,7 @@ class Game(plethoraAPI.Game):
                 displayName = list(displayName)[0]
                 winner = self.players.index(displayName)            
                 self.players[winner].wins += 1                
-                self.display.blit(self.biggerFont.render((displayName.name+' Won'), True, displayName.color), (self.rect.width/2 - 85, 100))
+                self.display.blit(render_text(self.biggerFont, (displayName.name+' Won'), True, displayName.color), (self.rect.width/2 - 85, 100))
             elif(self.gameEndScreen):
                 winner = [self.players[0]]
                 for player in self.players:
@@ -278,17 +289,17 @@ class Game(plethoraAPI.Game):
                     elif(player.wins == winner[0].wins):
                         winner.append(player)
                 if (len(winner) == 1):
-                    self.display.blit(self.biggerFont.render((winner[0].name + ' Wins!'), True, (255,255,255)), (self.rect.width/2 - 85, 100))
+                    self.display.blit(render_text(self.biggerFont, (winner[0].name + ' Wins!'), True, (255,255,255)), (self.rect.width/2 - 85, 100))
                 else:
-                    self.display.blit(self.biggerFont.render(('Draw'), True, (255,255,255)), (self.rect.width/2 - 40, 100))
+                    self.display.blit(render_text(self.biggerFont, ('Draw'), True, (255,255,255)), (self.rect.width/2 - 40, 100))
                 
                 
                     
 
             else:
-                self.display.blit(self.biggerFont.render(('Draw'), True, (255,255,255)), (self.rect.width/2 - 40, 100))
+                self.display.blit(render_text(self.biggerFont, ('Draw'), True, (255,255,255)), (self.rect.width/2 - 40, 100))
             for i, player in enumerate(self.players):
-                self.display.blit(self.biggerFont.render((player.name+'    '+str(player.wins)), True, player.color), (self.rect.width/2 - 75, 190+(i*90)))
+                self.display.blit(render_text(self.biggerFont, (player.name+'    '+str(player.wins)), True, player.color), (self.rect.width/2 - 75, 190+(i*90)))
 
             self.reset = True
 
@@ -296,3 +307,45 @@ class Game(plethoraAPI.Game):
         return True
 
  
+
+    def snapshot(self):
+        data = [SNAPSHOT.pack(SNAPSHOT_VERSION, self.startMenu, self.gameEndScreen, self.reset, self.select,
+                self.exitGame, self.selected, self.roundCount, self.playersLeft, self.playerCount, len(self.players))]
+        for player in self.players:
+            length = len(player.gridCoords)
+            data.append(SNAPSHOT_SNAKE.pack(player.alive, player.wins, player.x_change, player.y_change, length))
+            data.append(struct.pack("<{}h".format(length * 2), *(int(c) for xy in player.gridCoords for c in xy)))
+        return b"".join(data)
+
+    def restore(self, data):
+        try:
+            header = SNAPSHOT.unpack_from(data)
+            if header[0] != SNAPSHOT_VERSION:
+                raise ValueError()
+            snakes = []
+            offset = SNAPSHOT.size
+            for _ in range(header[-1]):
+                snake = SNAPSHOT_SNAKE.unpack_from(data, offset)
+                offset += SNAPSHOT_SNAKE.size
+                coords = struct.unpack_from("<{}h".format(snake[-1] * 2), data, offset)
+                offset += snake[-1] * 4
+                snakes.append((snake, list((float(x), float(y)) for x, y in zip(coords[::2], coords[1::2]))))
+            if offset != len(data):
+                raise ValueError()
+        except (struct.error, ValueError):
+            raise ValueError("not a version {} multiSnake save state".format(SNAPSHOT_VERSION))
+        (_, self.startMenu, self.gameEndScreen, self.reset, self.select, self.exitGame, self.selected,
+                self.roundCount, playersLeft, playerCount, count) = header
+        if len(self.players) != count:
+            self.initializePlayers(count)
+        self.playersLeft = playersLeft
+        self.playerCount = playerCount
+        self.spaceTaken = set()
+        for player, (fields, gridCoords) in zip(self.players, snakes):
+            player.alive, player.wins, player.x_change, player.y_change, _ = fields
+            player.gridCoords = gridCoords
+            player.coords = list((x * self.blockSize, y * self.blockSize) for x, y in gridCoords)
+            self.spaceTaken.update(gridCoords)
+        # snakes are drawn incrementally; start over from a blank screen
+        self.display.fill(self.black)
+        self.schedule_render(0)
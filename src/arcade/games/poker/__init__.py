@@ -1,7 +1,6 @@
-from arcade.games.poker import poker
-
 def get_name():
     return "Poker"
 
 def insert_cartridge():
+    from arcade.games.poker import poker
     return poker.Game()
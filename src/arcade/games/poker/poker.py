@@ -2,6 +2,8 @@ import random
 
 import pygame
 from arcade import plethoraAPI
+from arcade.common.asset_manager import load_image
+from arcade.common.text_cache import render_text
 from enum import IntFlag, auto, unique
 import json
 
@@ -41,8 +43,7 @@ class Game(plethoraAPI.Game):
         for i in range(numNPC):
             self.npc.append(self.playerOrNpc("NPC "+str(i), None, 500))
             self.deck.append(self.npc[i].hand)
-        self.cardBack = pygame.image.load(str(IMAGES/'cards/back.png'))
-        self.cardBack = pygame.transform.scale(self.cardBack, (86, 120))
+        self.cardBack = load_image(IMAGES/'cards/back.png', (86, 120))
         self.betBoxFont = pygame.font.SysFont('Arial', 18)
         self.smallFont = pygame.font.SysFont('Arial', 25)
         self.biggerFont = pygame.font.SysFont('Arial', 30)
@@ -89,7 +90,9 @@ class Game(plethoraAPI.Game):
         self.letterButton = (self.rect.width/2-355,325,40,40)
         self.letterUnderline = (self.rect.width/2-295,175,80,2)
 
-        self.scoreData = self.readScores()
+        # loaded in the background; None until then
+        self.scoreData = None
+        self.run_in_executor(self.readScores, callback=self.scoresLoaded)
         self.leaderboardNameBox = (75,70,520,75)
         self.quitNextClick = False
         
@@ -242,8 +245,19 @@ class Game(plethoraAPI.Game):
     def readScores(self):
         with open('leaderboard.txt') as json_file:
             return json.load(json_file)
+
+    def scoresLoaded(self, scoreData):
+        if self.scoreData is None:
+            self.scoreData = scoreData
+
+    def writeScores(self, text):
+        with open('leaderboard.txt', 'w') as json_file:
+            json_file.write(text)
     
     def recordName(self):
+        if self.scoreData is None:
+            # still loading
+            self.scoreData = self.readScores()
         if (self.scoreData['poker_high_scores'][-1]['score'] <= self.player.money):
             if (len(self.scoreData['poker_high_scores']) > 4):
                 del self.scoreData['poker_high_scores'][-1]
@@ -252,8 +266,7 @@ class Game(plethoraAPI.Game):
                 'score' : self.player.money
             })
             self.scoreData['poker_high_scores'] = sorted(self.scoreData['poker_high_scores'], key=lambda x: x['score'])
-            with open('leaderboard.txt', 'w') as json_file:
-                json.dump(self.scoreData, json_file)
+            self.run_in_executor(self.writeScores, json.dumps(self.scoreData))
         self.nameDisplayScreen = True
 
     def newGame(self):
@@ -383,13 +396,13 @@ class Game(plethoraAPI.Game):
 
         #Create the UI on the right side of the screen
         pygame.draw.rect(self.display, (193, 193, 199),(self.rect.width-190,80,180,50))
-        self.display.blit(self.biggerFont.render(('$'+str(self.player.money)), True, (0,0,0)), (self.rect.width-140, 90))
+        self.display.blit(render_text(self.biggerFont, ('$'+str(self.player.money)), True, (0,0,0)), (self.rect.width-140, 90))
         pygame.draw.rect(self.display, (193, 193, 199),(self.rect.width-183,200,145,45))
-        self.display.blit(self.smallFont.render(('$'+str(self.pendingWager)), True, (255,0,0)), (self.rect.width-132, 210))
+        self.display.blit(render_text(self.smallFont, ('$'+str(self.pendingWager)), True, (255,0,0)), (self.rect.width-132, 210))
         pygame.draw.rect(self.display, (112, 61, 34),self.plusButton)
-        self.display.blit(self.smallFont.render(('+'), True, (245, 245, 66)), (self.rect.width-28, 197))
+        self.display.blit(render_text(self.smallFont, ('+'), True, (245, 245, 66)), (self.rect.width-28, 197))
         pygame.draw.rect(self.display, (112, 61, 34),(self.minusButton))
-        self.display.blit(self.smallFont.render(('-'), True, (245, 245, 66)), (self.rect.width-25, 218))
+        self.display.blit(render_text(self.smallFont, ('-'), True, (245, 245, 66)), (self.rect.width-25, 218))
 
         self.betBoxLocations = [(12,140,130,80), (self.rect.width-365,140,130,80),
         (12,380,130,80), (self.rect.width-365,380,130,80)]
@@ -397,19 +410,19 @@ class Game(plethoraAPI.Game):
         for i in range(len(self.npc)+1):
             displayPlayer = self.npc[i] if i != len(self.npc) else self.player
             pygame.draw.rect(self.display, (205, 205, 210) if self.select[0] else (143, 143, 149), self.betBoxLocations[i])
-            self.display.blit(self.betBoxFont.render('Last Bet', True, (0,0,0)),  (self.betBoxLocations[i][0]+30, self.betBoxLocations[i][1]+15))
-            self.display.blit(self.betBoxFont.render('$'+displayPlayer.lastWager, True, (0,0,0)), (self.betBoxLocations[i][0]+39, self.betBoxLocations[i][1]+40))
+            self.display.blit(render_text(self.betBoxFont, 'Last Bet', True, (0,0,0)),  (self.betBoxLocations[i][0]+30, self.betBoxLocations[i][1]+15))
+            self.display.blit(render_text(self.betBoxFont, '$'+displayPlayer.lastWager, True, (0,0,0)), (self.betBoxLocations[i][0]+39, self.betBoxLocations[i][1]+40))
         
 
 
         pygame.draw.rect(self.display, (205, 205, 210) if self.select[0] else (143, 143, 149),(self.rect.width-180,280,160,40))
-        self.display.blit(self.smallFont.render('Check', True, (0,0,0)), (self.rect.width-127, 285))
+        self.display.blit(render_text(self.smallFont, 'Check', True, (0,0,0)), (self.rect.width-127, 285))
         pygame.draw.rect(self.display, (205, 205, 210) if self.select[1] else (143, 143, 149),(self.rect.width-180,340,160,40))
-        self.display.blit(self.smallFont.render('Bet', True, (0,0,0)), (self.rect.width-127, 345))
+        self.display.blit(render_text(self.smallFont, 'Bet', True, (0,0,0)), (self.rect.width-127, 345))
         pygame.draw.rect(self.display, (205, 205, 210) if self.select[2] else (143, 143, 149),(self.rect.width-180,400,160,40))
-        self.display.blit(self.smallFont.render('Fold', True, (0,0,0)), (self.rect.width-127, 405))
+        self.display.blit(render_text(self.smallFont, 'Fold', True, (0,0,0)), (self.rect.width-127, 405))
         pygame.draw.rect(self.display, (205, 205, 210) if self.select[2] else (143, 143, 149),(self.rect.width-180,460,160,40))
-        self.display.blit(self.smallFont.render('Back to Menu', True, (0,0,0)), (self.rect.width-177, 465))
+        self.display.blit(render_text(self.smallFont, 'Back to Menu', True, (0,0,0)), (self.rect.width-177, 465))
         
         rerender = False
         rerender = bool(arrows)  # return True if an arrow key is down; otherwise False
@@ -435,56 +448,56 @@ class Game(plethoraAPI.Game):
             pygame.draw.rect(self.display, (0, 0, 0),(self.rect.width/2 - 200,280,200,45))
             displayName = ""
             if (len(winner)> 1):
-                self.display.blit(self.smallFont.render(('Split'), True, (255,0,0)), (self.rect.width/2 - 130, 287))
+                self.display.blit(render_text(self.smallFont, ('Split'), True, (255,0,0)), (self.rect.width/2 - 130, 287))
             else:
                 for name in winner:
                     displayName += name.name + ' '
-                self.display.blit(self.smallFont.render((displayName+' Won'), True, (255,0,0)), (self.rect.width/2 - 169, 287))
+                self.display.blit(render_text(self.smallFont, (displayName+' Won'), True, (255,0,0)), (self.rect.width/2 - 169, 287))
         
         if(self.exitWarningScreen):
             pygame.draw.rect(self.display, (0,0,0),self.exitWarningScreenBox)
-            self.display.blit(self.smallFont.render('Quit game', True, (237,28,36)), (self.exitWarningScreenBoxText))
-            self.display.blit(self.smallFont.render('with this score?', True, (237,28,36)), (self.exitWarningScreenBoxText[0]-20, self.exitWarningScreenBoxText[1]+30))
+            self.display.blit(render_text(self.smallFont, 'Quit game', True, (237,28,36)), (self.exitWarningScreenBoxText))
+            self.display.blit(render_text(self.smallFont, 'with this score?', True, (237,28,36)), (self.exitWarningScreenBoxText[0]-20, self.exitWarningScreenBoxText[1]+30))
             pygame.draw.rect(self.display, (34,177,76),self.confirmExitButton)
-            self.display.blit(self.smallFont.render('Yes', True, (255,255,255)), (self.confirmExitButton[0]+20, self.confirmExitButton[1]+5))
+            self.display.blit(render_text(self.smallFont, 'Yes', True, (255,255,255)), (self.confirmExitButton[0]+20, self.confirmExitButton[1]+5))
             pygame.draw.rect(self.display, (237,28,36),self.rejectExitButton)
-            self.display.blit(self.smallFont.render('No', True, (255,255,255)), (self.rejectExitButton[0]+25, self.rejectExitButton[1]+5))
+            self.display.blit(render_text(self.smallFont, 'No', True, (255,255,255)), (self.rejectExitButton[0]+25, self.rejectExitButton[1]+5))
 
     
         if(self.enterNameScreen):
             pygame.draw.rect(self.display, (0,0,0),self.enterNameBox)
-            self.display.blit(self.smallFont.render('Enter your name for the leaderboard', True, (237,28,36)), (self.exitWarningScreenBoxText[0]-75, self.exitWarningScreenBoxText[1]+30))
+            self.display.blit(render_text(self.smallFont, 'Enter your name for the leaderboard', True, (237,28,36)), (self.exitWarningScreenBoxText[0]-75, self.exitWarningScreenBoxText[1]+30))
             for i in range(len(self.currentLeaderName)+1):
                 if (i < 4):
                     pygame.draw.rect(self.display, (237,28,36), (self.letterUnderline[0] + (125 * i), self.letterUnderline[1], self.letterUnderline[2],self.letterUnderline[3]))
                 if (i < len(self.currentLeaderName)):
-                    self.display.blit(self.leaderFont.render(self.currentLeaderName[i].title(), True, (237,28,36)), (self.letterUnderline[0] + 20 + (125 * i), self.letterUnderline[1]-75))
+                    self.display.blit(render_text(self.leaderFont, self.currentLeaderName[i].title(), True, (237,28,36)), (self.letterUnderline[0] + 20 + (125 * i), self.letterUnderline[1]-75))
             for i, letter in enumerate(self.rowOne):
                 pygame.draw.rect(self.display, (237,28,36), (self.letterButton[0] + (60 * i), self.letterButton[1], self.letterButton[2],self.letterButton[3]))
-                self.display.blit(self.smallFont.render(letter.title(), True, (0,0,0)), (self.letterButton[0] + 12 + (60 * i), self.letterButton[1]+5))
+                self.display.blit(render_text(self.smallFont, letter.title(), True, (0,0,0)), (self.letterButton[0] + 12 + (60 * i), self.letterButton[1]+5))
             for i, letter in enumerate(self.rowTwo):
                 if (letter == 'DEL'):
                     pygame.draw.rect(self.display, (237,28,36), (self.letterButton[0] + (60 * i), self.letterButton[1]+80, self.letterButton[2]+25,self.letterButton[3]))
-                    self.display.blit(self.smallFont.render(letter.title(), True, (0,0,0)), (self.letterButton[0] + 12 + (60 * i), self.letterButton[1]+85))
+                    self.display.blit(render_text(self.smallFont, letter.title(), True, (0,0,0)), (self.letterButton[0] + 12 + (60 * i), self.letterButton[1]+85))
                 else:
                     pygame.draw.rect(self.display, (237,28,36), (self.letterButton[0] + (60 * i), self.letterButton[1]+80, self.letterButton[2],self.letterButton[3]))
-                    self.display.blit(self.smallFont.render(letter.title(), True, (0,0,0)), (self.letterButton[0] + 12 + (60 * i), self.letterButton[1]+85))
+                    self.display.blit(render_text(self.smallFont, letter.title(), True, (0,0,0)), (self.letterButton[0] + 12 + (60 * i), self.letterButton[1]+85))
             for i, letter in enumerate(self.rowThree):
                 if (letter == 'DONE'):
                     pygame.draw.rect(self.display, (237,28,36), (self.letterButton[0] + 40 + (60 * i), self.letterButton[1]+160, self.letterButton[2]+40, self.letterButton[3]))
-                    self.display.blit(self.smallFont.render(letter.title(), True, (0,0,0)), (self.letterButton[0] + 52 + (60 * i), self.letterButton[1]+163))
+                    self.display.blit(render_text(self.smallFont, letter.title(), True, (0,0,0)), (self.letterButton[0] + 52 + (60 * i), self.letterButton[1]+163))
                 else:
                     pygame.draw.rect(self.display, (237,28,36), (self.letterButton[0] + 40 + (60 * i), self.letterButton[1]+160, self.letterButton[2], self.letterButton[3]))
-                    self.display.blit(self.smallFont.render(letter.title(), True, (0,0,0)), (self.letterButton[0] + 52 + (60 * i), self.letterButton[1]+163))
+                    self.display.blit(render_text(self.smallFont, letter.title(), True, (0,0,0)), (self.letterButton[0] + 52 + (60 * i), self.letterButton[1]+163))
 
         
         if(self.nameDisplayScreen):
             pygame.draw.rect(self.display, (0,0,0),self.enterNameBox)
             for i, player in enumerate(self.scoreData['poker_high_scores']):
                 pygame.draw.rect(self.display, (237,28,36),(self.leaderboardNameBox[0], self.leaderboardNameBox[1]+ (100 * i), self.leaderboardNameBox[2], self.leaderboardNameBox[3]))
-                self.display.blit(self.biggerFont.render('#'+str(i+1)+'  ' + player['name'].capitalize(),
+                self.display.blit(render_text(self.biggerFont, '#'+str(i+1)+'  ' + player['name'].capitalize(),
                 True, (0,0,0)), (self.leaderboardNameBox[0] + 100 , self.leaderboardNameBox[1] + 12 + (100 * i)))
-                self.display.blit(self.biggerFont.render('$' + str(player['score']),
+                self.display.blit(render_text(self.biggerFont, '$' + str(player['score']),
                 True, (0,0,0)), (self.leaderboardNameBox[0] + 300 , self.leaderboardNameBox[1] + 12 + (100 * i)))
             self.quitNextClick = True
 
@@ -631,8 +644,7 @@ class Game(plethoraAPI.Game):
                 else:
                     self.name = cardName
                     self.suit = suit
-                self.image = pygame.image.load(str(IMAGES/f'cards/{self.name}_of_{self.suit}.png'))
-                self.image = pygame.transform.scale(self.image, (86, 120))
+                self.image = load_image(IMAGES/f'cards/{self.name}_of_{self.suit}.png', (86, 120))
             
         
             def randomCard(self, deck={}):
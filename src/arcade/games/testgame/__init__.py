@@ -1,7 +1,6 @@
-from arcade.games.testgame import testgame
-
 def get_name():
     return "test game"
 
 def insert_cartridge():
+    from arcade.games.testgame import testgame
     return testgame.Game()
@@ -1,7 +1,6 @@
-from arcade.games.tetris import tetris
-
 def get_name():
     return "Tetris"
 
 def insert_cartridge():
+    from arcade.games.tetris import tetris
     return tetris.Game()
@@ -1,12 +1,14 @@
 
 from arcade import plethoraAPI
+from arcade.common.text_cache import get_font, render_text
 from collections import namedtuple
 from enum import Enum
-from functools import partial
+from functools import lru_cache, partial
 from math import floor
 from random import randint
 import pathlib
 import pygame
+import struct
 
 # border width
 BORDER = 10
@@ -40,15 +42,12 @@ STAGE_BACKGROUND = (100, 100, 100)
 # color for slender right-part of stage (margin)
 STAGE_MARGIN_COLOR = (60, 60, 60)
 
-# stage inner rect for blitting to STAGE_SURF; coordinates local to STAGE_SURF
+# stage inner rect for blitting to the stage surface; coordinates local to it
 STAGE_INNER_RECT = pygame.Rect(0, 0, 4 * SQUARE_DIM + 2 * BORDER, DISPLAY_HEIGHT)
 
 # stage rect for use in onrender; coordinates global to Game#display.rect
 STAGE_RECT = pygame.Rect(BORDER, BORDER, STAGE_INNER_RECT.width + STAGE_MARGIN, DISPLAY_HEIGHT - 2 * BORDER)
 
-# the staging area; aka: the stage
-STAGE_SURF = pygame.Surface(STAGE_RECT.size)
-
 # size of entire display
 DISPLAY_SIZE = (BORDER + SQUARE_DIM * PLAY_SIZE[0] + STAGE_RECT.width + STAGE_MARGIN,
         DISPLAY_HEIGHT)
@@ -57,10 +56,7 @@ DISPLAY_SIZE = (BORDER + SQUARE_DIM * PLAY_SIZE[0] + STAGE_RECT.width + STAGE_MA
 PLAY_RECT = pygame.Rect(BORDER + STAGE_RECT.width, BORDER,
         DISPLAY_SIZE[0] - STAGE_RECT.width - 2 * BORDER, DISPLAY_HEIGHT - 2 * BORDER)
 
-# use this to draw the play area
-PLAY_SURF = pygame.Surface(PLAY_RECT.size)
-
-# should run at 60 fps:
+# should run at 60 fps; game logic also runs at 60 ticks/sec, so gravity (self.G) is in rows/tick:
 # https://tetris.fandom.com/wiki/TGM_legend#Frame
 FPS = 60
 
@@ -74,20 +70,31 @@ ROOT = pathlib.Path(plethoraAPI.__file__).parent
 # frames to wait when counting down in beginning
 BEGIN_COUNT_FRAMES = 60
 
-# font to use for count in beginning
-BIG_FONT = pygame.font.Font(str(ROOT/"fonts/exo/Exo-Regular.ttf"), 50)
+# fonts and surfaces below are created on first use, so importing this module does not touch SDL
+FONT_PATH = ROOT/"fonts/exo/Exo-Regular.ttf"
+
+def big_font():
+    """ font to use for count in beginning
+    """
+    return get_font(FONT_PATH, 50)
+
+def small_font():
+    """ font for buttons in end game
+    """
+    return get_font(FONT_PATH, 30)
 
-# font for buttons in end game
-SMALL_FONT = pygame.font.Font(str(ROOT/"fonts/exo/Exo-Regular.ttf"), 30)
+def tiny_font():
+    """ font for text in game
+    """
+    return get_font(FONT_PATH, 18)
 
-# font for text in game
-TINY_FONT = pygame.font.Font(str(ROOT/"fonts/exo/Exo-Regular.ttf"), 18)
+# numbers in the countdown
+COUNT_FROM = 3
 
-# each number in the countdown
-COUNTS = [
-    BIG_FONT.render(str(i), True, (255, 255, 255))
-    for i in range(1, 4)
-]
+def count_surf(i):
+    """ number ``i`` of the countdown
+    """
+    return render_text(big_font(), str(i), True, (255, 255, 255))
 
 TETROMINO_COLORS = {
     "I": (25, 225, 225),
@@ -136,6 +143,7 @@ TETROMINOS = {
           "----"],
 }
 
+@lru_cache(maxsize=None)
 def _make_tetromino_border(borderwidth, borderoff):
     """ semi-transparent border for tetrominos
     """
@@ -166,7 +174,9 @@ def _make_tetromino_border(borderwidth, borderoff):
     top = SQUARE_DIM - borderwidth - borderoff
     surf.fill((1, 1, 1), (left, top, width, height))
     return surf
-TETROMINO_BORDER = _make_tetromino_border(borderoff=1, borderwidth=4)
+
+def tetromino_border():
+    return _make_tetromino_border(borderoff=1, borderwidth=4)
 
 def get_tetromino_surf():
     surf = pygame.Surface((SQUARE_DIM * 4, SQUARE_DIM * 4))
@@ -184,6 +194,13 @@ KARROW_INC = 1  # must be >0
 
 BoundSq = namedtuple("BoundSq", "left top right bottom")
 
+# save state (see Game.snapshot): version, state, begin_count, begin_count_tick, arrows, lr_hide,
+# karrow_count, space, current tetromino type (0 for none) and rotation, curt_x, curt_y, score, G,
+# linesCleared and the queue length; followed by the queued types (a byte each) and the filled
+# matrix (a character per square)
+SNAPSHOT_VERSION = 1
+SNAPSHOT = struct.Struct("<BBbHBBb?BBbdIdIB")
+
 def have_collision(matrix1, matrix2):
     for l1, l2 in zip(matrix1, matrix2):
         for c1, c2 in zip(l1, l2):
@@ -218,6 +235,10 @@ class Tetromino:
         self.name = ttype.name
         self.color = ttype.color
         self.mask = ttype.mask.copy()
+        self.rotation = 0
+        for _ in range(rotation % 4):
+            self.mask = list(''.join(rl) for rl in zip(*reversed(self.mask)))
+            self.rotation += 1
         self.surf = get_tetromino_surf()
         self._draw_surf()
 
@@ -228,6 +249,7 @@ class Tetromino:
         """
         for _ in range(times % 4):
             self.mask = list(''.join(rl) for rl in zip(*reversed(self.mask)))
+            self.rotation = (self.rotation + 1) % 4
             self._draw_surf()
 
     def lrotate(self, times=1):
@@ -237,6 +259,7 @@ class Tetromino:
         """
         for _ in range(times % 4):
             self.mask = list(reversed(list(''.join(rl) for rl in zip(*self.mask))))
+            self.rotation = (self.rotation - 1) % 4
             self._draw_surf()
 
     def _draw_surf(self):
@@ -251,7 +274,7 @@ class Tetromino:
             for x, char in enumerate(line):
                 if char == "x":
                     self.surf.fill(self.color, rect)
-                    self.surf.blit(TETROMINO_BORDER, rect)
+                    self.surf.blit(tetromino_border(), rect)
                     if x < left:
                         left = x
                     if x > right:
@@ -274,7 +297,11 @@ class Game(plethoraAPI.Game):
     """ Tetris game for plethora API
     """
     def __init__(self):
-        super().__init__(size=DISPLAY_SIZE, fps=FPS)
+        super().__init__(size=DISPLAY_SIZE, fps=FPS, tickrate=FPS)
+        # the staging area; aka: the stage
+        self.stage_surf = pygame.Surface(STAGE_RECT.size)
+        # use this to draw the play area
+        self.play_surf = pygame.Surface(PLAY_RECT.size)
         self.start()
 
     def start(self):
@@ -282,7 +309,7 @@ class Game(plethoraAPI.Game):
         self.lr_hide = 0b0000  # mask for left/right
         self.karrow_count = 0  # frame count for left/right arrows
         self.locked = [None] * (PLAY_SIZE[0] * PLAY_SIZE[1])  # all locked colors
-        self.begin_count = len(COUNTS) - 1  # countdown from 3 in beginning
+        self.begin_count = COUNT_FROM - 1  # countdown from 3 in beginning
         self.begin_count_tick = 0 # wait BEGIN_COUNT_FRAMES frames
         self.state = 0            # {0,1,3} = {begin,play,end}
         self.curt = None          # current tetromino
@@ -301,11 +328,11 @@ class Game(plethoraAPI.Game):
         self.linesCleared = 0     # how many lines are cleared (linesCleared//10 == level)
         self.score = 0            # score
         # text
-        self.linesClearedText = TINY_FONT.render("Lines Cleared:", True, (255, 255, 255))
+        self.linesClearedText = render_text(tiny_font(), "Lines Cleared:", True, (255, 255, 255))
         self.linesClearedWidth = self.linesClearedText.get_width()
-        self.scoreText = TINY_FONT.render("Score:", True, (255, 255, 255))
+        self.scoreText = render_text(tiny_font(), "Score:", True, (255, 255, 255))
         self.scoreWidth = self.scoreText.get_width()
-        self.levelText = TINY_FONT.render("Level:", True, (255, 255, 255))
+        self.levelText = render_text(tiny_font(), "Level:", True, (255, 255, 255))
         self.levelWidth = self.levelText.get_width()
         # buttons
         self.again_btn = plethoraAPI.UIButton(
@@ -313,7 +340,7 @@ class Game(plethoraAPI.Game):
             y=PLAY_RECT.centery + 20,
             text="Play Again",
             callback=self._play_again_click,
-            font=SMALL_FONT,
+            font=small_font(),
             fontColor=(0, 0, 0),
             background=(255, 255, 255))
         self.again_btn.rect.right = PLAY_RECT.centerx - 20
@@ -322,11 +349,11 @@ class Game(plethoraAPI.Game):
             y=PLAY_RECT.centery + 20,
             text="Quit",
             callback=self._quit_click,
-            font=SMALL_FONT,
+            font=small_font(),
             fontColor=(0, 0, 0),
             background=(255, 255, 255))
         # fill staging area so it is not black for intro
-        STAGE_SURF.fill(GAME_COLOR)
+        self.stage_surf.fill(GAME_COLOR)
 
 
     def _has_collision(self, y=None):
@@ -435,7 +462,6 @@ class Game(plethoraAPI.Game):
             while self._has_collision():
                 self.curt_y -= 1
             self.state += 1
-            self._render_surfs()
             return
 
     def _delete_lines_from(self, fromy):
@@ -453,25 +479,37 @@ class Game(plethoraAPI.Game):
                 linesCleared += 1
         return linesCleared
 
+    def onupdate(self, dt):
+        if self.state == 0:
+            self._update_intro()
+        elif self.state == 1:
+            self._update_game()
+        else:
+            return False
+        return True
+
     def onrender(self):
         if self.state == 0:
             self._render_intro()
         elif self.state == 1:
-            self._render_game()
+            self._render_surfs()
         else:
+            # draw the final board under the game over text
+            self._render_surfs()
             self._render_end()
             return False
         return True
 
     def _render_intro(self):
-        if self.begin_count_tick == 0:
-            self.display.fill(BACKGROUND_COLOR)
-            self.display.blit(STAGE_SURF, STAGE_RECT)
-            self.display.fill(GAME_COLOR, PLAY_RECT)
-            count = COUNTS[self.begin_count]
-            center = (self.rect.centerx - count.get_width() // 2 - 1,
-                    self.rect.centery - count.get_height() // 2 - 1)
-            self.display.blit(count, center)
+        self.display.fill(BACKGROUND_COLOR)
+        self.display.blit(self.stage_surf, STAGE_RECT)
+        self.display.fill(GAME_COLOR, PLAY_RECT)
+        count = count_surf(self.begin_count + 1)
+        center = (self.rect.centerx - count.get_width() // 2 - 1,
+                self.rect.centery - count.get_height() // 2 - 1)
+        self.display.blit(count, center)
+
+    def _update_intro(self):
         self.begin_count_tick += 1
         if self.begin_count_tick > BEGIN_COUNT_FRAMES:
             self.begin_count -= 1
@@ -491,7 +529,7 @@ class Game(plethoraAPI.Game):
         if self._has_collision():
             self.curt_x -= 1
 
-    def _render_game(self):
+    def _update_game(self):
         arrows = self.arrows & ~self.lr_hide  # get unmasked arrows
         softDrop = bool(arrows & M_DOWN)  # True if soft dropping
         hardDrop = False
@@ -545,7 +583,6 @@ class Game(plethoraAPI.Game):
                     level = self.linesCleared // 10
                     self.score += [40, 100, 300, 1200][linesCleared - 1] * (level + 1)
                     self._new_tetronimo()
-                    self._render_surfs()
                     # if lines cleared; increase speed slightly
                     self.G += 0.002 * linesCleared
                     return
@@ -554,56 +591,55 @@ class Game(plethoraAPI.Game):
                 if hardDrop:
                     self.score += 2
 
-        # increase current tetromino y and render surfaces
+        # increase current tetromino y
         self.curt_y += drop
-        self._render_surfs()
 
     def _render_surfs(self):
         self.display.fill(BACKGROUND_COLOR)
         # set up stage area
-        STAGE_SURF.fill(STAGE_MARGIN_COLOR)
-        STAGE_SURF.fill(STAGE_BACKGROUND, STAGE_INNER_RECT)
+        self.stage_surf.fill(STAGE_MARGIN_COLOR)
+        self.stage_surf.fill(STAGE_BACKGROUND, STAGE_INNER_RECT)
         for y, t in enumerate(self.queue):
-            STAGE_SURF.blit(t.surf, (BORDER + (3 - t.boundsq.right) * SQUARE_DIM, y * (SQUARE_DIM * 4 + BORDER)))
+            self.stage_surf.blit(t.surf, (BORDER + (3 - t.boundsq.right) * SQUARE_DIM, y * (SQUARE_DIM * 4 + BORDER)))
         x = 2
         # lines cleared
         y = SQUARE_DIM * 12 + 40
-        score = TINY_FONT.render(str(self.score), True, (255, 255, 255))
-        STAGE_SURF.blit(self.scoreText, (x, y))
-        STAGE_SURF.blit(score, (x + self.scoreWidth + 2, y))
+        score = render_text(tiny_font(), str(self.score), True, (255, 255, 255))
+        self.stage_surf.blit(self.scoreText, (x, y))
+        self.stage_surf.blit(score, (x + self.scoreWidth + 2, y))
         # score
         y += 30
-        linesCleared = TINY_FONT.render(str(self.linesCleared), True, (255, 255, 255))
-        STAGE_SURF.blit(self.linesClearedText, (x, y))
-        STAGE_SURF.blit(linesCleared, (x + self.linesClearedWidth + 2, y))
+        linesCleared = render_text(tiny_font(), str(self.linesCleared), True, (255, 255, 255))
+        self.stage_surf.blit(self.linesClearedText, (x, y))
+        self.stage_surf.blit(linesCleared, (x + self.linesClearedWidth + 2, y))
         # level
         y += 30
-        level = TINY_FONT.render(str(self.linesCleared // 10), True, (255, 255, 255))
-        STAGE_SURF.blit(self.levelText, (x, y))
-        STAGE_SURF.blit(level, (x + self.levelWidth + 2, y))
-        self.display.blit(STAGE_SURF, STAGE_RECT)
+        level = render_text(tiny_font(), str(self.linesCleared // 10), True, (255, 255, 255))
+        self.stage_surf.blit(self.levelText, (x, y))
+        self.stage_surf.blit(level, (x + self.levelWidth + 2, y))
+        self.display.blit(self.stage_surf, STAGE_RECT)
         # setup play area
-        PLAY_SURF.fill(GAME_COLOR)
+        self.play_surf.fill(GAME_COLOR)
         x = self.curt_x * SQUARE_DIM
         y = floor(self.curt_y) * SQUARE_DIM
-        PLAY_SURF.blit(self.curt.surf, (x, y))
+        self.play_surf.blit(self.curt.surf, (x, y))
         sqrect = pygame.Rect(0, 0, SQUARE_DIM, SQUARE_DIM)
         for y, line in enumerate(self.filled):
             for x, char in enumerate(line):
                 if char == "-":
                     continue
                 sqrect.topleft = x * SQUARE_DIM, y * SQUARE_DIM
-                PLAY_SURF.fill(TETROMINO_COLORS[char], sqrect)
-                PLAY_SURF.blit(TETROMINO_BORDER, sqrect)
-        self.display.blit(PLAY_SURF, PLAY_RECT)
+                self.play_surf.fill(TETROMINO_COLORS[char], sqrect)
+                self.play_surf.blit(tetromino_border(), sqrect)
+        self.display.blit(self.play_surf, PLAY_RECT)
 
 
     def _render_end(self):
-        lose_txt = BIG_FONT.render("game over", True, (255, 255, 255))
+        lose_txt = render_text(big_font(), "game over", True, (255, 255, 255))
         center = [PLAY_RECT.centerx - lose_txt.get_width() // 2,
                 self.rect.centery - lose_txt.get_height()]
         # create shadow :)
-        lose_txt_bg = BIG_FONT.render("game over", True, (5, 5, 5))
+        lose_txt_bg = render_text(big_font(), "game over", True, (5, 5, 5))
         center[0] -= 2
         center[1] += 2
         self.display.blit(lose_txt_bg, center)
@@ -615,6 +651,35 @@ class Game(plethoraAPI.Game):
         self.display.blit(self.quit_btn.surface, self.quit_btn.rect.topleft)
         return False
 
+    def snapshot(self):
+        """ pack the game state (see SNAPSHOT); about 240 bytes
+        """
+        curt = self.curt
+        header = SNAPSHOT.pack(SNAPSHOT_VERSION, self.state, self.begin_count, self.begin_count_tick,
+                self.arrows, self.lr_hide, self.karrow_count, self.space,
+                curt.ttype.value if curt else 0, curt.rotation if curt else 0, self.curt_x, self.curt_y,
+                self.score, self.G, self.linesCleared, len(self.queue))
+        queue = bytes(t.ttype.value for t in self.queue)
+        filled = "".join("".join(line) for line in self.filled).encode("ascii")
+        return header + queue + filled
+
+    def restore(self, data):
+        """ restore a state packed by snapshot()
+        """
+        if len(data) < SNAPSHOT.size or data[0] != SNAPSHOT_VERSION or \
+                len(data) != SNAPSHOT.size + data[SNAPSHOT.size - 1] + PLAY_SIZE[0] * PLAY_SIZE[1]:
+            raise ValueError("not a version {} tetris save state".format(SNAPSHOT_VERSION))
+        (_, self.state, self.begin_count, self.begin_count_tick, self.arrows, self.lr_hide,
+                self.karrow_count, self.space, curt_type, curt_rotation, self.curt_x, self.curt_y,
+                self.score, self.G, self.linesCleared, queue_len) = SNAPSHOT.unpack_from(data)
+        offset = SNAPSHOT.size
+        self.curt = Tetromino(TetrominoType(curt_type), curt_rotation) if curt_type else None
+        self.queue = [Tetromino(TetrominoType(value)) for value in data[offset:offset + queue_len]]
+        filled = data[offset + queue_len:].decode("ascii")
+        width = PLAY_SIZE[0]
+        self.filled = list(list(filled[y:y + width]) for y in range(0, width * PLAY_SIZE[1], width))
+        self.schedule_render(0)
+
     def _play_again_click(self):
         self.start()
 
@@ -1,7 +1,6 @@
-from arcade.games.tictactoe.tictactoe import Board
-
 def get_name():
     return "Tic-Tac-Toe"
 
 def insert_cartridge():
+    from arcade.games.tictactoe.tictactoe import Board
     return Board()
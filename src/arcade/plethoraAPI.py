@@ -16,10 +16,20 @@ Main usage::
 Game usage::
 
     # src/arcade/games/myGame/__init__.py
-    import myGame
-    def load_cartridge():
+    def get_name():
+        return "My Game"  # listed in the cached cartridge manifest
+
+    def insert_cartridge():
+        from arcade.games.myGame import myGame  # only imported once the game is launched
         return myGame.MyGame()
 
+    def preload_cartridge():  # optional
+        # called on a worker thread when the game's menu entry is hovered or focused; warm
+        # whatever makes the constructor slow (decoding images, building tables) so that
+        # insert_cartridge() is near-instant
+        from arcade.games.myGame import myGame
+        myGame.preload()
+
     # src/arcade/games/myGame/myGame.py
     from arcade import plethoraAPI
     class MyGame(plethoraAPI.Game):
@@ -35,75 +45,350 @@ Game usage::
             self.display.fill((255, 255, 255))  # fake render
             return False  # indicates that we do not need to re-render
 
+Import time::
+
+    # importing a cartridge must not initialize pygame or build fonts and surfaces; create them on
+    # first use (in the game's constructor, or behind a ``functools.lru_cache`` accessor) so that
+    # the launcher only pays for what it shows; ``plethora-importtime`` checks every cartridge
+
+Batched events::
+
+    # :func:`Game.onevents` receives all of a frame's events at once (mouse positions already in game
+    # coordinates; the window position is in ``abs_pos``); by default it calls :func:`Game.onevent`
+    # for each, but a game may override it to coalesce them
+    def onevents(self, events: List[pygame.event.Event]) -> bool:
+        motion = [e for e in events if e.type == MOUSEMOTION]
+        return self.drag_to(motion[-1].pos) if motion else False
+
+Fixed timestep::
+
+    # pass ``tickrate`` to advance the game in :func:`Game.onupdate` at a fixed rate, independent
+    # of how fast frames render; :func:`Game.onrender` then only draws the current state
+    class MyGame(plethoraAPI.Game):
+        def __init__(self):
+            super().__init__(size=(200, 200), fps=30, tickrate=60)
+
+        def onupdate(self, dt: float) -> bool:
+            self.y += self.speed * dt
+            return True  # indicates that we need to render
+
+Dirty rects::
+
+    # :func:`Game.onrender` may instead report only the parts of its display that changed (in
+    # game coordinates) as a list of rects or as a ``(rerender, rects)`` tuple; the launcher
+    # translates them by its game rect and only updates those parts of the window
+    def onrender(self):
+        self.display.blit(self.cursor_surf, self.cursor_rect)
+        return (self.key_held, [self.old_cursor_rect, self.cursor_rect])
+
+Logical resolution::
+
+    # a game renders at its ``size`` (its logical resolution) and may ask to be shown ``scale``
+    # times larger; the launcher scales only the rects the game reported into the window in one
+    # :func:`pygame.transform.scale` (or ``smooth`` :func:`pygame.transform.smoothscale`) pass,
+    # shrinks the scale if the window would not fit the desktop, and gives the game mouse
+    # positions in logical coordinates
+    class MyGame(plethoraAPI.Game):
+        def __init__(self):
+            super().__init__(size=(160, 120), fps=30, scale=4)
+
+Idle::
+
+    # when nothing is dirty and the game has no tickrate, the launcher blocks until the next event
+    # instead of rendering at full fps; a game that needs to render later without input (eg to
+    # animate a turn-based opponent) schedules it
+    self.schedule_render(0.5)  # onrender is called again in 0.5 seconds
+
+Background work::
+
+    # set PLETHORA_ASYNC=1 to run the main loop as an asyncio coroutine: waiting for events and
+    # pacing frames sleep in the event loop, so coroutines and executor jobs started by the game
+    # make progress between frames while it keeps rendering. When one finishes, its callback is
+    # called on the main thread and the game renders; without PLETHORA_ASYNC they run right away
+    self.spawn(self.think(), callback=self.play_move)              # a coroutine
+    self.run_in_executor(save_scores, data, callback=self.saved)  # a blocking call, on a thread
+
+Compute pool::
+
+    # CPU-bound pure-Python work (move search, solvers, odds) holds the GIL, so it stalls frames
+    # even on a thread; submit it to the launcher's shared process pool instead. fn must be a
+    # module-level function and its arguments picklable. While the game has work in flight its
+    # onrender is called every frame, so it can poll the handle; unfinished work is cancelled when
+    # the game exits
+    self.search = self.submit(best_move, board, depth)
+    ...
+    if self.search and self.search.done():
+        self.play(self.search.result())
+
+Save states::
+
+    # a game that overrides snapshot() and restore() can be suspended, resumed and rolled back;
+    # pack the game's state (not its surfaces) compactly, eg with :mod:`struct`, so that taking a
+    # snapshot every frame is cheap. restore() calls schedule_render(0) so that the launcher
+    # renders the restored state; the state of :mod:`random` is not part of a snapshot
+    data = game.snapshot()  # bytes
+    game.restore(data)
+    plethoraAPI.can_snapshot(game)  # True if the game implements both
+
+Profiling::
+
+    # set PLETHORA_PROFILE=1 (or press F3 in the launcher) to time each phase of every frame;
+    # F3 toggles an on-screen overlay of the mean/max milliseconds per phase
+    api.profiler.stats()  # {"events": {"mean_ms": ..., "max_ms": ..., "last_ms": ...}, ...}
+    api.profiler.gauges()  # {"compute_queue": {"mean": ..., "max": ..., "last": ...}}
+
+Recording::
+
+    # set PLETHORA_RECORD to a directory to record every game session (the seed of :mod:`random`,
+    # the events delivered to the game and the fixed ticks run on each frame) as
+    # ``{game}-{time}.json``; replay one at uncapped speed with ``plethora-bench --replay FILE``
+
+Memory profiling::
+
+    # set PLETHORA_MEMPROFILE to a directory to trace Python allocations with :mod:`tracemalloc`;
+    # every game session gets a ``{game}-{time}-memory.txt`` report of its top allocation sites,
+    # its growth during play and what it left allocated after exit
+
+Frame metrics::
+
+    # set PLETHORA_METRICS to a .json (or .csv) file to export, per cartridge, a histogram and
+    # percentiles of frame times, the latency from input to the next rendered frame and the net
+    # change of Python memory blocks per frame when the launcher exits; compare two exports with
+    # ``plethora-perfdiff OLD NEW``
+
+Capture::
+
+    # set PLETHORA_CAPTURE to a directory to capture every frame the launcher presents while a
+    # game runs, as ``{game}-{time}/NNNNNN.png`` (or, with PLETHORA_CAPTURE_FORMAT=raw, a
+    # ``{game}-{time}.rgb`` file of RGB24 frames) plus a ``{game}-{time}.json`` index of the frame
+    # size and presentation times. Frames are copied into a small ring of surfaces and encoded on
+    # a worker thread; when it falls behind, frames are dropped instead of stalling the game
+    $ ffmpeg -f rawvideo -pixel_format rgb24 -video_size WxH -framerate 30 -i GAME-TIME.rgb out.mp4
+
+Isolation::
+
+    # set PLETHORA_ISOLATE=1 to run each game in its own process: events are forwarded over a
+    # pipe and the game renders into shared memory that the launcher blits, so a game that blocks
+    # (eg sleeping in onrender) or crashes cannot freeze or take down the launcher
+
+Hot reload::
+
+    # set PLETHORA_HOT_RELOAD=1 to watch the running cartridge's directory; when one of its files
+    # changes, the game is exited with ``onexit(False)``, its modules are re-imported and it is
+    # launched again, without restarting the launcher
+
 Running::
 
     $ pip install .
     $ plethora
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum, unique
-from typing import Callable, Dict, List, Tuple, Union, Optional
+from typing import Awaitable, Callable, Dict, List, Tuple, Union, Optional
+from arcade.common import cartridge_manifest
+from arcade.common.asset_manager import ASSETS, load_image
+from arcade.common.compute_pool import COMPUTE
+from arcade.common.frame_capture import FrameCapture
+from arcade.common.frame_metrics import MetricsLog
+from arcade.common.frame_profiler import FrameProfiler
+from arcade.common.input_recorder import InputRecorder
+from arcade.common.memory_profiler import MemoryProfiler
+from arcade.common.text_cache import get_font, render_text
+import asyncio
+import bisect
 import importlib
 import functools
+import math
+import os
 import pathlib
 import pygame  # type: ignore[import]
+import random
 import sys
+import time
 import traceback
 
 from pygame.locals import (  # type: ignore[import]
-    QUIT,
+    QUIT, NOEVENT, KEYDOWN, K_F3, K_UP, K_DOWN, K_RETURN,
     MOUSEMOTION, MOUSEBUTTONUP, MOUSEBUTTONDOWN
 )
 
 MOUSE_TYPES = { MOUSEMOTION, MOUSEBUTTONUP, MOUSEBUTTONDOWN }
 
-# initialize pygame and pygame.font
-pygame.init()
-pygame.font.init()
-
 
 # Useful globals
 
 ROOT = pathlib.Path(__file__).parent
 
-FONT_TITLE = pygame.font.Font(str(ROOT/"fonts/exo/Exo-Regular.ttf"), 50)
-FONT_MENU_ITEM = pygame.font.Font(str(ROOT/"fonts/exo/Exo-Regular.ttf"), 30)
+# fonts created on first access (see :func:`__getattr__`): name -> (file, size)
+LAZY_FONTS = {
+    "FONT_TITLE": (ROOT/"fonts/exo/Exo-Regular.ttf", 50),
+    "FONT_MENU_ITEM": (ROOT/"fonts/exo/Exo-Regular.ttf", 30),
+}
+
+
+# most :func:`Game.onupdate` ticks to run in one frame to catch up; the rest are dropped so a long
+# stall slows the game down instead of freezing the launcher in a catch-up spiral
+MAX_CATCHUP_TICKS = 5
+
+
+# longest the launcher sleeps waiting for an event when idle (seconds)
+IDLE_TIMEOUT = 1.0
+
+
+# how often the running cartridge's files are checked for changes when hot reloading (seconds)
+RELOAD_INTERVAL = 0.5
+
+
+# how often the asyncio main loop polls for events when idle (seconds); SDL events cannot be
+# awaited, and polling at this rate lets background work finish between polls
+ASYNC_POLL_INTERVAL = 0.005
 
 
 api = None
 
 
+def init_pygame() -> None:
+    """ initialize pygame and pygame.font, once
+
+    Importing this module does not touch SDL, so tools (the headless runners, the chess engine,
+    the poker evaluator) can import it without a display; :class:`PlethoraAPI` and :class:`Game`
+    call this when they are created.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+
+def ui_font(name: str) -> pygame.font.Font:
+    """ get one of the launcher's fonts (see :data:`LAZY_FONTS`), loading it on first use
+
+    Args:
+        name: "FONT_TITLE" or "FONT_MENU_ITEM"
+    """
+    init_pygame()
+    return get_font(*LAZY_FONTS[name])
+
+
+def __getattr__(name: str):
+    """ load :data:`FONT_TITLE` and :data:`FONT_MENU_ITEM` on first access rather than at import
+    """
+    if name in LAZY_FONTS:
+        return ui_font(name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 def launch_api():
     global api
     api = PlethoraAPI()
     api.main()
 
 
+def preload_cartridge(idir: str, gameName: str) -> None:
+    """ import a cartridge and call its optional :func:`preload_cartridge` (run on the
+        preloading thread, see :func:`PlethoraAPI.preload_game`)
+
+    Args:
+        idir: include directory (eg "arcade.games")
+        gameName: module name (eg "bomberman")
+    """
+    cartridge = importlib.import_module("{}.{}".format(idir, gameName))
+    preload = getattr(cartridge, "preload_cartridge", None)
+    if preload is not None:
+        preload()
+
+
+def split_render_result(result) -> Tuple[bool, Optional[List[pygame.Rect]]]:
+    """ split the return value of :func:`Game.onrender` into ``(rerender, rects)``
+
+    :func:`Game.onrender` may return:
+        - a bool: True to render again on the next frame; the whole game display changed
+        - a list of rects: only these rects (in game coordinates) changed; do not render again
+        - a ``(rerender, rects)`` tuple: both of the above
+
+    Returns:
+        ``(rerender, rects)`` where ``rects`` is None if the whole game display changed
+    """
+    if isinstance(result, list):
+        return False, result
+    if isinstance(result, tuple):
+        rerender, rects = result
+        return bool(rerender), rects
+    return bool(result), None
+
+
+def fit_scale(size: Tuple[int, int], scale: float, bounds: Optional[Tuple[int, int]]) -> float:
+    """ the largest scale up to ``scale`` at which ``size`` fits in ``bounds``
+
+    Args:
+        size: logical size of the game
+        scale: scale the game asked for
+        bounds: room available in the window, or None if unknown
+
+    Returns:
+        the scale to show the game at
+    """
+    if bounds is None:
+        return scale
+    return min(scale, bounds[0] / size[0], bounds[1] / size[1])
+
+
+def scale_rect(rect: pygame.Rect, scale: float) -> pygame.Rect:
+    """ the window pixels covered by ``rect`` (in logical pixels) at ``scale``
+    """
+    left, top = int(rect.left * scale), int(rect.top * scale)
+    return pygame.Rect(left, top, math.ceil(rect.right * scale) - left, math.ceil(rect.bottom * scale) - top)
+
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """ merge overlapping rects so that :func:`pygame.display.update` touches each pixel once
+
+    Args:
+        rects: rects (or rect-style tuples); empty rects are dropped
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if not rect.width or not rect.height:
+            continue
+        ind = rect.collidelist(merged)
+        while ind != -1:
+            rect.union_ip(merged.pop(ind))
+            ind = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
 class PlethoraAPI():
     """ This class runs the UI and launches a game via the API.
 
     In order for a game to run, it should extend :mod:`plethoraAPI.Game` and implement
     :func:`onrender` and :func:`onevent`. Then, the game should be placed in
     :file:`src/arcade/games/{name}/` and :file:`src/arcade/games/{name}/__init__.py` should contain
-    the function, :func:`load_cartridge`, which returns a Game object that extends
-    `plethoraAPI.Game`.
+    the functions, :func:`get_name` and :func:`insert_cartridge`, the latter of which returns a Game
+    object that extends `plethoraAPI.Game`.
+
+    The menu is built from a cached manifest (see :mod:`arcade.common.cartridge_manifest`), so a
+    cartridge is only imported when it is launched, or when its menu entry is hovered or focused
+    with the arrow keys, in which case it is imported (and its optional
+    :func:`preload_cartridge` called) on a worker thread ahead of the click.
     """
 
     def __init__(self):
         """ :mod:`PlethoraAPI` constructor
         """
+        init_pygame()
 
-        # attempt to dynamically import all games
+        # list all games from the manifest; they are imported by :func:`launch_game`
         self.imports = {}
-        self.import_errors = {}
-        self.games = {}
-        for path in (ROOT/"games").iterdir():
-            if not (path/"__init__.py").is_file():
-                continue
-            name = path.name
-            loaded = self.import_game("arcade.games", name)
-            if loaded:
-                self.games[name] = self.imports[name].get_name()
+        self.manifest, self.import_errors = cartridge_manifest.load_manifest(ROOT/"games", "arcade.games")
+        for name, error in self.import_errors.items():
+            print("Error loading game, \"{}\": {}".format(name, error))
+        self.games = dict((name, entry["display_name"]) for name, entry in self.manifest.items())
+        # cartridges being imported and warmed on a worker thread (see :func:`preload_game`)
+        self.preloader = None
+        self.preloads: Dict[str, Future] = {}
 
         self.size = self.width, self.height = (400, 400)
         self.display = pygame.display.set_mode(self.size)
@@ -114,9 +399,8 @@ class PlethoraAPI():
         self.uifps = 20
         self.fps = self.uifps
 
-        self.title = UILabel(100, 10, "PlethoraPy", FONT_TITLE, fromApi=True)
-        logo = pygame.image.load(str(ROOT/"images/plethora-icon-shadow.png"))
-        self.logo = pygame.transform.scale(logo, (80, 80))
+        self.title = UILabel(100, 10, "PlethoraPy", ui_font("FONT_TITLE"), fromApi=True)
+        self.logo = load_image(ROOT/"images/plethora-icon-shadow.png", (80, 80))
         self.logo_rect = pygame.Rect(5, 5, 0, 0)
 
         self.clickables = []
@@ -125,22 +409,70 @@ class PlethoraAPI():
         self.click_await = None
 
         self.menu = self.add_menu(UIMenu(40, 120, self.games, self.onMenuClick,
-                 FONT_MENU_ITEM, background=(255, 255, 255), lineColor=(185, 185, 185),
+                 ui_font("FONT_MENU_ITEM"), background=(255, 255, 255), lineColor=(185, 185, 185),
                  maxWidth=300, fixedWidth=True,
                  maxHeight=200, fixedHeight=True,
                  fromApi=True))
 
-        backbtn = pygame.image.load(str(ROOT/"images/back-arrow.png"))
-        backbtn.convert_alpha()
+        backbtn = load_image(ROOT/"images/back-arrow.png")
         self.backbtn = self.add_button(UIButton(20, 20, backbtn, self.close_game, padding=4, hidden=True, fromApi=True))
 
         self.game = None
         self.game_rect = pygame.Rect((20, 30 + self.title.rect.height), (0, 0))
-        self.game_surface = None
+        self.game_surface = None        # surface the game draws into at its logical resolution
+        self.game_view = None           # subsurface of :attr:`display` the game is shown in
+        self.game_scale = 1.0           # window pixels per logical pixel (see :func:`present_game`)
         self.game_dirty = None
+        self.tick_accum = 0.0           # seconds of game time not yet simulated by :func:`Game.onupdate`
+        self.tick_last = None           # time of the last :func:`update_game`
+        self.get_time = time.perf_counter
+        self.game_frame = 0             # frames since the game launched
+
+        # record game sessions to this directory (see :class:`InputRecorder`)
+        self.record_dir = os.environ.get("PLETHORA_RECORD")
+        self.recorder = None
+        # :class:`arcade.common.input_recorder.Recording` to replay on the next :func:`launch_game`
+        self.replay = None
+
+        # snapshot allocations at launch, during play and after exit (see :class:`MemoryProfiler`)
+        memprofile_dir = os.environ.get("PLETHORA_MEMPROFILE")
+        self.memprofiler = MemoryProfiler(memprofile_dir) if memprofile_dir else None
+
+        # export frame time, input latency and memory growth metrics per cartridge (see :class:`MetricsLog`)
+        self.metrics_path = os.environ.get("PLETHORA_METRICS")
+        self.metrics = MetricsLog() if self.metrics_path else None
+        self.frame_metrics = None       # :class:`FrameMetrics` of the running game
+        self.game_rendered = False      # whether :func:`Game.onrender` was called this frame
+
+        # capture the presented frames of every game session (see :class:`FrameCapture`)
+        self.capture = None
+        capture_dir = os.environ.get("PLETHORA_CAPTURE")
+        if capture_dir:
+            try:
+                self.capture = FrameCapture(capture_dir, os.environ.get("PLETHORA_CAPTURE_FORMAT", "png"))
+            except ValueError as error:
+                print("Error: {}".format(error))
+
+        # relaunch the running game when its files change (see :func:`check_reload`)
+        self.hot_reload = bool(os.environ.get("PLETHORA_HOT_RELOAD"))
+        # run games in a child process (see :class:`IsolatedGame`)
+        self.isolate = bool(os.environ.get("PLETHORA_ISOLATE"))
+        # run the main loop as a coroutine (see :func:`mainloop_async`)
+        self.use_async = bool(os.environ.get("PLETHORA_ASYNC"))
+        self.last_tick = time.perf_counter()
+        self.reload_name = None         # cartridge being watched
+        self.reload_fingerprint = None
+        self.reload_checked = 0.0
 
         self.dirty = False
         self.running = False
+        self.idle = True                # block on events when nothing needs rendering (see :func:`is_idle`)
+
+        # per-phase frame timing (see :func:`run_frame`); opt-in because it costs a clock read per phase
+        self.profiler = FrameProfiler() if os.environ.get("PLETHORA_PROFILE") else None
+        self.profiler_overlay = False
+        self.profiler_font = None
+        self.profiler_rect = None
 
     def close_game(self):
         if not self.game:
@@ -154,6 +486,8 @@ class PlethoraAPI():
         self.refill = True
         self.dirty = True
         self.running = True
+        # start the compute pool's workers while the menu is up (see :func:`Game.submit`)
+        COMPUTE.warm()
         self.mainloop()
 
     def import_game(self, idir: str, gameName: str) -> None:
@@ -191,31 +525,290 @@ class PlethoraAPI():
 
         When this loop ends, the entire display will close.
         """
-        while self.running:
-            for event in pygame.event.get():
-                self.onevent(event)
-            self.onrender()
-            self.clock.tick(self.fps)
+        try:
+            if self.use_async:
+                asyncio.run(self.mainloop_async())
+            else:
+                while self.running:
+                    self.run_frame()
+        finally:
+            # keep the recording of a session that crashed the launcher
+            self.save_recording()
+            self.end_capture()
+            if self.memprofiler:
+                self.memprofiler.end()
+            self.save_metrics()
+            if isinstance(self.game, IsolatedGame):
+                self.game.process.kill()
+            if self.preloader:
+                self.preloader.shutdown(wait=False, cancel_futures=True)
+            COMPUTE.shutdown()
         pygame.quit()
 
+    async def mainloop_async(self) -> None:
+        """ :func:`mainloop` as a coroutine: runs :func:`run_frame_async` until the launcher exits,
+            so that the game's :func:`Game.spawn` and :func:`Game.run_in_executor` work runs
+            between frames
+        """
+        while self.running:
+            await self.run_frame_async()
+
+    async def run_frame_async(self) -> None:
+        """ :func:`run_frame`, but waiting for events and pacing the frame rate in the event loop
+            instead of blocking in :func:`pygame.event.wait` and :func:`pygame.time.Clock.tick`
+        """
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+        events = []
+        if self.is_idle():
+            events = await self.wait_events_async()
+            if profiler:
+                profiler.mark("idle")
+        self.process_frame(events)
+        # like clock.tick(fps), but sleeping in the event loop
+        delay = 1 / self.fps - (time.perf_counter() - self.last_tick) if self.fps else 0
+        await asyncio.sleep(max(delay, 0))
+        self.last_tick = time.perf_counter()
+        self.clock.tick()
+        if profiler:
+            profiler.mark("tick")
+            profiler.end_frame()
+
+    async def wait_events_async(self) -> List[pygame.event.Event]:
+        """ poll for events every :data:`ASYNC_POLL_INTERVAL` until one arrives, the game's
+            scheduled render is due or :func:`idle_timeout` passes
+
+        Returns:
+            the events that arrived
+        """
+        deadline = time.perf_counter() + self.idle_timeout() / 1000
+        while True:
+            events = pygame.event.get()
+            now = time.perf_counter()
+            if events or now >= deadline:
+                return events
+            if self.game and self.game.render_at is not None and now >= self.game.render_at:
+                return events
+            await asyncio.sleep(min(ASYNC_POLL_INTERVAL, deadline - now))
+
+    def run_frame(self) -> None:
+        """ run a single frame of :func:`mainloop`
+
+        If :attr:`profiler` is set, the frame is timed in the phases: "idle" (blocked waiting for an
+        event, see :func:`is_idle`), "events" (:func:`pygame.event.get`), "translate" (the
+        launcher's hotkeys and bookkeeping, recording the events and translating them for the game),
+        "game_event" and "ui_event" (:func:`Game.onevents` and :func:`onevent`), "game_update"
+        (:func:`Game.onupdate`), "ui_render", "game_render" (:func:`Game.onrender`), "present"
+        (:func:`present_game`), "overlay" (:func:`draw_profiler_overlay`), "display"
+        (:func:`pygame.display.update`/:func:`pygame.display.flip`), "capture" (see
+        :class:`FrameCapture`) and "tick" (:func:`pygame.time.Clock.tick`).
+        """
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+        events = []
+        if self.is_idle():
+            event = pygame.event.wait(self.idle_timeout())
+            if event.type != NOEVENT:
+                events.append(event)
+            if profiler:
+                profiler.mark("idle")
+        self.process_frame(events)
+        self.clock.tick(self.fps)
+        if profiler:
+            profiler.mark("tick")
+            profiler.end_frame()
+
+    def process_frame(self, events: List[pygame.event.Event]) -> None:
+        """ the work of a frame between waiting for events and pacing the frame rate: deliver the
+            events, update and render
+
+        Args:
+            events: events already taken from the queue (eg while idle); the rest are fetched here
+        """
+        profiler = self.profiler
+        events.extend(pygame.event.get())
+        if profiler:
+            profiler.mark("events")
+        frame_metrics = self.frame_metrics
+        if frame_metrics:
+            frame_metrics.begin_frame()
+        if self.reload_name:
+            self.check_reload()
+        if self.game and self.game.render_at is not None and time.perf_counter() >= self.game.render_at:
+            self.game.render_at = None
+            self.game_dirty = True
+        if self.game and self.game.compute:
+            # render every frame while submitted work is in flight, including the frame it finished
+            self.game.compute = set(future for future in self.game.compute if not future.done())
+            self.game_dirty = True
+        if profiler:
+            profiler.gauge("compute_queue", COMPUTE.queue_depth())
+        self.onevents(events)
+        if profiler:
+            profiler.mark("ui_event")
+        self.update_game()
+        if profiler:
+            profiler.mark("game_update")
+        self.onrender()
+        if self.memprofiler:
+            self.memprofiler.update(self.game is not None)
+        if self.game:
+            self.game_frame += 1
+        if frame_metrics:
+            frame_metrics.end_frame(self.game_rendered)
+
+    def is_idle(self) -> bool:
+        """ whether the next frame can block until an event arrives: nothing is dirty, the game does
+            not run fixed ticks and the profiler overlay is hidden
+        """
+        if not self.idle or self.refill or self.dirty or self.profiler_overlay:
+            return False
+        return not (self.game and (self.game_dirty or self.game.tickrate or self.game.compute))
+
+    def idle_timeout(self) -> int:
+        """ milliseconds to wait for an event when idle: until the game's scheduled render, but at
+            most :data:`IDLE_TIMEOUT`
+        """
+        timeout = IDLE_TIMEOUT
+        if self.reload_name:
+            timeout = min(timeout, RELOAD_INTERVAL)
+        if self.game and self.game.render_at is not None:
+            timeout = min(timeout, max(0.0, self.game.render_at - time.perf_counter()))
+        # pygame.event.wait(0) would block until an event arrives
+        return max(int(timeout * 1000), 1)
+
+    def update_game(self) -> None:
+        """ run as many fixed :func:`Game.onupdate` ticks as the time since the last call covers
+
+        Does nothing unless the running game has a :attr:`Game.tickrate`. At most
+        :data:`MAX_CATCHUP_TICKS` ticks run per call; time beyond that is dropped.
+        """
+        if not self.game or not self.game.tickrate:
+            return
+        if self.replay is not None:
+            # run exactly the ticks that were recorded for this frame
+            for _ in range(self.replay.ticks_at(self.game_frame)):
+                if self.game:
+                    self.game_dirty |= bool(self.game.onupdate(1 / self.game.tickrate))
+            return
+        now = self.get_time()
+        if self.tick_last is not None:
+            self.tick_accum += now - self.tick_last
+        self.tick_last = now
+        step = 1 / self.game.tickrate
+        ticks = 0
+        while self.tick_accum >= step and self.game:
+            if ticks == MAX_CATCHUP_TICKS:
+                self.tick_accum %= step
+                break
+            self.game_dirty |= bool(self.game.onupdate(step))
+            self.tick_accum -= step
+            ticks += 1
+        if self.recorder and ticks:
+            self.recorder.record_ticks(self.game_frame, ticks)
+
+    def toggle_profiler_overlay(self) -> None:
+        """ show or hide the profiler overlay (starting the profiler if needed)
+        """
+        if self.profiler is None:
+            self.profiler = FrameProfiler()
+        self.profiler_overlay = not self.profiler_overlay
+        if not self.profiler_overlay:
+            # wipe the overlay off the display (it never covers the game, see :func:`profiler_area`)
+            self.refill = True
+            self.profiler_rect = None
+
+    def onevents(self, events: List[pygame.event.Event]) -> None:
+        """ called with all events generated since the last frame
+
+        The running game gets all of them in one :func:`Game.onevents` call (except the launcher's
+        own hotkeys), with mouse positions translated to game coordinates in a single pass; then
+        the launcher handles each event for its own UI. If the game exits on one of them, the
+        events after it are handled as if no game was running (eg a click on the menu).
+
+        Args:
+            events: the events (each has ``type`` and various attributes)
+        """
+        events = [event for event in events if not self.onhotkey(event)]
+        game_running = bool(self.game)
+        if self.recorder and self.game and events:
+            self.recorder.record_events(self.game_frame, events)
+        game_events = None
+        if self.game and events:
+            game_events = [
+                pygame.event.Event(event.type, dict(event.dict, pos=self.game_pos(event.pos), abs_pos=event.pos))
+                if event.type in MOUSE_TYPES else event
+                for event in events]
+        if self.profiler:
+            self.profiler.mark("translate")
+        # events up to this index were delivered to the game
+        delivered = len(events)
+        if game_events:
+            game = self.game
+            self.game_dirty |= bool(game.onevents(game_events))
+            if game.exit_event is not None:
+                delivered = next(i for i, event in enumerate(game_events) if event is game.exit_event) + 1
+            if self.frame_metrics:
+                self.frame_metrics.input()
+            if self.profiler:
+                self.profiler.mark("game_event")
+        for i, event in enumerate(events):
+            self.handle_ui_event(event, game_running if i < delivered else bool(self.game))
+
+    def game_pos(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """ translate a window position to the running game's logical coordinates
+        """
+        left, top = self.game_rect.topleft
+        if self.game_scale == 1:
+            return (pos[0] - left, pos[1] - top)
+        return (int((pos[0] - left) / self.game_scale), int((pos[1] - top) / self.game_scale))
+
     def onevent(self, event: pygame.event) -> None:
-        """ called when any event is generated
+        """ called when any event is generated (see :func:`onevents`)
 
         Args:
             event: the event (has ``type`` and various attributes)
         """
-        game_running = bool(self.game)
-        if self.game:
-            if event.type in MOUSE_TYPES:
-                event.abs_pos, event.pos = event.pos, (event.pos[0] - self.game_rect.left, event.pos[1] - self.game_rect.top)
-            self.game_dirty |= self.game.onevent(event)
-            if event.type in MOUSE_TYPES:
-                event.pos = event.abs_pos
-        else:
+        self.onevents([event])
+
+    def onhotkey(self, event: pygame.event) -> bool:
+        """ handle the launcher's hotkeys, which are never passed to the game
+
+        Returns:
+            True if ``event`` was a hotkey
+        """
+        if event.type == KEYDOWN and event.key == K_F3:
+            self.toggle_profiler_overlay()
+            return True
+        return False
+
+    def handle_ui_event(self, event: pygame.event, game_running: bool) -> None:
+        """ handle an event for the launcher's UI (after the game has seen it)
+
+        Args:
+            event: the event (has ``type`` and various attributes)
+            game_running: whether a game was running when the event was delivered
+        """
+        if not game_running:
             if event.type == QUIT:
                 self.running = not self.onexit()
                 if not self.running:
                     return
+        if not game_running and not self.menu.hidden:
+            if event.type == MOUSEMOTION:
+                ind = self.menu.item_at(event.pos)
+                if ind is not None:
+                    self.preload_game(self.menu.itemKeys[ind])
+            elif event.type == KEYDOWN and event.key in (K_UP, K_DOWN):
+                ind = self.menu.move_focus(1 if event.key == K_DOWN else -1)
+                if ind is not None:
+                    self.preload_game(self.menu.itemKeys[ind])
+                    self.dirty = True
+            elif event.type == KEYDOWN and event.key == K_RETURN and self.menu.focus is not None:
+                self.menu.onselect(self.menu.focus)
+                return
         inGame = False  # click inside game?
         if game_running and event.type in MOUSE_TYPES:
             # only allow game to intercept mouse clicks by setting `inGame`
@@ -251,48 +844,207 @@ class PlethoraAPI():
 
     def onrender(self) -> None:
         """ called when game or self is dirty to re-render
+
+        Only the damaged parts of the display (UI elements that were redrawn and the rects
+        reported by :func:`Game.onrender`) are pushed with :func:`pygame.display.update`; the
+        whole display is flipped only after a refill.
         """
         flip = False
+        rects = []
+        self.game_rendered = False
         if self.refill:
-            self.display.fill(self.background)
+            self.fill_background()
             self.dirty = True
             self.refill = False
+            flip = True
         if self.dirty:
             # UI dirty
-            self.draw_ui_el(self.title)
+            rects.append(self.draw_ui_el(self.title))
             if not self.game:
-                self.display.blit(self.logo, self.logo_rect)
+                rects.append(self.display.blit(self.logo, self.logo_rect))
             for el in self.clickables:
                 if el.hidden:
                     continue
-                self.draw_ui_el(el)
-            flip = True
+                rects.append(self.draw_ui_el(el))
             self.dirty = False
+        profiler = self.profiler
+        if profiler:
+            profiler.mark("ui_render")
         if self.game and self.game_dirty:
             # game dirty; call :func:`game.onrender`
-            self.game_dirty = self.game.onrender()
+            self.game_dirty, game_rects = split_render_result(self.game.onrender())
+            self.game_rendered = True
+            if profiler:
+                profiler.mark("game_render")
             if self.game:
-                # blit game to display
-                self.display.fill(self.background, self.game_rect)
-                self.display.blit(self.game_surface, self.game_rect.topleft)
-                flip = True
+                rects.extend(self.present_game(game_rects))
+                if profiler:
+                    profiler.mark("present")
+        if self.profiler_overlay:
+            rects.extend(self.draw_profiler_overlay())
+            if profiler:
+                profiler.mark("overlay")
         if flip:
-            # either game or main display updated: flip
+            # whole display refilled: flip
             pygame.display.flip()
+        elif rects:
+            # either game or main display partially updated: update only the damage
+            pygame.display.update(merge_rects(rects))
+        if profiler:
+            profiler.mark("display")
+        if self.capture and self.game and (flip or rects):
+            self.capture.capture(self.display)
+            if profiler:
+                profiler.mark("capture")
+
+    def profiler_area(self, size: Tuple[int, int]) -> pygame.Rect:
+        """ the part of the display the profiler overlay may cover: all of it without a game;
+            with one, the margin right of :attr:`game_rect` if the overlay fits there, else the
+            chrome above it (the overlay is cut off at the game's top edge)
+
+        The game draws straight into the display, so pixels the overlay covered could not be
+        restored when it hides or shrinks.
 
-    def draw_ui_el(self, el) -> None:
+        Args:
+            size: size of the overlay
+        """
+        w, h = self.display.get_size()
+        if not self.game:
+            return pygame.Rect(0, 0, w, h)
+        r = self.game_rect
+        if w - r.right - 8 >= size[0]:
+            return pygame.Rect(r.right, 0, w - r.right, h)
+        return pygame.Rect(0, 0, w, r.top)
+
+    def draw_profiler_overlay(self) -> List[pygame.Rect]:
+        """ draw the profiler overlay in the top right corner of the display, outside the game (see
+            :func:`profiler_area`)
+
+        Returns:
+            the damaged rects of the display
+        """
+        if self.profiler_font is None:
+            self.profiler_font = pygame.font.SysFont("monospace", 12)
+        overlay = self.profiler.render_overlay(self.profiler_font)
+        if overlay is None:
+            return []
+        damaged = []
+        rect = overlay.get_rect(topright=(self.display.get_width() - 4, 4))
+        self.display.set_clip(self.profiler_area(rect.size))
+        if self.profiler_rect is not None and not rect.contains(self.profiler_rect):
+            # the overlay shrunk; clear where it was and redraw the UI under it next frame
+            self.display.fill(self.background, self.profiler_rect)
+            damaged.append(self.profiler_rect)
+            self.dirty = True
+        self.profiler_rect = self.display.blit(overlay, rect)
+        self.display.set_clip(None)
+        damaged.append(self.profiler_rect)
+        return damaged
+
+    def fill_background(self) -> None:
+        """ fill the display with the background, leaving the running game's pixels alone (the game
+            draws straight into :attr:`game_surface` or is scaled into :attr:`game_view`, so they cannot be
+            blitted back)
+        """
+        if not self.game:
+            self.display.fill(self.background)
+            return
+        w, h = self.display.get_size()
+        r = self.game_rect
+        for rect in ((0, 0, w, r.top), (0, r.bottom, w, h - r.bottom),
+                (0, r.top, r.left, r.height), (r.right, r.top, w - r.right, r.height)):
+            self.display.fill(self.background, rect)
+
+    def game_damage(self, rects: Optional[List[pygame.Rect]] = None) -> List[pygame.Rect]:
+        """ translate the rects changed by the game to display coordinates
+
+        Args:
+            rects: changed rects in game coordinates; None if the whole game display changed
+
+        Returns:
+            the damaged rects in display coordinates
+        """
+        if rects is None:
+            return [self.game_rect.copy()]
+        bounds = self.game_surface.get_rect()
+        if self.game_scale == 1:
+            return [bounds.clip(rect).move(self.game_rect.topleft) for rect in rects]
+        return [scale_rect(bounds.clip(rect), self.game_scale).clip(self.game_view.get_rect()).move(self.game_rect.topleft)
+                for rect in rects]
+
+    def present_game(self, rects: Optional[List[pygame.Rect]] = None) -> List[pygame.Rect]:
+        """ show what the game rendered: scale the changed parts of :attr:`game_surface` into
+            :attr:`game_view` (a game shown at its logical resolution already drew into the
+            display)
+
+        The window keeps the scaled pixels, so nothing is scaled again until the game renders.
+
+        Args:
+            rects: changed rects in game coordinates; None if the whole game display changed
+
+        Returns:
+            the damaged rects in display coordinates
+        """
+        if self.game_view is None:
+            return self.game_damage(rects)
+        bounds = self.game_surface.get_rect()
+        if self.game.smooth or rects is None:
+            # smoothscale filters across rect edges, so always redo the whole view
+            rects = [bounds]
+        else:
+            rects = [bounds.clip(rect) for rect in rects]
+        scale = pygame.transform.smoothscale if self.game.smooth else pygame.transform.scale
+        view = self.game_view.get_rect()
+        for rect in rects:
+            if rect == bounds:
+                scale(self.game_surface, view.size, self.game_view)
+                continue
+            dest = scale_rect(rect, self.game_scale).clip(view)
+            if rect.width and rect.height and dest.width and dest.height:
+                scale(self.game_surface.subsurface(rect), dest.size, self.game_view.subsurface(dest))
+        return self.game_damage(rects)
+
+    def draw_ui_el(self, el) -> pygame.Rect:
         """ draw ui element
 
         Args:
             el: a UI element that needs a :attr:`rect` and a :func:`surface` to blit
+
+        Returns:
+            the damaged rect of the display
         """
         if el.background:
             self.display.fill(el.background, el.rect)
-        self.display.blit(el.get_blitsurface(), el.rect.topleft)
+        return self.display.blit(el.get_blitsurface(), el.rect.topleft)
+
+    def preload_game(self, name: str) -> None:
+        """ start importing a cartridge and calling its optional :func:`preload_cartridge` on a
+            worker thread, so that launching it later is fast
+
+        Each cartridge is preloaded at most once (until it is hot reloaded).
+
+        Args:
+            name: cartridge name (eg "bomberman")
+        """
+        if name in self.preloads or name not in self.manifest or self.imports.get(name) is not None:
+            return
+        if self.preloader is None:
+            self.preloader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plethora-preload")
+        self.preloads[name] = self.preloader.submit(preload_cartridge, "arcade.games", name)
 
     def launch_game(self, name: str) -> None:
         """ load imported game and run it
         """
+        preload = self.preloads.get(name)
+        if preload is not None and not preload.cancel():
+            # let the preload finish rather than doing its work twice; if it failed, importing
+            # below reports the error
+            try:
+                preload.result()
+            except Exception:
+                pass
+        if name not in self.imports and name in self.manifest:
+            self.import_game("arcade.games", name)
         if name not in self.imports:
             if name in self.import_errors:
                 print("Error: there was an error loading \"{}\": ".format(name), self.import_errors[name])
@@ -304,43 +1056,204 @@ class PlethoraAPI():
             self.backbtn.hidden = False
             self.menu.hidden = True
             try:
-                self.game = self.imports[name].insert_cartridge()
-                self.game_surface = pygame.Surface(self.game.rect.size)
-                self.fps, self.game_rect.size = self.game.register(self.game_surface, self.clock, self.handle_game_exit)
+                # seed :mod:`random` before the game is created so a session can be replayed
+                seed = None
+                if self.replay is not None:
+                    seed = self.replay.seed
+                elif self.record_dir:
+                    seed = random.SystemRandom().randrange(2 ** 32)
+                if seed is not None:
+                    random.seed(seed)
+                if self.memprofiler:
+                    self.memprofiler.end()
+                    self.memprofiler.begin(name)
+                if self.isolate:
+                    self.game = IsolatedGame(name, seed)
+                else:
+                    self.game = self.imports[name].insert_cartridge()
+                if self.record_dir and self.replay is None:
+                    self.recorder = InputRecorder(name, seed)
+                if self.metrics:
+                    self.frame_metrics = self.metrics.get(name)
+                self.game_frame = 0
+                self.tick_accum = 0.0
+                self.tick_last = None
+                # shrink the game's scale if it would not fit on the desktop
+                desktops = pygame.display.get_desktop_sizes()
+                bounds = None
+                if desktops:
+                    bounds = (desktops[0][0] - 2 * self.game_rect.left, desktops[0][1] - self.game_rect.top - self.game_rect.left)
+                self.game_scale = fit_scale(self.game.rect.size, self.game.scale, bounds)
+                if self.game_scale == 1:
+                    self.game_rect.size = self.game.rect.size
+                else:
+                    self.game_rect.size = scale_rect(self.game.rect, self.game_scale).size
                 w, h = self.size
                 if self.game_rect.width + 2 * self.game_rect.left > self.width:
                     w = self.game_rect.width + 2 * self.game_rect.left
                 if self.game_rect.height + self.game_rect.top + self.game_rect.left > self.height:
                     h = self.game_rect.height + self.game_rect.top + self.game_rect.left
                 if (w, h) != self.size:
-                    pygame.display.set_mode((w, h))
-                    self.refill = True
-                    self.dirty = True
+                    self.display = pygame.display.set_mode((w, h))
+                # a game at its logical resolution draws straight into the display; a scaled one
+                # into a surface of the display's format that :func:`present_game` scales from.
+                # Start it on black like a new Surface
+                if self.game_scale == 1:
+                    self.game_surface = self.display.subsurface(self.game_rect)
+                    self.game_view = None
+                else:
+                    self.game_surface = pygame.Surface(self.game.rect.size, 0, self.display)
+                    self.game_view = self.display.subsurface(self.game_rect)
+                    self.game_view.fill((0, 0, 0))
+                self.game_surface.fill((0, 0, 0))
+                if self.capture:
+                    self.end_capture()
+                    self.capture.begin(name, self.display.get_size())
+                self.fps, _ = self.game.register(self.game_surface, self.clock, self.handle_game_exit)
+                # clear the menu from the display and blit the entire game on the first frame
+                self.refill = True
+                self.dirty = True
                 self.game_dirty = True
+                if self.hot_reload:
+                    self.reload_name = name
+                    self.reload_fingerprint = cartridge_manifest.fingerprint(ROOT/"games"/name)
+                    self.reload_checked = time.perf_counter()
             except Exception as error:
                 print("Error while running game: {}".format(error))
                 print("-" * 100)
                 traceback.print_exc(file=sys.stdout)
                 print("-" * 100)
+                self.handle_game_exit()
                 return False
+
+    def check_reload(self) -> None:
+        """ relaunch the watched cartridge if any of its files changed since it was launched
+
+        The cartridge directory is only stat'ed (see :func:`cartridge_manifest.fingerprint`), at most
+        once every :data:`RELOAD_INTERVAL`.
+        """
+        now = time.perf_counter()
+        if now - self.reload_checked < RELOAD_INTERVAL:
+            return
+        self.reload_checked = now
+        digest = cartridge_manifest.fingerprint(ROOT/"games"/self.reload_name)
+        if digest == self.reload_fingerprint:
+            return
+        name = self.reload_name
+        print("Reloading \"{}\"".format(name))
+        if self.game:
+            self.game.onexit(False)
+            if self.game:
                 self.handle_game_exit()
+        # workers keep the modules they imported; restart them so they run the new code
+        COMPUTE.shutdown()
+        if self.reload_cartridge(name):
+            self.launch_game(name)
+        if not self.game:
+            # keep watching, so fixing the error relaunches the game
+            self.reload_name = name
+            self.reload_fingerprint = digest
+
+    def reload_cartridge(self, name: str) -> bool:
+        """ re-import a cartridge package with :func:`importlib.reload`
+
+        The package's submodules (eg the game module imported by ``insert_cartridge()``) are
+        dropped from :data:`sys.modules` so they are imported afresh, and cached images are
+        dropped in case an asset changed.
+
+        Args:
+            name: cartridge name (eg "chess")
+
+        Returns:
+            True if the cartridge was re-imported
+        """
+        package = "arcade.games.{}".format(name)
+        for module in [module for module in sys.modules if module.startswith(package + ".")]:
+            del sys.modules[module]
+        ASSETS.clear()
+        self.preloads.pop(name, None)
+        if self.imports.get(name) is None:
+            # the last (re)import failed: import from scratch
+            self.imports.pop(name, None)
+            sys.modules.pop(package, None)
+            return self.import_game("arcade.games", name)
+        try:
+            self.imports[name] = importlib.reload(self.imports[name])
+        except Exception as error:
+            print("Error reloading game, \"{}\": {}".format(name, error))
+            print("-" * 100)
+            traceback.print_exc(file=sys.stdout)
+            print("-" * 100)
+            del self.imports[name]
+            self.import_errors[name] = error
+            return False
+        self.import_errors.pop(name, None)
+        return True
+
+    def save_recording(self) -> None:
+        """ write the running session's recording (if recording) to :attr:`record_dir`
+        """
+        if not self.recorder:
+            return
+        recorder, self.recorder = self.recorder, None
+        path = os.path.join(self.record_dir, "{}-{}.json".format(recorder.game, time.strftime("%Y%m%d-%H%M%S", time.localtime(recorder.started))))
+        try:
+            os.makedirs(self.record_dir, exist_ok=True)
+            recorder.save(path, self.game_frame)
+        except OSError as error:
+            print("Error: could not save recording \"{}\": {}".format(path, error))
+
+    def end_capture(self) -> None:
+        """ finish capturing the running session's frames (if capturing) to :attr:`capture`'s directory
+        """
+        if not self.capture:
+            return
+        capture = self.capture
+        try:
+            path = capture.end()
+        except OSError as error:
+            print("Error: could not save capture \"{}\": {}".format(capture.path, error))
+            return
+        if path is not None:
+            print("Captured {} frames of \"{}\" to \"{}\" ({} dropped)".format(capture.written, capture.game, capture.path, capture.dropped))
+
+    def save_metrics(self) -> None:
+        """ write the frame metrics of every cartridge run so far to :attr:`metrics_path`
+        """
+        if not self.metrics:
+            return
+        try:
+            self.metrics.write(self.metrics_path)
+        except OSError as error:
+            print("Error: could not save metrics \"{}\": {}".format(self.metrics_path, error))
 
     def handle_game_exit(self):
         """ (should be) called when running game exits
         """
+        if self.game:
+            self.game.cancel_compute()
+        if self.memprofiler:
+            # the last snapshot of the game, before it is dropped
+            self.memprofiler.sample()
+        self.save_recording()
+        self.end_capture()
+        self.replay = None
+        self.reload_name = None
+        self.frame_metrics = None
         self.backbtn.hidden = True
         self.menu.hidden = False
         self.click_await = None
         self.game = None
         self.game_surface = None
+        self.game_view = None
+        self.game_scale = 1.0
         self.game_dirty = None
-        self.display.fill(self.background)
+        self.refill = True
         self.dirty = True
         # reset settings
         self.fps = self.uifps
         if self.display.get_size() != self.size:
-            pygame.display.set_mode(self.size)
-            self.refill = True
+            self.display = pygame.display.set_mode(self.size)
 
     def onexit(self):
         """ PlethoraAPI onexit()
@@ -437,24 +1350,28 @@ class UILabel(UIEl):
             x: int,
             y: int,
             text: str,
-            font: pygame.font = FONT_TITLE,
+            font: Optional[pygame.font.Font] = None,
             fontAntialias: bool = True,
             fontColor: Tuple[int,int,int] = (0, 0, 0),
             fontBackground: Optional[Tuple[int,int,int]] = None,
             **kwargs
         ) -> None:
-        """ UILabel constructor
+        """ UILabel constructor (``font`` defaults to :data:`FONT_TITLE`)
         """
+        if font is None:
+            font = ui_font("FONT_TITLE")
         self.font = font
         self.text = text
         self.fontAntialias = fontAntialias
         self.fontColor = fontColor
-        surface = font.render(text, fontAntialias, fontColor, fontBackground)
+        self.fontBackground = fontBackground
+        surface = render_text(font, text, fontAntialias, fontColor, fontBackground)
         super().__init__(x, y, *surface.get_size(), surface=surface, background=fontBackground, **kwargs)
 
     def set_text(self, text: str):
-        self.surface = self.font.render(self.text, self.fontAntialias, self.fontColor, self.fontBackground)
-        self.set_size(*surface.get_size())
+        self.text = text
+        self.surface = render_text(self.font, self.text, self.fontAntialias, self.fontColor, self.fontBackground)
+        self.set_size(*self.surface.get_size())
 
     def get_blitsurface(self):
         return self.surface
@@ -470,7 +1387,7 @@ class UIButton(UIEl):
             y             : int,
             text          : Union[str,"pygame.image"],
             callback      : Callable,
-            font          : pygame.font.Font = FONT_MENU_ITEM,
+            font          : Optional[pygame.font.Font] = None,
             fontAntialias : bool = True,
             fontColor     : Union[Tuple[int,int,int], pygame.Color] = (0, 0, 0),
             background    : Optional[Union[Tuple[int,int,int], pygame.Color]] = None,
@@ -483,9 +1400,11 @@ class UIButton(UIEl):
         for side in Side:
             # update ``padding[side]`` individually
             self.padding[side] = kwargs.get("padding_{}".format(side), self.padding[side])
+        if font is None and isinstance(text, str):
+            font = ui_font("FONT_MENU_ITEM")
         self.font = font
         if isinstance(text, str):
-            self.text_surface = font.render(text, fontAntialias, fontColor)
+            self.text_surface = render_text(font, text, fontAntialias, fontColor)
         else:
             # assuume it is a surface
             self.text_surface = text  # great names.. best names.. big hands.. fake news
@@ -528,10 +1447,13 @@ class UIButton(UIEl):
 
 
 class UIMenu(UIEl):
-    """ A UI button used by :mod:`PlethoraAPI`
+    """ A scrollable menu used by :mod:`PlethoraAPI`
 
-    A button has a :attr:`surface`, the surface that will be blitted, to which :attr:`text_surface`
-    is rendered; it also has a :attr:`rect` for position and size
+    The menu is virtualized: item titles are only measured up front, and a row is rendered the
+    first time it scrolls into view. Only the visible rows plus :attr:`overscan` rows on either
+    side stay cached, and the bordered :attr:`surface` is kept and only recomposed when the scroll
+    offset, the keyboard focus or the items change, so scrolling costs the same for any number of
+    items.
     """
 
     def __init__(self,
@@ -552,6 +1474,8 @@ class UIMenu(UIEl):
             lineHeight: int = 2,
             borderColor: Union[Tuple[int,int,int], pygame.Color] = (180, 180, 180),
             borderThickness: int = 4,
+            focusColor: Union[Tuple[int,int,int], pygame.Color] = (100, 140, 230),
+            overscan: int = 2,
             **kwargs
         ) -> None:
         self.x = x
@@ -564,230 +1488,161 @@ class UIMenu(UIEl):
         self.lineColor = lineColor
         self.borderColor = borderColor
         self.borderThickness = borderThickness
+        self.focusColor = focusColor
+        self.overscan = overscan
+        # index of the item focused with the keyboard
+        self.focus = None
         # amount scrolled
         self.scrollAmt = 0
-        if isinstance(items, dict):
-            self.itemKeys, self.itemTitles = zip(*items.items())
-        else:
-            # should be list or tuple of strings
-            self.itemKeys = items[:]
-            self.itemTitles = self.itemKeys
         self.fixedWidth = fixedWidth
         self.maxWidth = maxWidth
         self.fixedHeight = fixedHeight
         self.maxHeight = maxHeight
         self.lineMargin = lineMargin
         self.lineHeight = lineHeight
-        self._update()
+        self.set_items(items)
         super().__init__(self.x, self.y,
                 self.width, self.height,
-                surface=self.surface, **kwargs)
-
-    def scroll(self, amt: int) -> None:
-        self.scrollAmt += amt
-        if self.scrollAmt < 0:
-            self.scrollAmt = 0
-        if self.scrollAmt > 999: pass # TODO
+                surface=self.surface, background=background, **kwargs)
 
-    def _update(self):
-        self.items = list(self.itemFont.render(item, self.fontAntialias, self.fontColor) for item in self.itemTitles)
-        self.widths = list(item.get_width() for item in self.items)
-        self.heights = list(item.get_height() for item in self.items)
-        # width
-        if self.fixedWidth:
-            self.width = self.maxWidth if self.maxWidth is not None else max(self.widths)
-        else:
-            self.width = min(max(self.widths), self.maxWidth)
-        # height
-        all_h = sum(self.heights)
-        extra = (2 * self.lineMargin + self.lineHeight) * (len(self.heights) - 1)
-        self.full_height = all_h + extra
-        if self.fixedHeight:
-            self.height = self.maxHeight if self.maxHeight is not None else all_h + extra
-        else:
-            self.height = self.full_height
-        # bounding rect
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.full_rect = pygame.Rect(self.x, self.y, self.width, self.full_height)
-        # surface and background
-        self.surface = pygame.Surface(self.rect.size)
-        self.full_surface = pygame.Surface(self.full_rect.size)
-        if self.background is None:
-            self.full_surface.fill((1, 1, 1))
-            self.full_surface.set_colorkey((1, 1, 1))
-        else:
-            self.full_surface.fill(self.background)
-        y = 0
-        lastInd = len(self.items) - 1
-        for ind, (height, item) in enumerate(zip(self.heights, self.items)):
-            self.full_surface.blit(item, (0, y))
-            if ind < lastInd:
-                liney = y + height + self.lineMargin + self.lineHeight
-                self.full_surface.fill(self.lineColor, (0, liney, self.width, self.lineHeight))
-            y += height + self.lineMargin * 2 + self.lineHeight
-
-    def get_blitsurface(self) -> pygame.Surface:
-        """ get the blittable surface (self.surface)
+    def set_items(self, items: Union[List[str],Dict[str,str]]) -> None:
+        """ replace the menu's items (a list of titles, or a dict of keys to titles)
         """
-        # self.surface.fill((255, 0, 0), (0, self.height - 10, self.width, 10))
-        self.surface.blit(self.full_surface, (0, 0), pygame.Rect(0, self.scrollAmt, self.width, self.height))
-        bot = self.full_height - self.scrollAmt
-        if bot < self.height:
-            if self.background is None:
-                # TODO: FIXME
-                self.surface.fill((255, 255, 255), (0, bot, self.width, self.height - bot))
-                # self.surface.fill((1, 1, 1), (0, bot, self.width, self.height - bot))
-                # self.surface.set_colorkey((1, 1, 1))
-            else:
-                self.surface.fill(background, (0, bot, self.width, self.height - bot))
-        newsurf = pygame.Surface((self.width + 2 * self.borderThickness, self.height + 2 * self.borderThickness))
-        newsurf.fill(self.borderColor)
-        newsurf.blit(self.surface, (self.borderThickness, self.borderThickness))
-        return newsurf
-
-    def onclick(self, pos):
-        y = pos[1]
-        y -= self.rect.top + self.lineHeight + self.lineMargin // 2 - self.scrollAmt
-        ind = 0
-        tmpy, *heights = self.heights
-        for h in heights:
-            if tmpy > y:
-                break
-            tmpy += h + self.lineMargin * (1 if ind == 0 else 2) + self.lineHeight
-            ind += 1
-        self.callback(ind, self.itemKeys[ind])
-
-
-class UIMenu(UIEl):
-    """ A UI button used by :mod:`PlethoraAPI`
-
-    A button has a :attr:`surface`, the surface that will be blitted, to which :attr:`text_surface`
-    is rendered; it also has a :attr:`rect` for position and size
-    """
-
-    def __init__(self,
-            x : int,
-            y : int,
-            items: Union[List[str],Dict[str,str]],
-            callback: Callable,
-            itemFont: pygame.font.Font,
-            fontAntialias: bool = True,
-            fontColor : Union[Tuple[int,int,int], pygame.Color] = (0, 0, 0),
-            lineColor: Union[Tuple[int,int,int], pygame.Color] = (0, 0, 0),
-            background: Optional[Union[Tuple[int,int,int], pygame.Color]] = None,
-            maxWidth: Optional[int] = None,
-            maxHeight: Optional[int] = None,
-            fixedWidth: bool = True,
-            fixedHeight: bool = False,
-            lineMargin: int = 2,
-            lineHeight: int = 2,
-            borderColor: Union[Tuple[int,int,int], pygame.Color] = (180, 180, 180),
-            borderThickness: int = 4,
-            **kwargs
-        ) -> None:
-        self.x = x
-        self.y = y
-        self.callback = callback
-        self.itemFont = itemFont
-        self.fontAntialias = fontAntialias
-        self.background = background
-        self.fontColor = fontColor
-        self.lineColor = lineColor
-        self.borderColor = borderColor
-        self.borderThickness = borderThickness
-        # amount scrolled
-        self.scrollAmt = 0
         if isinstance(items, dict):
-            self.itemKeys, self.itemTitles = zip(*items.items())
+            self.itemKeys, self.itemTitles = (list(col) for col in zip(*items.items())) if items else ([], [])
         else:
             # should be list or tuple of strings
-            self.itemKeys = items[:]
+            self.itemKeys = list(items)
             self.itemTitles = self.itemKeys
-        self.fixedWidth = fixedWidth
-        self.maxWidth = maxWidth
-        self.fixedHeight = fixedHeight
-        self.maxHeight = maxHeight
-        self.lineMargin = lineMargin
-        self.lineHeight = lineHeight
+        if self.focus is not None and self.focus >= len(self.itemKeys):
+            self.focus = None
         self._update()
-        super().__init__(self.x, self.y,
-                self.width, self.height,
-                surface=self.surface, **kwargs)
 
     def scroll(self, amt: int) -> None:
-        self.scrollAmt += amt
-        if self.scrollAmt < 0:
-            self.scrollAmt = 0
-        if self.scrollAmt > 999: pass # TODO
+        self.scrollAmt = min(max(self.scrollAmt + amt, 0), max(self.full_height - self.height, 0))
 
     def _update(self):
-        self.items = list(self.itemFont.render(item, self.fontAntialias, self.fontColor) for item in self.itemTitles)
-        self.widths = list(item.get_width() for item in self.items)
-        self.heights = list(item.get_height() for item in self.items)
+        # measuring is much cheaper than rendering, so every item is measured but none rendered
+        sizes = [self.itemFont.size(item) for item in self.itemTitles] or [(0, self.itemFont.get_height())]
+        self.widths = list(w for w, h in sizes)
+        self.heights = list(h for w, h in sizes)
         # width
         if self.fixedWidth:
             self.width = self.maxWidth if self.maxWidth is not None else max(self.widths)
         else:
             self.width = min(max(self.widths), self.maxWidth)
+        # item offsets: each item is followed by a margin, a separator line and another margin
+        self.spacing = 2 * self.lineMargin + self.lineHeight
+        self.tops = []
+        y = 0
+        for height in self.heights:
+            self.tops.append(y)
+            y += height + self.spacing
         # height
-        all_h = sum(self.heights)
-        extra = (2 * self.lineMargin + self.lineHeight) * (len(self.heights) - 1)
-        self.full_height = all_h + extra
+        self.full_height = y - self.spacing
         if self.fixedHeight:
-            self.height = self.maxHeight if self.maxHeight is not None else all_h + extra
+            self.height = self.maxHeight if self.maxHeight is not None else self.full_height
         else:
             self.height = self.full_height
+        self.scroll(0)
         # bounding rect
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.full_rect = pygame.Rect(self.x, self.y, self.width, self.full_height)
-        # surface and background
-        self.surface = pygame.Surface(self.rect.size)
-        self.full_surface = pygame.Surface(self.full_rect.size)
-        if self.background is None:
-            self.full_surface.fill((1, 1, 1))
-            self.full_surface.set_colorkey((1, 1, 1))
-        else:
-            self.full_surface.fill(self.background)
-        y = 0
-        lastInd = len(self.items) - 1
-        for ind, (height, item) in enumerate(zip(self.heights, self.items)):
-            self.full_surface.blit(item, (0, y))
-            if ind < lastInd:
-                liney = y + height + self.lineMargin + self.lineHeight
-                self.full_surface.fill(self.lineColor, (0, liney, self.width, self.lineHeight))
-            y += height + self.lineMargin * 2 + self.lineHeight
+        # persistent bordered surface; the border is drawn once, the inside by :func:`_compose`
+        self.surface = pygame.Surface((self.width + 2 * self.borderThickness, self.height + 2 * self.borderThickness))
+        self.surface.fill(self.borderColor)
+        self.view = self.surface.subsurface((self.borderThickness, self.borderThickness, self.width, self.height))
+        self.rows = {}
+        self.composed = None
+
+    def _row(self, ind: int) -> pygame.Surface:
+        """ get the rendered title of item ``ind``, rendering it on first use
+        """
+        row = self.rows.get(ind)
+        if row is None:
+            row = self.rows[ind] = render_text(self.itemFont, self.itemTitles[ind], self.fontAntialias, self.fontColor)
+        return row
+
+    def visible_range(self) -> Tuple[int, int]:
+        """ get the ``(first, last + 1)`` indices of the items that are at least partly visible
+        """
+        first = max(bisect.bisect_right(self.tops, self.scrollAmt) - 1, 0)
+        end = bisect.bisect_left(self.tops, self.scrollAmt + self.height)
+        return first, max(end, first)
+
+    def _compose(self) -> None:
+        """ draw the visible rows into :attr:`view` and drop cached rows far out of view
+        """
+        first, end = self.visible_range()
+        self.view.fill(self.background if self.background is not None else (255, 255, 255))
+        for ind in range(first, min(end, len(self.itemTitles))):
+            y = self.tops[ind] - self.scrollAmt
+            self.view.blit(self._row(ind), (0, y))
+            if ind < len(self.itemTitles) - 1:
+                liney = y + self.heights[ind] + self.lineMargin
+                self.view.fill(self.lineColor, (0, liney, self.width, self.lineHeight))
+        if self.focus is not None:
+            focus_rect = pygame.Rect(0, self.tops[self.focus] - self.scrollAmt, self.width, self.heights[self.focus])
+            pygame.draw.rect(self.view, self.focusColor, focus_rect, 2)
+        # keep the rows within the overscan so that scrolling a little does not re-render them
+        keep_first, keep_end = first - self.overscan, end + self.overscan
+        for ind in [ind for ind in self.rows if ind < keep_first or ind >= keep_end]:
+            del self.rows[ind]
+        for ind in range(max(keep_first, 0), min(keep_end, len(self.itemTitles))):
+            self._row(ind)
 
     def get_blitsurface(self) -> pygame.Surface:
-        """ get the blittable surface (self.surface)
+        """ get the blittable surface (self.surface), recomposed only if the view changed
         """
-        # self.surface.fill((255, 0, 0), (0, self.height - 10, self.width, 10))
-        self.surface.blit(self.full_surface, (0, 0), pygame.Rect(0, self.scrollAmt, self.width, self.height))
-        bot = self.full_height - self.scrollAmt
-        if bot < self.height:
-            if self.background is None:
-                # TODO: FIXME
-                self.surface.fill((255, 255, 255), (0, bot, self.width, self.height - bot))
-                # self.surface.fill((1, 1, 1), (0, bot, self.width, self.height - bot))
-                # self.surface.set_colorkey((1, 1, 1))
-            else:
-                self.surface.fill(background, (0, bot, self.width, self.height - bot))
-        newsurf = pygame.Surface((self.width + 2 * self.borderThickness, self.height + 2 * self.borderThickness))
-        newsurf.fill(self.borderColor)
-        newsurf.blit(self.surface, (self.borderThickness, self.borderThickness))
-        return newsurf
+        view = (self.scrollAmt, self.focus)
+        if view != self.composed:
+            self._compose()
+            self.composed = view
+        return self.surface
 
-    def onclick(self, pos):
-        y = pos[1]
-        y -= self.rect.top + self.lineHeight + self.lineMargin // 2 - self.scrollAmt
-        ind = 0
-        tmpy, *heights = self.heights
-        for h in heights:
-            if tmpy > y:
-                break
-            tmpy += h + self.lineMargin * (1 if ind == 0 else 2) + self.lineHeight
-            ind += 1
+    def item_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """ get the index of the item at ``pos`` (in display coordinates), or None if ``pos`` is
+            outside the menu
+        """
+        if not self.rect.collidepoint(pos) or not self.itemKeys:
+            return None
+        # the content is blitted inside the border; a separator belongs to the nearer item
+        y = pos[1] - self.rect.top - self.borderThickness + self.scrollAmt
+        ind = bisect.bisect_right(self.tops, y + self.spacing // 2) - 1
+        return min(max(ind, 0), len(self.itemKeys) - 1)
+
+    def move_focus(self, step: int) -> Optional[int]:
+        """ move the keyboard focus ``step`` items down (or up, if negative), scrolling the
+            focused item into view
+
+        Returns:
+            the index of the focused item, or None if the menu has no items
+        """
+        if not self.itemKeys:
+            self.focus = None
+            return None
+        if self.focus is None:
+            self.focus = 0 if step > 0 else len(self.itemKeys) - 1
+        else:
+            self.focus = min(max(self.focus + step, 0), len(self.itemKeys) - 1)
+        top = self.tops[self.focus]
+        bottom = top + self.heights[self.focus]
+        if top < self.scrollAmt:
+            self.scrollAmt = top
+        elif bottom > self.scrollAmt + self.height:
+            self.scrollAmt = bottom - self.height
+        return self.focus
+
+    def onselect(self, ind: int) -> None:
+        """ select item ``ind`` (as if clicked)
+        """
         self.callback(ind, self.itemKeys[ind])
 
+    def onclick(self, pos):
+        ind = self.item_at(pos)
+        if ind is not None:
+            self.onselect(ind)
+
 
 class Game():
     """ Plethora Base Game for API
@@ -796,17 +1651,43 @@ class Game():
         docstring on how to use this class in a game.
     """
 
-    def __init__(self, size: Tuple[int,int] = (200, 200), fps: int = 20) -> None:
+    def __init__(self, size: Tuple[int,int] = (200, 200), fps: int = 20, tickrate: Optional[int] = None,
+            scale: float = 1, smooth: bool = False) -> None:
         """ :mod:`Game` constructor
+
+        Args:
+            size: size of the game display (its logical resolution)
+            fps: render rate (frames per second)
+            tickrate: fixed rate of :func:`onupdate` (ticks per second); None to not call it
+            scale: show the display this many times larger in the window
+            smooth: scale with :func:`pygame.transform.smoothscale` rather than nearest-neighbor
         """
+        init_pygame()
         self.display = None
         self.fps = fps
+        self.tickrate = tickrate
+        self.scale = scale
+        self.smooth = smooth
+        self.background = set()     # pending :func:`spawn` tasks and :func:`run_in_executor` futures
+        self.compute = set()        # unfinished :func:`submit` futures
+        self.render_at: Optional[float] = None  # :attr:`get_time` time of a scheduled render
+        self.get_time: Callable[[], float] = time.perf_counter  # the runner's clock (see :func:`register`)
         self.rect = pygame.Rect((0, 0), size)
         self.game_exit: Optional[Callable] = None
+        self.exited = False         # set by :func:`onexit`
+        self.exit_event: Optional[pygame.event.Event] = None  # the event :func:`onevents` exited on
 
-    def register(self, display: pygame.Surface, clock: pygame.time.Clock, game_exit: Callable) -> Tuple[int, Tuple[int, int]]:
+    def register(self, display: pygame.Surface, clock: pygame.time.Clock, game_exit: Callable,
+            get_time: Callable[[], float] = time.perf_counter) -> Tuple[int, Tuple[int, int]]:
         """ register a game with :mod:`PlethoraAPI`
+
+        ``get_time`` is the clock :func:`schedule_render` times are on (in seconds); a runner that
+        steps games in virtual time (eg :class:`arcade.plethoraHost.Session`) passes its own.
         """
+        if self.render_at is not None and get_time is not self.get_time:
+            # move a render scheduled before registering onto the runner's clock
+            self.render_at = get_time() + max(0.0, self.render_at - self.get_time())
+        self.get_time = get_time
         self.display = display
         self.clock = clock
         self.game_exit = game_exit
@@ -818,19 +1699,242 @@ class Game():
         print("WARNING: implement Game#onevent")
         return False
 
-    def onrender(self) -> bool:
+    def onevents(self, events: List[pygame.event.Event]) -> bool:
+        """ called once per frame with all of the frame's events; mouse events have ``pos`` in game
+            coordinates and ``abs_pos`` in window coordinates
+
+        Override to handle events in bulk (eg coalescing MOUSEMOTION); by default each event is
+        passed to :func:`onevent` until one makes the game exit, and the rest of the batch goes to
+        the launcher's UI only.
+
+        Returns:
+            True if the game needs to render
+        """
+        dirty = False
+        for event in events:
+            dirty |= bool(self.onevent(event))
+            if self.exited:
+                self.exit_event = event
+                break
+        return dirty
+
+    def onupdate(self, dt: float) -> bool:
+        """ onupdate stub: advance the game by one fixed tick of ``dt`` seconds (``1 / tickrate``)
+
+        Returns:
+            True if the game needs to render
+        """
+        return False
+
+    def onrender(self) -> Union[bool, List[pygame.Rect], Tuple[bool, List[pygame.Rect]]]:
         """ onrender stub
+
+        Return True to render again on the next frame, or report only the changed parts of
+        :attr:`display` as a list of rects or a ``(rerender, rects)`` tuple (see
+        :func:`split_render_result`)
         """
         print("WARNING: implement Game#onrender()")
         return False
 
+    def schedule_render(self, delay: float) -> None:
+        """ have the launcher call :func:`onrender` in ``delay`` seconds even if no event arrives
+
+        Args:
+            delay: seconds from now
+        """
+        self.render_at = self.get_time() + delay
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """ run ``fn(*args)`` in the launcher's compute pool, a process per core shared by all games
+
+        For CPU-bound pure-Python work, which would hold the GIL on a thread. While it is in flight
+        the launcher calls :func:`onrender` every frame, so poll the handle there with ``done()``
+        and ``result()``; it is cancelled if it has not started when the game exits.
+
+        Args:
+            fn: a module-level function
+            *args: picklable arguments
+
+        Returns:
+            the future of the result
+        """
+        future = COMPUTE.submit(fn, *args)
+        self.compute.add(future)
+        return future
+
+    def cancel_compute(self) -> None:
+        """ cancel the :func:`submit` calls that have not started
+        """
+        for future in self.compute:
+            future.cancel()
+        self.compute.clear()
+
+    def spawn(self, coro: Awaitable, callback: Optional[Callable] = None) -> Optional[asyncio.Task]:
+        """ run coroutine ``coro`` alongside the game
+
+        Under the asyncio main loop (``PLETHORA_ASYNC=1``) it runs between frames while the game
+        keeps rendering; otherwise it runs to completion right away. Once it is done, ``callback``
+        is called with its result on the main thread and the game renders. It is cancelled if the
+        game exits first.
+
+        Args:
+            coro: the coroutine
+            callback: called with the coroutine's result
+
+        Returns:
+            the task, or None if the coroutine already ran
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            result = asyncio.run(coro)
+            if callback:
+                callback(result)
+            return None
+        task = loop.create_task(coro)
+        self._track(task, callback)
+        return task
+
+    def run_in_executor(self, fn: Callable, *args, callback: Optional[Callable] = None) -> Optional[asyncio.Future]:
+        """ call ``fn(*args)`` on a worker thread (see :func:`spawn`); for blocking I/O such as
+            saving scores, or work that releases the GIL
+
+        A call that has started is not cancelled when the game exits (so a save still completes),
+        but its callback is dropped.
+
+        Returns:
+            the future, or None if ``fn`` already ran
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            result = fn(*args)
+            if callback:
+                callback(result)
+            return None
+        future = loop.run_in_executor(None, fn, *args)
+        self._track(future, callback)
+        return future
+
+    def _track(self, future: asyncio.Future, callback: Optional[Callable]) -> None:
+        self.background.add(future)
+
+        def done(future):
+            if future not in self.background:
+                # the game exited
+                return
+            self.background.discard(future)
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                print("Error in background work of {}:".format(type(self).__name__))
+                print("-" * 100)
+                traceback.print_exception(type(error), error, error.__traceback__, file=sys.stdout)
+                print("-" * 100)
+                return
+            if callback:
+                callback(future.result())
+            self.schedule_render(0)
+        future.add_done_callback(done)
+
+    def snapshot(self) -> bytes:
+        """ pack the game's state into a save state (see :func:`restore`)
+
+        Games that support save states override this and :func:`restore`.
+
+        Returns:
+            the save state
+
+        Raises:
+            NotImplementedError: if the game does not support save states
+        """
+        raise NotImplementedError("{} does not support save states".format(type(self).__name__))
+
+    def restore(self, data: bytes) -> None:
+        """ return to the state packed by :func:`snapshot`
+
+        Nothing renders the restored state unless the game asks for it, so overrides end with
+        ``self.schedule_render(0)``.
+
+        Args:
+            data: a save state of this game
+
+        Raises:
+            ValueError: if ``data`` is not a save state of this version of the game
+            NotImplementedError: if the game does not support save states
+        """
+        raise NotImplementedError("{} does not support save states".format(type(self).__name__))
+
     def onexit(self, should_exit=True):
         """ Game onexit()
         """
+        for future in self.background:
+            if isinstance(future, asyncio.Task):
+                future.cancel()
+        self.background.clear()
         if should_exit:
+            self.exited = True
             self.game_exit()
 
 
+def can_snapshot(game: Game) -> bool:
+    """ whether a game supports save states (overrides :func:`Game.snapshot` and :func:`Game.restore`)
+    """
+    return type(game).snapshot is not Game.snapshot and type(game).restore is not Game.restore
+
+
+class IsolatedGame(Game):
+    """ stand-in for a game running in a child process (see
+        :class:`arcade.common.cartridge_process.CartridgeProcess`)
+
+    Events are forwarded to the child, which runs the game's ticks and renders at its own pace
+    into a shared-memory framebuffer; :func:`onrender` polls for new frames at the game's fps
+    (through :func:`schedule_render`) and blits them. A game that hangs or crashes only takes its
+    own process down, and closing it kills the process if it does not exit in time.
+    """
+
+    def __init__(self, name: str, seed: Optional[int] = None) -> None:
+        """ :mod:`IsolatedGame` constructor: start cartridge ``name`` in a child process
+
+        Args:
+            name: cartridge name (eg "multiSnake")
+            seed: seed for :mod:`random` in the child
+        """
+        from arcade.common.cartridge_process import CartridgeProcess
+        self.name = name
+        self.process = CartridgeProcess("arcade.games", name, seed)
+        super().__init__(size=self.process.size, fps=self.process.fps, scale=self.process.scale, smooth=self.process.smooth)
+        self.schedule_render(0)
+
+    def onevents(self, events: List[pygame.event.Event]) -> bool:
+        self.process.send_events(events)
+        return False
+
+    def onrender(self) -> List[pygame.Rect]:
+        """ blit the child's newest frame, if any, and poll again in one frame
+        """
+        framed, rects, exit = self.process.poll()
+        if framed:
+            self.display.blit(self.process.frame, (0, 0))
+            self.process.ack()
+        if exit is not None:
+            if exit != "exit":
+                print("Error while running game \"{}\" in a child process: {}".format(self.name, exit))
+            self.onexit()
+        else:
+            self.schedule_render(1 / self.fps)
+        if not framed:
+            return []
+        return [self.display.get_rect()] if rects is None else [pygame.Rect(rect) for rect in rects]
+
+    def onexit(self, should_exit=True):
+        """ stop the child process (killing it if it does not exit in time)
+        """
+        self.process.kill()
+        super().onexit(should_exit)
+
+
 def main():
     """ entry_point for console_script `plethora`
     """
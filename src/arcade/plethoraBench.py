@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+""" Plethora Bench
+
+This module runs any cartridge headlessly (under the SDL dummy video driver) for a number of frames
+and reports how fast the launcher's :func:`PlethoraAPI.run_frame` loop ran, without the
+:func:`pygame.time.Clock.tick` throttle.
+
+Usage::
+
+    $ plethora-bench tetris chess --frames 600
+    $ plethora-bench bomberman --profile  # also print the mean/max of each frame phase
+    $ plethora-bench --replay ~/recordings/tetris-20240101-120000.json  # see PLETHORA_RECORD
+    $ plethora-bench connect4 --frames 300 --events drops.json
+    $ plethora-bench tetris chess --metrics after.json  # compare with plethora-perfdiff
+
+Events file::
+
+    # a JSON list of events (positions in window coordinates); each is fed to the launcher at the
+    # start of frame ``frame``. ``type``, ``key``, ``mod`` and ``button`` may name pygame
+    # constants (eg "K_SPACE"), which are looked up in :mod:`pygame`.
+    [
+        {"frame": 0, "type": "MOUSEBUTTONDOWN", "pos": [120, 240], "button": 1},
+        {"frame": 1, "type": "MOUSEBUTTONUP", "pos": [120, 240], "button": 1},
+        {"frame": 5, "type": "KEYDOWN", "key": "K_RIGHT"}
+    ]
+"""
+
+import os
+
+# must be set before pygame is initialized by :mod:`plethoraAPI`
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from typing import Dict, List, Optional
+import argparse
+import json
+import pygame  # type: ignore[import]
+import sys
+import time
+import traceback
+
+from arcade import plethoraAPI
+from arcade.common.frame_metrics import MetricsLog
+from arcade.common.frame_profiler import FrameProfiler
+from arcade.common.input_recorder import events_by_frame, load_recording
+
+
+class UnthrottledClock():
+    """ stand-in for :class:`pygame.time.Clock` that measures but never sleeps
+
+    Games receive the launcher's clock in :func:`Game.register` and some call :func:`tick` from
+    :func:`Game.onrender`; this keeps them from throttling the benchmark.
+    """
+
+    def __init__(self) -> None:
+        self.last = time.perf_counter()
+        self.rawtime = 0
+
+    def tick(self, framerate: int = 0) -> int:
+        now = time.perf_counter()
+        self.rawtime = int((now - self.last) * 1000)
+        self.last = now
+        return self.rawtime
+
+    tick_busy_loop = tick
+
+    def get_time(self) -> int:
+        return self.rawtime
+
+    def get_rawtime(self) -> int:
+        return self.rawtime
+
+    def get_fps(self) -> float:
+        return 1000 / self.rawtime if self.rawtime else 0.0
+
+
+def load_events(path: str) -> Dict[int, List[pygame.event.Event]]:
+    """ load an events file (see the module docstring)
+
+    Args:
+        path: path to the JSON events file
+
+    Returns:
+        events keyed by the frame they are fed on
+    """
+    with open(path) as events_file:
+        return events_by_frame(json.load(events_file))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """ nearest-rank percentile of ``samples``
+
+    Args:
+        samples: sorted samples
+        pct: percentile in [0, 100]
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(samples))))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def run_bench(api: "plethoraAPI.PlethoraAPI", name: str, frames: int,
+        events: Optional[Dict[int, List[pygame.event.Event]]] = None) -> Optional[dict]:
+    """ launch cartridge ``name`` and time ``frames`` frames of the launcher's loop
+
+    Args:
+        api: the launcher to drive (its main loop is not started)
+        name: cartridge name (eg "tetris")
+        frames: number of frames to run
+        events: events keyed by the frame they are fed on
+
+    Returns:
+        the frame time statistics, or None if the cartridge could not be launched
+    """
+    if events is None:
+        events = {}
+    api.launch_game(name)
+    if not api.game:
+        return None
+    if api.profiler:
+        api.profiler = FrameProfiler(window=frames)
+    times = []
+    start = time.perf_counter()
+    for frame in range(frames):
+        frame_start = time.perf_counter()
+        for event in events.get(frame, ()):
+            pygame.event.post(event)
+        api.run_frame()
+        times.append(time.perf_counter() - frame_start)
+        if not api.game:
+            # game exited itself (eg an event closed it)
+            break
+    total = time.perf_counter() - start
+    if api.game:
+        api.game.onexit()
+    api.onrender()
+    times.sort()
+    stats = {
+        "game": name,
+        "frames": len(times),
+        "seconds": total,
+        "fps": len(times) / total if total else 0.0,
+        "p50_ms": percentile(times, 50) * 1000,
+        "p99_ms": percentile(times, 99) * 1000,
+    }
+    if api.profiler:
+        stats["phases"] = api.profiler.stats()
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """ entry_point for console_script `plethora-bench`
+    """
+    parser = argparse.ArgumentParser(prog="plethora-bench", description="run cartridges headlessly and report frame times")
+    parser.add_argument("games", nargs="*", help="cartridge names (eg tetris chess)")
+    parser.add_argument("--frames", type=int, default=300, help="frames to run per cartridge (default: %(default)s)")
+    parser.add_argument("--events", help="JSON events file to feed (see module docstring)")
+    parser.add_argument("--profile", action="store_true", help="also report the time spent in each frame phase")
+    parser.add_argument("--replay", help="replay a recorded session (see PLETHORA_RECORD) instead")
+    parser.add_argument("--metrics", help="write per-cartridge frame metrics to this .json or .csv file")
+    args = parser.parse_args(argv)
+    if not args.games and not args.replay:
+        parser.error("give at least one game or --replay")
+
+    events = load_events(args.events) if args.events else {}
+    api = plethoraAPI.PlethoraAPI()
+    api.clock = UnthrottledClock()
+    api.idle = False
+    if args.profile:
+        api.profiler = FrameProfiler()
+    if args.metrics:
+        api.metrics = MetricsLog()
+        api.metrics_path = args.metrics
+    api.refill = True
+    api.dirty = True
+    failed = False
+    print("{:<12} {:>7} {:>10} {:>9} {:>9}".format("game", "frames", "fps", "p50 ms", "p99 ms"))
+    if args.replay:
+        recording = load_recording(args.replay)
+        runs = [(recording.game, recording.frames, recording.events, recording)]
+    else:
+        runs = [(name, args.frames, events, None) for name in args.games]
+    for name, frames, events, replay in runs:
+        api.replay = replay
+        try:
+            stats = run_bench(api, name, frames, events)
+        except Exception as error:
+            # the cartridge crashed mid-run; report it and go on with the next one
+            print("{:<12} failed: {}".format(name, error))
+            print("-" * 100)
+            traceback.print_exc(file=sys.stdout)
+            print("-" * 100)
+            if api.game:
+                api.handle_game_exit()
+            failed = True
+            continue
+        if stats is None:
+            print("{:<12} failed to launch".format(name))
+            failed = True
+            continue
+        print("{game:<12} {frames:>7} {fps:>10.1f} {p50_ms:>9.3f} {p99_ms:>9.3f}".format(**stats))
+        for phase, phase_stats in stats.get("phases", {}).items():
+            print("    {:<14} mean {mean_ms:>8.3f} ms   max {max_ms:>8.3f} ms".format(phase, **phase_stats))
+    api.save_metrics()
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    """ main if plethoraBench.py called directly
+    """
+    sys.exit(main())
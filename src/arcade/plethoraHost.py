@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+
+""" Plethora Host
+
+This module runs many game sessions at once without a window: each :class:`Session` owns a
+:class:`plethoraAPI.Game`, an offscreen surface, a :class:`VirtualClock` and an event queue, and a
+:class:`Host` steps its sessions round-robin. Sessions can be spread over worker processes with
+:func:`run_pool`. This is meant for bot evaluation and load testing; nothing is displayed.
+
+Usage::
+
+    $ plethora-host connect4:200 tetris:100 --steps 1000
+    $ plethora-host chess:400 --steps 500 --workers 8 --random-input
+    $ plethora-host tetris:50 --random-input --metrics tetris.json  # see plethora-perfdiff
+
+Scripting::
+
+    from arcade import plethoraHost
+    host = plethoraHost.Host()
+    session = host.add("connect4")
+    session.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(50, 50), button=1))
+    host.run(steps=100)
+
+Sessions render at each game's logical resolution (see ``scale`` in :class:`plethoraAPI.Game`);
+nothing is scaled up.
+"""
+
+import os
+
+# must be set before pygame is initialized by :mod:`plethoraAPI`
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import collections
+import importlib
+import pygame  # type: ignore[import]
+import random
+import sys
+import time
+import traceback
+
+from arcade import plethoraAPI
+from arcade.common.frame_metrics import FrameMetrics, MetricsLog
+
+
+class VirtualClock():
+    """ stand-in for :class:`pygame.time.Clock` whose time only moves when the session steps
+
+    Every :func:`tick` advances the clock by exactly one frame (``1 / fps``), so a session runs at
+    its nominal rate in virtual time no matter how fast the host steps it.
+    """
+
+    def __init__(self, fps: int) -> None:
+        self.fps = fps
+        self.now = 0.0
+        self.rawtime = 0
+
+    def tick(self, framerate: int = 0) -> int:
+        self.rawtime = int(1000 / (framerate or self.fps))
+        self.now += self.rawtime / 1000
+        return self.rawtime
+
+    tick_busy_loop = tick
+
+    def get_time(self) -> int:
+        return self.rawtime
+
+    def get_rawtime(self) -> int:
+        return self.rawtime
+
+    def get_fps(self) -> float:
+        return float(self.fps)
+
+    def perf_counter(self) -> float:
+        """ virtual seconds since the session started, in place of :func:`time.perf_counter`
+        """
+        return self.now
+
+
+class Session():
+    """ a single running game with its own surface, clock and event queue
+    """
+
+    def __init__(self, name: str, game: "plethoraAPI.Game", bot: Optional[Callable[["Session"], None]] = None,
+            metrics: Optional[FrameMetrics] = None) -> None:
+        """ :mod:`Session` constructor
+
+        Args:
+            name: cartridge name (eg "connect4")
+            game: the game (not yet registered)
+            bot: called with the session before every step to :func:`post` its input
+            metrics: record the wall time, input latency and memory growth of every step here
+        """
+        self.name = name
+        self.game = game
+        self.bot = bot
+        self.metrics = metrics
+        self.surface = pygame.Surface(game.rect.size)
+        self.clock = VirtualClock(game.fps)
+        self.events = collections.deque()
+        self.dirty = True
+        self.exited = False
+        self.error: Optional[str] = None    # why the game failed, if it raised
+        self.steps = 0
+        self.game.register(self.surface, self.clock, self.on_exit, self.clock.perf_counter)
+
+    def on_exit(self) -> None:
+        self.exited = True
+
+    def post(self, event: pygame.event.Event) -> None:
+        """ queue an event (positions in game coordinates) for the next step
+        """
+        self.events.append(event)
+
+    def step(self) -> None:
+        """ run one frame: deliver queued events, run the fixed ticks of one frame of virtual time
+            and render if the game is dirty
+
+        If the game raises, the session ends with the exception in :attr:`error`, so one broken
+        game does not stop the other sessions of its :class:`Host`.
+        """
+        try:
+            self.run_frame()
+        except Exception as error:
+            self.error = traceback.format_exception_only(type(error), error)[-1].strip()
+            self.exited = True
+
+    def run_frame(self) -> None:
+        """ the frame of :func:`step`, without catching what the game raises
+        """
+        metrics = self.metrics
+        if metrics:
+            metrics.begin_frame()
+        if self.bot:
+            self.bot(self)
+        if self.events:
+            events = list(self.events)
+            self.events.clear()
+            self.dirty |= bool(self.game.onevents(events))
+            if metrics:
+                metrics.input()
+        if self.exited:
+            return
+        if self.game.tickrate:
+            # whole ticks that fit in the virtual time up to the end of this frame
+            ticks = int((self.clock.now + 1 / self.game.fps) * self.game.tickrate) - int(self.clock.now * self.game.tickrate)
+            for _ in range(ticks):
+                self.dirty |= bool(self.game.onupdate(1 / self.game.tickrate))
+        if self.game.render_at is not None and self.clock.perf_counter() >= self.game.render_at:
+            self.game.render_at = None
+            self.dirty = True
+        rendered = self.dirty and not self.exited
+        if rendered:
+            self.dirty, _ = plethoraAPI.split_render_result(self.game.onrender())
+        if metrics:
+            metrics.end_frame(rendered)
+        self.clock.tick()
+        self.steps += 1
+
+
+class Host():
+    """ runs many :class:`Session` objects in this process
+    """
+
+    def __init__(self, metrics: Optional[MetricsLog] = None) -> None:
+        """ :mod:`Host` constructor
+
+        Args:
+            metrics: record per-step frame metrics of every session, per cartridge, here
+        """
+        # games may convert() surfaces, which needs a display mode
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+        self.sessions: List[Session] = []
+        self.finished: List[Session] = []   # sessions whose game exited (or failed, see :attr:`Session.error`)
+        self.cartridges = {}
+        self.metrics = metrics
+
+    def add(self, name: str, bot: Optional[Callable[[Session], None]] = None) -> Session:
+        """ start a new session of cartridge ``name``
+
+        Args:
+            name: cartridge name (eg "connect4")
+            bot: see :class:`Session`
+        """
+        if name not in self.cartridges:
+            self.cartridges[name] = importlib.import_module("arcade.games.{}".format(name))
+        session = Session(name, self.cartridges[name].insert_cartridge(), bot, self.metrics.get(name) if self.metrics else None)
+        self.sessions.append(session)
+        return session
+
+    def step(self) -> int:
+        """ step every live session once (round-robin), dropping sessions whose game exited or failed
+
+        Returns:
+            the number of sessions stepped
+        """
+        stepped = 0
+        for session in self.sessions:
+            if not session.exited:
+                session.step()
+                stepped += 1
+        if stepped < len(self.sessions):
+            self.finished.extend(session for session in self.sessions if session.exited)
+            self.sessions = [session for session in self.sessions if not session.exited]
+        return stepped
+
+    def run(self, steps: int) -> dict:
+        """ step all sessions ``steps`` times
+
+        Returns:
+            ``{"steps": total session steps, "seconds": wall time, "per_game": {name: steps},
+            "failed": {name: [error of each failed session]}}``
+        """
+        start = time.perf_counter()
+        for _ in range(steps):
+            if not self.step():
+                break
+        seconds = time.perf_counter() - start
+        per_game = collections.Counter()
+        failed: Dict[str, List[str]] = {}
+        for session in self.sessions + self.finished:
+            per_game[session.name] += session.steps
+            if session.error is not None:
+                failed.setdefault(session.name, []).append(session.error)
+        return {"steps": sum(per_game.values()), "seconds": seconds, "per_game": dict(per_game), "failed": failed}
+
+
+def random_bot(seed: int = 0) -> Callable[[Session], None]:
+    """ a bot that presses random arrow keys and clicks random spots, for load testing
+
+    Args:
+        seed: seed for the bot's own :class:`random.Random`
+    """
+    rng = random.Random(seed)
+    keys = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_RETURN)
+
+    def bot(session: Session) -> None:
+        roll = rng.random()
+        if roll < 0.05:
+            key = rng.choice(keys)
+            session.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+            session.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+        elif roll < 0.10:
+            pos = (rng.randrange(session.game.rect.width), rng.randrange(session.game.rect.height))
+            session.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+            session.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1))
+    return bot
+
+
+def run_sessions(specs: List[Tuple[str, int]], steps: int, random_input: bool = False, seed: int = 0,
+        metrics: bool = False) -> dict:
+    """ run sessions in a new :class:`Host` (the worker function of :func:`run_pool`)
+
+    Args:
+        specs: ``(cartridge name, number of sessions)`` pairs
+        steps: steps to run each session
+        random_input: drive each session with :func:`random_bot`
+        seed: seed for :mod:`random` and the bots
+        metrics: also return the sessions' frame metrics as ``"metrics"`` (a :class:`MetricsLog`)
+    """
+    random.seed(seed)
+    host = Host(MetricsLog() if metrics else None)
+    for name, count in specs:
+        for i in range(count):
+            host.add(name, random_bot(seed + len(host.sessions)) if random_input else None)
+    result = host.run(steps)
+    if metrics:
+        result["metrics"] = host.metrics
+    return result
+
+
+def run_pool(specs: List[Tuple[str, int]], steps: int, workers: int, random_input: bool = False,
+        metrics: bool = False) -> dict:
+    """ split the sessions evenly over ``workers`` processes and run them
+
+    Returns:
+        the combined results of :func:`run_sessions`, with ``seconds`` the wall time of the pool
+    """
+    shares: List[Dict[str, int]] = [collections.Counter() for _ in range(workers)]
+    for name, count in specs:
+        for i in range(count):
+            shares[i % workers][name] += 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(run_sessions, list(share.items()), steps, random_input, worker, metrics)
+                   for worker, share in enumerate(shares) if share]
+        results = [future.result() for future in futures]
+    per_game = collections.Counter()
+    failed: Dict[str, List[str]] = {}
+    merged = MetricsLog()
+    for result in results:
+        per_game.update(result["per_game"])
+        for name, errors in result["failed"].items():
+            failed.setdefault(name, []).extend(errors)
+        if metrics:
+            merged.merge(result["metrics"])
+    combined = {"steps": sum(per_game.values()), "seconds": time.perf_counter() - start, "per_game": dict(per_game),
+            "failed": failed}
+    if metrics:
+        combined["metrics"] = merged
+    return combined
+
+
+def parse_spec(spec: str) -> Tuple[str, int]:
+    name, _, count = spec.partition(":")
+    return name, int(count or 1)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """ entry_point for console_script `plethora-host`
+    """
+    parser = argparse.ArgumentParser(prog="plethora-host", description="run many headless game sessions and report steps/sec")
+    parser.add_argument("sessions", nargs="+", type=parse_spec, help="NAME[:COUNT] (eg connect4:200)")
+    parser.add_argument("--steps", type=int, default=300, help="steps (frames) to run each session (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: %(default)s, in this process)")
+    parser.add_argument("--random-input", action="store_true", help="feed each session random key presses and clicks")
+    parser.add_argument("--metrics", help="write per-cartridge frame metrics to this .json or .csv file")
+    args = parser.parse_args(argv)
+
+    metrics = bool(args.metrics)
+    if args.workers > 1:
+        result = run_pool(args.sessions, args.steps, args.workers, args.random_input, metrics)
+    else:
+        result = run_sessions(args.sessions, args.steps, args.random_input, metrics=metrics)
+    if metrics:
+        result["metrics"].write(args.metrics)
+    seconds = result["seconds"]
+    for name, steps in sorted(result["per_game"].items()):
+        print("{:<12} {:>10} steps".format(name, steps))
+    print("{} steps in {:.2f} s: {:.1f} steps/sec".format(result["steps"], seconds, result["steps"] / seconds if seconds else 0.0))
+    for name, errors in sorted(result["failed"].items()):
+        for error, count in collections.Counter(errors).most_common():
+            print("{:<12} {:>10} session(s) failed: {}".format(name, count, error))
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    """ main if plethoraHost.py called directly
+    """
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+""" Plethora Importtime
+
+This module checks what importing the launcher, the tools and every cartridge costs. Each module is
+imported in a fresh interpreter under ``python -X importtime``; it fails the check if its
+cumulative import time is over budget or if importing it initialized pygame, its display or its
+fonts (fonts and surfaces belong behind accessors that create them on first use, so that the
+launcher only pays for what it shows and tools can import games without touching SDL).
+
+Usage::
+
+    $ plethora-importtime                      # the launcher, the tools and every cartridge
+    $ plethora-importtime --budget 150         # milliseconds per module
+    $ plethora-importtime arcade.games.tetris.tetris
+"""
+
+from typing import List, Optional, Tuple
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).parent
+
+# modules checked besides the cartridges
+TOOLS = (
+    "arcade.plethoraAPI",
+    "arcade.plethoraBench",
+    "arcade.plethoraHost",
+    "arcade.plethoraPerfdiff",
+    "arcade.plethoraSuite",
+)
+
+# default budget of a module's cumulative import time (milliseconds)
+DEFAULT_BUDGET_MS = 250.0
+
+# run in the child: import the module, then report whether SDL was initialized. Uses __import__,
+# since -X importtime does not list the module itself when it is imported by importlib.import_module
+PROBE = """
+import sys
+__import__(sys.argv[1])
+pygame = sys.modules.get("pygame")
+if pygame is not None:
+    touched = [name for name, init in (("pygame", pygame.get_init), ("display", pygame.display.get_init),
+            ("font", pygame.font.get_init)) if init()]
+    print(",".join(touched))
+"""
+
+
+def cartridge_modules() -> List[str]:
+    """ every cartridge package and the modules in it
+
+    Returns:
+        module names (eg "arcade.games.tetris", "arcade.games.tetris.tetris")
+    """
+    modules = []
+    for package in sorted((ROOT/"games").iterdir()):
+        if not (package/"__init__.py").is_file():
+            continue
+        name = "arcade.games.{}".format(package.name)
+        modules.append(name)
+        modules.extend("{}.{}".format(name, path.stem) for path in sorted(package.glob("*.py")) if path.stem != "__init__")
+    return modules
+
+
+def parse_importtime(stderr: str, module: str) -> Optional[int]:
+    """ find a module's cumulative import time in ``python -X importtime`` output
+
+    Args:
+        stderr: the interpreter's stderr
+        module: module name
+
+    Returns:
+        cumulative import time in microseconds, or None if the module is not listed
+    """
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    return None
+
+
+def measure(module: str) -> Tuple[Optional[float], List[str], Optional[str]]:
+    """ import ``module`` in a fresh interpreter
+
+    Returns:
+        ``(milliseconds, SDL subsystems initialized, error)``; error is the last line of the
+        traceback if the import failed
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE, module],
+            capture_output=True, text=True, env=env)
+    if proc.returncode:
+        lines = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        return None, [], lines[-1] if lines else "exit code {}".format(proc.returncode)
+    micros = parse_importtime(proc.stderr, module)
+    touched = [name for name in proc.stdout.strip().split(",") if name]
+    return (micros / 1000 if micros is not None else None), touched, None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """ entry_point for console_script `plethora-importtime`
+    """
+    parser = argparse.ArgumentParser(prog="plethora-importtime", description="check the import time of the launcher, tools and cartridges")
+    parser.add_argument("modules", nargs="*", help="modules to check (default: the launcher, the tools and every cartridge)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS, help="milliseconds allowed per module (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or list(TOOLS) + cartridge_modules()
+    failed = 0
+    print("{:<44} {:>9}  {}".format("module", "ms", "status"))
+    for module in modules:
+        ms, touched, error = measure(module)
+        if error is not None:
+            status = "FAILED to import: {}".format(error)
+        elif touched:
+            status = "FAILED: initialized {}".format(", ".join(touched))
+        elif ms is not None and ms > args.budget:
+            status = "FAILED: over the {:g} ms budget".format(args.budget)
+        else:
+            status = "ok"
+        if status != "ok":
+            failed += 1
+        print("{:<44} {:>9}  {}".format(module, "{:.1f}".format(ms) if ms is not None else "-", status))
+    print("{} of {} modules failed".format(failed, len(modules)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    """ main if plethoraImporttime.py called directly
+    """
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+""" Plethora Perfdiff
+
+This module compares two frame metrics exports (see ``PLETHORA_METRICS``, ``plethora-bench
+--metrics`` and ``plethora-host --metrics``) and reports the cartridges whose frame time, input
+latency or net memory growth per frame regressed. It exits with status 1 if any did, so it can gate a change.
+
+Usage::
+
+    $ plethora-bench tetris chess --metrics before.json
+    $ # ... change something ...
+    $ plethora-bench tetris chess --metrics after.json
+    $ plethora-perfdiff before.json after.json --threshold 10
+"""
+
+from typing import Dict, List, Optional, Tuple
+import argparse
+import sys
+
+from arcade.common.frame_metrics import load_metrics
+
+# (metric, field) pairs compared, with the absolute change below which a difference is noise
+COMPARED = (
+    ("frame_ms", "mean", 0.1),
+    ("frame_ms", "p50", 0.1),
+    ("frame_ms", "p95", 0.25),
+    ("frame_ms", "p99", 0.5),
+    ("latency_ms", "p95", 1.0),
+    ("net_blocks", "mean", 5.0),
+)
+
+
+def compare(old: Dict[str, dict], new: Dict[str, dict], threshold_pct: float = 10.0,
+        min_delta: float = 1.0, compared: Tuple[Tuple[str, str, float], ...] = COMPARED
+        ) -> List[Tuple[str, str, float, float, float, bool]]:
+    """ compare the metrics of the cartridges in both exports
+
+    Args:
+        old: baseline summaries keyed by cartridge name (see :func:`load_metrics`)
+        new: summaries to check, keyed by cartridge name
+        threshold_pct: a value regresses if it grew by more than this percentage...
+        min_delta: ...and by more than this multiple of the metric's noise floor (see :data:`COMPARED`)
+        compared: the ``(metric, field, noise floor)`` values to compare; each metric's summary
+            needs a "count"
+
+    Returns:
+        ``(game, "metric.field", old, new, change %, regressed)`` for every compared value
+    """
+    rows = []
+    for game in sorted(set(old) & set(new)):
+        for metric, field, noise in compared:
+            before = old[game][metric][field]
+            after = new[game][metric][field]
+            if not old[game][metric]["count"] or not new[game][metric]["count"]:
+                # eg no input was delivered, so there is no latency to compare
+                continue
+            change = (after - before) / abs(before) * 100 if before else (0.0 if after == before else float("inf"))
+            regressed = change > threshold_pct and after - before > noise * min_delta
+            rows.append((game, "{}.{}".format(metric, field), before, after, change, regressed))
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """ entry_point for console_script `plethora-perfdiff`
+    """
+    parser = argparse.ArgumentParser(prog="plethora-perfdiff", description="compare two frame metrics exports and flag regressions")
+    parser.add_argument("old", help="baseline metrics (.json or .csv)")
+    parser.add_argument("new", help="metrics to check (.json or .csv)")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent growth that counts as a regression (default: %(default)s)")
+    parser.add_argument("--min-delta", type=float, default=1.0,
+            help="ignore changes smaller than this multiple of each metric's noise floor (default: %(default)s)")
+    parser.add_argument("--all", action="store_true", help="also list the values that did not regress")
+    args = parser.parse_args(argv)
+
+    try:
+        old = load_metrics(args.old)
+        new = load_metrics(args.new)
+    except (OSError, ValueError, KeyError) as error:
+        print("Error: could not load metrics: {}".format(error))
+        return 2
+    for game in sorted(set(old) ^ set(new)):
+        print("{:<12} only in {}".format(game, args.old if game in old else args.new))
+    rows = compare(old, new, args.threshold, args.min_delta)
+    regressions = [row for row in rows if row[5]]
+    print("{:<12} {:<18} {:>11} {:>11} {:>9}".format("game", "metric", "old", "new", "change"))
+    for game, name, before, after, change, regressed in rows:
+        if regressed or args.all:
+            print("{:<12} {:<18} {:>11.3f} {:>11.3f} {:>+8.1f}%{}".format(game, name, before, after, change, "  REGRESSED" if regressed else ""))
+    print("{} regression(s) in {} compared values".format(len(regressions), len(rows)))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    """ main if plethoraPerfdiff.py called directly
+    """
+    sys.exit(main())
@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+
+""" Plethora Suite
+
+This module benchmarks the logic hot paths of the cartridges (move validation, victory checks,
+collision tests, hand evaluation, map queries) and a headless run of every cartridge's frames, and
+writes the results as JSON. Given a baseline written by an earlier run, it prints how much each
+benchmark got faster or slower and exits with status 1 if any regressed (see
+:func:`arcade.plethoraPerfdiff.compare`).
+
+Each micro benchmark times batches of calls (sized so that a batch runs for ``--min-time``) and
+summarizes the per-call time over ``--repeat`` batches; calls that change their fixture (eg
+making a move) are timed one at a time, after resetting it. Frame benchmarks run
+:func:`arcade.plethoraBench.run_bench` with :mod:`random` seeded, pressing a random arrow key every
+few frames, and summarize the time of each frame. Every time is in microseconds. Compare with a baseline taken on the same machine, with it
+otherwise idle.
+
+Usage::
+
+    $ plethora-suite --output baseline.json     # every benchmark; keep the results as a baseline
+    $ # ... change something ...
+    $ plethora-suite --baseline baseline.json   # compare, exit with status 1 on a regression
+    $ plethora-suite tetris poker.*             # only the tetris and poker hot paths and frames
+    $ plethora-suite --list
+"""
+
+import os
+
+# must be set before pygame is initialized by :mod:`plethoraAPI`
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import fnmatch
+import gc
+import json
+import platform
+import pygame  # type: ignore[import]
+import random
+import sys
+import time
+import traceback
+
+from arcade import plethoraAPI
+from arcade.common.frame_metrics import Distribution, MetricsLog
+from arcade.plethoraBench import UnthrottledClock, run_bench
+from arcade.plethoraPerfdiff import compare
+
+RESULTS_VERSION = 1
+
+# (metric, field, noise floor in microseconds) compared against a baseline; the fastest batch is
+# the least disturbed by the rest of the machine, the median shows slowdowns that only some calls hit
+COMPARED = (
+    ("time_us", "min", 0.05),
+    ("time_us", "p50", 0.05),
+)
+
+# batches timed per micro benchmark
+DEFAULT_REPEAT = 25
+
+# seconds each batch of a micro benchmark runs for, at least
+DEFAULT_MIN_TIME = 0.005
+
+# frames run per cartridge
+DEFAULT_FRAMES = 300
+
+# seed of :mod:`random` for fixtures and frame benchmarks
+SEED = 0
+
+# frames between the arrow key presses fed to frame benchmarks, so that games have to render
+INPUT_INTERVAL = 10
+
+
+class Case():
+    """ a micro benchmark: a call (or a fixed series of ``calls`` calls) of a hot path
+
+    Args:
+        name: "cartridge.function" (eg "tetris.have_collision")
+        fn: runs the calls
+        calls: calls made by one run of ``fn``; times are reported per call
+        setup: resets the fixture before every run of ``fn``, for calls that change it; the reset
+            is not timed
+    """
+
+    def __init__(self, name: str, fn: Callable[[], object], calls: int = 1,
+            setup: Optional[Callable[[], None]] = None) -> None:
+        self.name = name
+        self.fn = fn
+        self.calls = calls
+        self.setup = setup
+
+
+def chess_cases() -> List[Case]:
+    """ benchmarks of :mod:`arcade.games.chess.chess` """
+    from arcade.games.chess.chess import BaseBoard, Board, Color, Square
+
+    # the Italian game, light to move
+    san = "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R"
+    board = Board()
+    board.set_san(san)
+    # castling, captures, quiet moves, a blocked move, a piece of the wrong color and an empty square
+    moves = ((Square.E1, Square.G1), (Square.C4, Square.F7), (Square.F3, Square.E5), (Square.D2, Square.D4),
+            (Square.B1, Square.C3), (Square.D1, Square.D3), (Square.C6, Square.D4), (Square.E3, Square.E4))
+
+    def valid_move():
+        for fsq, tsq in moves:
+            board.valid_move(fsq, tsq)
+
+    fixture = {}
+
+    def reset_board():
+        fixture["board"] = Board()
+        fixture["board"].set_san(san)
+
+    baseb = BaseBoard()
+    baseb.set_san(san)
+    return [
+        Case("chess.Board.valid_move", valid_move, calls=len(moves)),
+        Case("chess.Board.move", lambda: fixture["board"].move(Square.F3, Square.E5), setup=reset_board),
+        Case("chess.BaseBoard.incheck", lambda: (baseb.incheck(Color.LIGHT), baseb.incheck(Color.DARK)), calls=2),
+        Case("chess.BaseBoard.set_san", lambda: baseb.set_san(san)),
+        Case("chess.BaseBoard.get_san", baseb.get_san),
+    ]
+
+
+def connect4_cases() -> List[Case]:
+    """ benchmarks of :mod:`arcade.games.connect4.connect4` """
+    from arcade.games.connect4.connect4 import Grid, GREEN, RED, WHITE
+
+    rng = random.Random(SEED)
+    grid = Grid(7, 6, WHITE, RED, GREEN)
+    for col in range(grid.width):
+        for row in range(rng.randrange(grid.height + 1)):
+            grid.grid[col][row] = rng.choice((1, 2))
+    cells = [(col, row) for col in range(grid.width) for row in range(grid.height) if grid.grid[col][row]]
+
+    def check_victor():
+        for col, row in cells:
+            grid.checkVictor(col, row)
+
+    return [Case("connect4.Grid.checkVictor", check_victor, calls=len(cells))]
+
+
+def tetris_cases() -> List[Case]:
+    """ benchmarks of :mod:`arcade.games.tetris.tetris` """
+    from arcade.games.tetris import tetris
+
+    rng = random.Random(SEED)
+    width, height = tetris.PLAY_SIZE
+    names = [ttype.name for ttype in tetris.TetrominoType]
+    # rubble with a hole in each line, with two full lines in it for :func:`_delete_lines_from` to clear
+    stack = [["-"] * width for _ in range(height - 8)]
+    for y in range(6):
+        line = [rng.choice(names) for _ in range(width)]
+        line[rng.randrange(width)] = "-"
+        stack.append(line)
+    stack.insert(height - 5, [rng.choice(names) for _ in range(width)])
+    stack.insert(height - 3, [rng.choice(names) for _ in range(width)])
+    stack = stack[-height:]
+    # every rotation of every tetromino against every 4x4 window of the stack
+    masks = []
+    for ttype in tetris.TetrominoType:
+        mask = ttype.mask
+        for _ in range(4):
+            masks.append(mask)
+            mask = list("".join(line) for line in zip(*reversed(mask)))
+    windows = [list(line[x:x + 4] for line in stack[y:y + 4]) for y in range(height - 8, height - 3) for x in range(width - 3)]
+
+    def have_collision():
+        for mask in masks:
+            for window in windows:
+                tetris.have_collision(mask, window)
+
+    game = tetris.Game()
+    game.register(pygame.Surface(game.rect.size), UnthrottledClock(), lambda: None)
+
+    def reset_stack():
+        game.filled = list(list(line) for line in stack)
+
+    return [
+        Case("tetris.have_collision", have_collision, calls=len(masks) * len(windows)),
+        Case("tetris.Game._delete_lines_from", lambda: game._delete_lines_from(height - 8), setup=reset_stack),
+    ]
+
+
+def poker_cases() -> List[Case]:
+    """ benchmarks of :mod:`arcade.games.poker.poker` """
+    from arcade.games.poker import poker
+
+    rng = random.Random(SEED)
+    player = poker.Game.playerOrNpc
+    card = player.card
+    ranks = [str(number) for number in range(2, 11)] + ["jack", "queen", "king", "ace"]
+    suits = ("clubs", "spades", "hearts", "diamonds")
+    deck = [card(rank, suit) for rank in ranks for suit in suits]
+    # random deals, and made hands that reach every branch of the evaluation
+    deals = [rng.sample(deck, 7) for _ in range(12)]
+    deals.append([card(rank, "hearts") for rank in ("10", "jack", "queen", "king", "ace")] + [card("2", "clubs"), card("3", "spades")])
+    deals.append([card(rank, suit) for rank, suit in (("5", "clubs"), ("6", "spades"), ("7", "hearts"), ("8", "clubs"),
+            ("9", "diamonds"), ("9", "clubs"), ("king", "spades"))])
+    deals.append([card(rank, suit) for rank, suit in (("queen", "clubs"), ("queen", "spades"), ("queen", "hearts"),
+            ("4", "clubs"), ("4", "diamonds"), ("2", "clubs"), ("7", "spades"))])
+    hands = [(player("bench", hand=deal[:2], money=1, isNPC=True), deal[2:]) for deal in deals]
+
+    def evaluate(method):
+        def run():
+            for hand, shared in hands:
+                method(hand, shared)
+        return run
+
+    return [
+        Case("poker.getHandValue", evaluate(player.getHandValue), calls=len(hands)),
+        Case("poker.getPairValue", evaluate(player.getPairValue), calls=len(hands)),
+        Case("poker.getStraightOrFlushValue", evaluate(player.getStraightOrFlushValue), calls=len(hands)),
+    ]
+
+
+def blackjack_cases() -> List[Case]:
+    """ benchmarks of :mod:`arcade.games.blackjack.blackjack` """
+    from arcade.games.blackjack import blackjack
+
+    game = blackjack.Game()
+    card = blackjack.Game.playerOrDealer.card
+    # blackjack, a pair, a hand under 21, a bust and busts saved by aces
+    hands = [
+        [card("ace", "spades"), card("king", "hearts")],
+        [card("8", "clubs"), card("8", "diamonds")],
+        [card("2", "clubs"), card("5", "hearts"), card("9", "spades")],
+        [card("queen", "clubs"), card("6", "hearts"), card("9", "diamonds")],
+        [card("ace", "clubs"), card("7", "hearts"), card("9", "spades")],
+        [card("ace", "clubs"), card("ace", "hearts"), card("9", "spades"), card("5", "diamonds")],
+        [11, 10, 5],
+    ]
+
+    def check_card_total():
+        for hand in hands:
+            game.checkCardTotal(hand)
+
+    return [Case("blackjack.Game.checkCardTotal", check_card_total, calls=len(hands))]
+
+
+def bomberman_cases() -> List[Case]:
+    """ benchmarks of :mod:`arcade.games.bomberman.bomberman_map` """
+    from arcade.games.bomberman import bomberman
+
+    game = bomberman.Bomberman()
+    world_map = game.map
+    # the tiles bombs are dropped on: the spawn points and the center
+    points = [world_map.map[x][y].rect.center for x, y in world_map.spawn_points]
+    points.append(world_map.get_center_tile().rect.center)
+    tiles = [world_map.coordinates_to_tile(point) for point in points]
+
+    def coordinates_to_tile():
+        for point in points:
+            world_map.coordinates_to_tile(point)
+
+    def get_around():
+        for tile in tiles:
+            world_map.get_around(tile, distance=4)
+
+    return [
+        Case("bomberman.Map.coordinates_to_tile", coordinates_to_tile, calls=len(points)),
+        Case("bomberman.Map.get_around", get_around, calls=len(tiles)),
+    ]
+
+
+# the micro benchmarks of each cartridge
+CARTRIDGE_CASES = (
+    ("chess", chess_cases),
+    ("connect4", connect4_cases),
+    ("tetris", tetris_cases),
+    ("poker", poker_cases),
+    ("blackjack", blackjack_cases),
+    ("bomberman", bomberman_cases),
+)
+
+
+def selected(name: str, patterns: List[str]) -> bool:
+    """ whether benchmark ``name`` is selected by ``patterns``
+
+    Args:
+        name: benchmark name (eg "tetris.have_collision" or "frame.tetris")
+        patterns: :mod:`fnmatch` patterns of names, or parts of names (eg "tetris"); none selects
+            everything
+    """
+    if not patterns:
+        return True
+    parts = name.split(".")
+    return any(fnmatch.fnmatchcase(name, pattern) or pattern in parts for pattern in patterns)
+
+
+def time_case(case: Case, repeat: int, min_time: float) -> Tuple[Distribution, int]:
+    """ time a micro benchmark
+
+    Args:
+        case: the benchmark
+        repeat: batches to time
+        min_time: seconds a batch runs for, at least
+
+    Returns:
+        the microseconds per call of each batch, and the runs of :attr:`Case.fn` per batch
+    """
+    clock = time.perf_counter
+
+    def batch(loops):
+        if case.setup is None:
+            start = clock()
+            for _ in range(loops):
+                case.fn()
+            return clock() - start
+        total = 0.0
+        for _ in range(loops):
+            case.setup()
+            start = clock()
+            case.fn()
+            total += clock() - start
+        return total
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # double the batch until it runs long enough to time (also warms up the fixture)
+        loops = 1
+        while batch(loops) < min_time and loops < 1 << 20:
+            loops *= 2
+        times = Distribution(edges=())
+        for _ in range(repeat):
+            times.add(batch(loops) / (loops * case.calls) * 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return times, loops
+
+
+def run_micro(patterns: List[str], repeat: int, min_time: float) -> Tuple[Dict[str, dict], List[str]]:
+    """ build the fixtures of the selected micro benchmarks and time them
+
+    Returns:
+        the results keyed by benchmark name, and the names of the benchmarks that failed
+        ("cartridge.*" if the cartridge's fixtures could not be built)
+    """
+    results = {}
+    failed = []
+    for cartridge, build in CARTRIDGE_CASES:
+        random.seed(SEED)
+        try:
+            cases = [case for case in build() if selected(case.name, patterns)]
+        except Exception as error:
+            if selected(cartridge, patterns):
+                print("{:<36} failed to set up: {}".format(cartridge + ".*", error))
+                print("-" * 100)
+                traceback.print_exc(file=sys.stdout)
+                print("-" * 100)
+                failed.append(cartridge + ".*")
+            continue
+        for case in cases:
+            try:
+                times, loops = time_case(case, repeat, min_time)
+            except Exception as error:
+                print("{:<36} failed: {}".format(case.name, error))
+                failed.append(case.name)
+                continue
+            summary = times.summary(histogram=False)
+            summary["min"] = min(times.samples, default=0.0)
+            results[case.name] = {"kind": "micro", "calls": case.calls * loops, "time_us": summary}
+            print_result(case.name, results[case.name])
+    return results, failed
+
+
+def frame_events(frames: int) -> Dict[int, List[pygame.event.Event]]:
+    """ the arrow key presses fed to a frame benchmark (the same on every run)
+
+    Args:
+        frames: frames the benchmark runs
+
+    Returns:
+        events keyed by the frame they are fed on
+    """
+    rng = random.Random(SEED)
+    keys = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
+    events = {}
+    for frame in range(0, frames, INPUT_INTERVAL):
+        key = rng.choice(keys)
+        events[frame] = [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0),
+                pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0)]
+    return events
+
+
+def run_frames(api: "plethoraAPI.PlethoraAPI", patterns: List[str], frames: int) -> Tuple[Dict[str, dict], List[str]]:
+    """ run every selected cartridge headlessly (see :func:`arcade.plethoraBench.run_bench`)
+
+    Returns:
+        the results keyed by benchmark name ("frame.{cartridge}"), and the names of the benchmarks
+        that failed
+    """
+    results = {}
+    failed = []
+    for name in sorted(api.games):
+        bench = "frame.{}".format(name)
+        if not selected(bench, patterns):
+            continue
+        random.seed(SEED)
+        api.metrics = MetricsLog()
+        try:
+            stats = run_bench(api, name, frames, frame_events(frames))
+        except Exception as error:
+            print("{:<36} failed: {}".format(bench, error))
+            print("-" * 100)
+            traceback.print_exc(file=sys.stdout)
+            print("-" * 100)
+            if api.game:
+                api.handle_game_exit()
+            failed.append(bench)
+            continue
+        if stats is None:
+            print("{:<36} failed to launch".format(bench))
+            failed.append(bench)
+            continue
+        frame_ms = api.metrics.get(name).frame_ms
+        summary = frame_ms.summary(histogram=False)
+        summary["min"] = min(frame_ms.samples, default=0.0)
+        times = dict((field, value * 1000 if field != "count" else value) for field, value in summary.items())
+        results[bench] = {"kind": "frame", "calls": stats["frames"], "time_us": times}
+        print_result(bench, results[bench])
+    api.metrics = None
+    return results, failed
+
+
+def print_result(name: str, result: dict) -> None:
+    """ print a row of the results table """
+    print("{:<36} {min:>12.3f} {p50:>12.3f} {p95:>12.3f}".format(name, **result["time_us"]))
+
+
+def write_results(path: str, results: Dict[str, dict]) -> None:
+    """ write benchmark results (and what they ran on) as JSON """
+    with open(path, "w") as results_file:
+        json.dump({
+            "version": RESULTS_VERSION,
+            "created": time.time(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "results": results,
+        }, results_file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    """ load benchmark results written by :func:`write_results`
+
+    Raises:
+        ValueError: if the file is not a results file of a supported version
+    """
+    with open(path) as results_file:
+        data = json.load(results_file)
+    if not isinstance(data, dict) or data.get("version") != RESULTS_VERSION:
+        raise ValueError("\"{}\" is not a version {} benchmark results file".format(path, RESULTS_VERSION))
+    return data["results"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """ entry_point for console_script `plethora-suite`
+    """
+    parser = argparse.ArgumentParser(prog="plethora-suite", description="benchmark cartridge hot paths and frames, and compare with a baseline")
+    parser.add_argument("patterns", nargs="*", help="benchmarks to run, as names, glob patterns or parts of names (default: all)")
+    parser.add_argument("--output", help="write the results to this JSON file (eg to keep as a baseline)")
+    parser.add_argument("--baseline", help="compare with the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent slowdown that counts as a regression (default: %(default)s)")
+    parser.add_argument("--min-delta", type=float, default=1.0,
+            help="ignore changes smaller than this multiple of each value's noise floor (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="batches timed per micro benchmark (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="seconds per batch, at least (default: %(default)s)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames run per cartridge (default: %(default)s)")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    try:
+        baseline = load_results(args.baseline) if args.baseline else None
+    except (OSError, ValueError, KeyError) as error:
+        print("Error: could not load baseline: {}".format(error))
+        return 2
+
+    api = plethoraAPI.PlethoraAPI()
+    api.clock = UnthrottledClock()
+    api.idle = False
+    api.refill = True
+    api.dirty = True
+    if args.list:
+        for cartridge, build in CARTRIDGE_CASES:
+            try:
+                names = [case.name for case in build()]
+            except Exception as error:
+                names = ["{}.* (failed to set up: {})".format(cartridge, error)]
+            print("\n".join(name for name in names if selected(name.split(" ")[0], args.patterns)))
+        print("\n".join(name for name in ("frame.{}".format(game) for game in sorted(api.games)) if selected(name, args.patterns)))
+        pygame.quit()
+        return 0
+
+    print("{:<36} {:>12} {:>12} {:>12}".format("benchmark", "min us", "p50 us", "p95 us"))
+    results, failed = run_micro(args.patterns, args.repeat, args.min_time)
+    frame_results, frames_failed = run_frames(api, args.patterns, args.frames)
+    results.update(frame_results)
+    failed.extend(frames_failed)
+    pygame.quit()
+
+    if args.output:
+        try:
+            write_results(args.output, results)
+        except OSError as error:
+            print("Error: could not save results \"{}\": {}".format(args.output, error))
+            return 2
+
+    regressions = []
+    if baseline is not None:
+        baseline = dict((name, result) for name, result in baseline.items() if selected(name, args.patterns))
+        for name in sorted(set(baseline) ^ set(results)):
+            print("{:<36} only in {}".format(name, args.baseline if name in baseline else "this run"))
+        rows = compare(baseline, results, args.threshold, args.min_delta, COMPARED)
+        regressions = [row for row in rows if row[5]]
+        print()
+        print("{:<36} {:<12} {:>12} {:>12} {:>9}".format("benchmark", "value", "baseline", "now", "change"))
+        for name, value, before, after, change, regressed in rows:
+            if regressed:
+                verdict = "  SLOWER"
+            elif -change > args.threshold:
+                verdict = "  faster"
+            else:
+                verdict = ""
+            print("{:<36} {:<12} {:>12.3f} {:>12.3f} {:>+8.1f}%{}".format(name, value, before, after, change, verdict))
+        print("{} regression(s) in {} compared values".format(len(regressions), len(rows)))
+    if failed:
+        print("could not run: {}".format(", ".join(failed)))
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    """ main if plethoraSuite.py called directly
+    """
+    sys.exit(main())